@@ -18,6 +18,10 @@ class symtable(object):
     def __init__(self):
         self._t = dict()  # name -> _symdata dictionary
 
+    def reset(self):
+        """ removes all the symbols, for interpreting another program """
+        self._t = dict()
+
     def get(self, numt, sym):
         """ retrieves the value of sym, ensuring its type is numt """
         return self._get_sd(numt, sym).value
@@ -208,7 +212,7 @@ def error(err_inst_num, err_inst_code, msg):
 
 
 def codelines_generator(code_string):
-    """Generates the next instruction as (inum, i) from the raw code_string.
+    """Generates the next instruction as (inum, (opname, args)) from the raw code_string.
     Accepts a new instruction number."""
 
     # First, remove comments (anything after a '#' or between /* */)
@@ -221,15 +225,49 @@ def codelines_generator(code_string):
                          (?:[a-zA-Z-0-9._]+[ \t]*)  # non-capturing arg group
                          {0,3}                      # 0 - 3 arguments
                          """
-    # Note: codelines start at 0, while instruction numbering starts at 1
     codelines = re.findall(code_only_re, code_string, flags=re.VERBOSE)
+    tokenized = [line.split() for line in codelines]
+    return instructions_generator([(tokens[0], tokens[1:]) for tokens in tokenized])
+
+
+class quad_store_rows(object):
+    """ the instructions of a QUADStore (see src/ir.py) as (opname, args),
+    read from the store's rows - no QUAD text is formatted or parsed, and
+    the operands keep their types (names are strings, constants numbers) """
+
+    def __init__(self, quad):
+        self._quad = quad
+        # every row is decoded once, when it is first executed
+        self._rows = [None] * len(quad)
+
+    def __getitem__(self, index):
+        # raises IndexError past the last row, like a list of codelines
+        row = self._rows[index]
+        if row is None:
+            opcode, dest, op1, op2 = self._quad.get_instruction(index)
+            row = self._rows[index] = (
+                opcode.name,
+                tuple(operand for operand in (dest, op1, op2) if operand != ""))
+        return row
+
+
+def instruction_text(instruction):
+    opname, args = instruction
+    return " ".join([opname] + [str(arg) for arg in args])
+
+
+def instructions_generator(instructions):
+    """Generates the next instruction as (inum, (opname, args)) from a
+    sequence of instructions. Accepts a new instruction number."""
+
+    # Note: instructions start at 0, while instruction numbering starts at 1
     ip = 1
     try:
         while True:
-            line = codelines[ip - 1]
+            instruction = instructions[ip - 1]
             if trace:
-                print("Executing `%s`" % line)
-            jmp_ip = yield (ip, line)
+                print("Executing `%s`" % instruction_text(instruction))
+            jmp_ip = yield (ip, instruction)
             prev_ip = ip  # save previous ip only after a successful execution
             if jmp_ip:
                 yield None  # dummy yield for send() result
@@ -238,7 +276,7 @@ def codelines_generator(code_string):
                 ip = ip + 1
     except IndexError:
         if jmp_ip:
-            error(prev_ip, codelines[prev_ip - 1],
+            error(prev_ip, instruction_text(instructions[prev_ip - 1]),
                   "can't jump to " + str(ip))
         else:
             error(ip, "(none)", "missing HALT command")
@@ -277,17 +315,23 @@ HALT
 def interpret():
     try:
         global cur_inst_num
-        for cur_inst_num, codeline in codelines:
-            tokens = codeline.split()
-
-            opname = tokens[0]
-            globals()[opname](*tokens[1:])
+        for cur_inst_num, (opname, args) in codelines:
+            globals()[opname](*args)
 
     except TypeError as e:
-        error(cur_inst_num, codeline, str(e))
+        error(cur_inst_num, instruction_text((opname, args)), str(e))
         raise
     except KeyError as e:
-        error(cur_inst_num, codeline, "bad opcode: '%s'" % opname)
+        error(cur_inst_num, instruction_text((opname, args)),
+              "bad opcode: '%s'" % opname)
+
+
+def interpret_quad_store(quad):
+    """ interprets a QUADStore of the CPL compiler straight from its rows """
+    global codelines
+    symtable.reset()
+    codelines = instructions_generator(quad_store_rows(quad))
+    interpret()
 
 
 if __name__ == "__main__":
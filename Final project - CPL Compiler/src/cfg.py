@@ -0,0 +1,136 @@
+# File: cfg.py
+# Control flow graph of the CPL IR.
+# Author: Nir Moshe.
+"""
+Splits the IR - a flat list of `QUADInstruction`s and `Label`s - into basic blocks, and connects the blocks by their
+control flow. The blocks keep the order of the program, so the IR which `ControlFlowGraph.get_ir` returns has the
+same fall-through between the blocks, and can be passed to `ir.get_quad`.
+
+Building the graph and linearizing it are linear in the size of the IR.
+
+Author: Nir Moshe.
+"""
+from ir import Label, UndefinedLabelError
+
+__author__ = "Nir Moshe"
+
+
+class BasicBlock(object):
+    """
+    Straight line code: only the block's labels are jump targets, and only its last instruction may jump.
+    """
+    __slots__ = ("labels", "instructions", "successors", "predecessors")
+
+    def __init__(self):
+        self.labels = []
+        self.instructions = []
+        # The blocks which the control can pass to. A conditional jump's target comes before its fall-through block.
+        self.successors = []
+        self.predecessors = []
+
+    @property
+    def last_instruction(self):
+        return self.instructions[-1] if self.instructions else None
+
+    def __str__(self):
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(label.name for label in self.labels))
+
+
+class ControlFlowGraph(object):
+    """
+    The basic blocks of the IR, in program order (the first block is the entry), and a mapping from the labels' names
+    to their blocks.
+    """
+    __slots__ = ("blocks", "blocks_by_label")
+
+    def __init__(self, ir):
+        """
+        :param ir: Iterable of IR instructions and `Label`s (see `ir.get_program_ir`).
+
+        :raises UndefinedLabelError: If a jump's label is not in the IR (like `ir.get_quad`).
+        """
+        self.blocks = []
+        self.blocks_by_label = {}
+        self.build_blocks(ir)
+        self.build_edges()
+
+    def build_blocks(self, ir):
+        # A block starts at its labels, or at the first instruction after a jump or a halt.
+        block = None
+        for inst in ir:
+            if type(inst) == Label:
+                if block is None or block.instructions:
+                    block = BasicBlock()
+                    self.blocks.append(block)
+
+                block.labels.append(inst)
+                self.blocks_by_label[inst.name] = block
+            else:
+                if block is None:
+                    block = BasicBlock()
+                    self.blocks.append(block)
+
+                block.instructions.append(inst)
+                if inst.operator in ("jump", "conditional_jump", "halt"):
+                    block = None
+
+    def build_edges(self):
+        undefined_labels = set()
+        for index, block in enumerate(self.blocks):
+            last_instruction = block.last_instruction
+            if last_instruction is not None and last_instruction.operator in ("jump", "conditional_jump"):
+                target = self.blocks_by_label.get(last_instruction.dest)
+                if target is None:
+                    undefined_labels.add(last_instruction.dest)
+                else:
+                    self.add_edge(block, target)
+
+            falls_through = last_instruction is None or last_instruction.operator not in ("jump", "halt")
+            if falls_through and index + 1 < len(self.blocks):
+                self.add_edge(block, self.blocks[index + 1])
+
+        if undefined_labels:
+            raise UndefinedLabelError(list(undefined_labels))
+
+    @staticmethod
+    def add_edge(block, successor):
+        # A block has two successors at most, so the check is O(1).
+        if successor not in block.successors:
+            block.successors.append(successor)
+            successor.predecessors.append(block)
+
+    def remove_unreachable_blocks(self):
+        """
+        Removes the blocks which can't be reached from the entry block.
+
+        :return: The number of removed blocks.
+        """
+        if not self.blocks:
+            return 0
+
+        reachable = {self.blocks[0]}
+        stack = [self.blocks[0]]
+        while stack:
+            for successor in stack.pop().successors:
+                if successor not in reachable:
+                    reachable.add(successor)
+                    stack.append(successor)
+
+        removed_blocks = len(self.blocks) - len(reachable)
+        self.blocks = [block for block in self.blocks if block in reachable]
+        self.blocks_by_label = {name: block for name, block in self.blocks_by_label.items() if block in reachable}
+        for block in self.blocks:
+            block.predecessors = [predecessor for predecessor in block.predecessors if predecessor in reachable]
+
+        return removed_blocks
+
+    def get_ir(self):
+        """
+        :return: List of the IR instructions and `Label`s of the blocks, in order.
+        """
+        ir = []
+        for block in self.blocks:
+            ir += block.labels
+            ir += block.instructions
+
+        return ir
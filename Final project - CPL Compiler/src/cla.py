@@ -16,14 +16,21 @@ Author: Nir Moshe.
 
 __author__ = "Nir Moshe"
 
-from collections import namedtuple
+from array import array
+from bisect import bisect_left
+from collections import deque, namedtuple
+import logging
 import os
 import re
+import threading
+import time
 
-from lark import Lark, UnexpectedToken
-from lark.lexer import Lexer, Token as LarkToken
-
+import cpl_lark
+from cpl_lark import CPL_GRAMMAR_FILENAME, Token as LarkToken, UnexpectedToken
 from exceptions import CPLCompoundException, CPLException
+from lexer_generator import build_dfa, get_specification_hash, load_dfa_module, NOT_ACCEPTING
+
+logger = logging.getLogger(__name__)
 
 Token = namedtuple("Token", ["name", "lexeme", "attribute"])
 ContextToken = namedtuple("ContextToken", ["token", "line_number"])
@@ -37,22 +44,139 @@ class TokenPattern:
 
         :param pattern: String which represents a regular expression.
         """
-        self.pattern = re.compile(r"^({regex_pattern}).*".format(regex_pattern=pattern), re.MULTILINE)
+        self.regex_pattern = pattern
+        self.pattern = re.compile(pattern)
 
-    def match(self, string):
+    def match(self, string, position=0):
         """
         :param string: String to check if matching against the pattern.
+        :param position: Index in `string` where the match should start. The string isn't copied.
 
         :return: If match return the lexeme otherwise, returns None.
         """
-        match = self.pattern.match(string)
+        match = self.pattern.match(string, position)
         if match:
-            return match.group(1)
+            return match.group()
 
         return None
 
 
+class MasterTokenPattern:
+    def __init__(self, token_patterns):
+        """
+        Combines a list of (`TokenPattern`, handler) pairs into a single regular expression, so the text is scanned
+        once per token instead of once per rule.
+
+        Every rule is wrapped by an optional lookahead with its own named group: "(?:(?=(?P<rule_i>pattern_i))|)".
+        Matching the combined pattern never consumes characters, it only records the lexeme of every rule which
+        matches at the current position. This keeps the semantics of the rules list exactly - the longest lexeme wins
+        and on a tie the first rule wins.
+
+        :param token_patterns: List of (`TokenPattern`, handler) pairs, ordered by priority.
+        """
+        self.pattern = re.compile(
+            "".join(
+                r"(?:(?=(?P<rule_{index}>{regex_pattern}))|)".format(
+                    index=index,
+                    regex_pattern=token_pattern.regex_pattern
+                )
+                for index, (token_pattern, _) in enumerate(token_patterns)
+            )
+        )
+        self.groups = [self.pattern.groupindex["rule_%d" % index] for index in range(len(token_patterns))]
+        self.handlers = [handler for _, handler in token_patterns]
+
+    def match(self, string, position=0):
+        """
+        :param string: String to match against all the rules.
+        :param position: Index in `string` where the match should start. The string isn't copied.
+
+        :return: Pair of (lexeme, handler) of the winning rule. If no rule matches, returns ("", None).
+        """
+        regs = self.pattern.match(string, position).regs
+        # Every matched rule starts at `position` and unmatched rules have the span (-1, -1), so the maximal span is the
+        # longest match, and `index` returns the first rule with that span.
+        spans = tuple(map(regs.__getitem__, self.groups))
+        longest_match = max(spans)
+        if longest_match[0] < 0:
+            return "", None
+
+        return string[position:longest_match[1]], self.handlers[spans.index(longest_match)]
+
+
+class DFATokenPattern:
+    # Specification hash -> `DFA`. The DFA of the same rules is built only once.
+    _dfa_cache = {}
+
+    def __init__(self, token_patterns):
+        """
+        Matches all the rules with a single table driven DFA (see lexer_generator.py), so the work per character
+        doesn't depend on the number of rules. The DFA is loaded from the generated cla_dfa.py module. If the module
+        is missing, or it was generated from different rules, the DFA is built in memory.
+
+        :param token_patterns: List of (`TokenPattern`, handler) pairs, ordered by priority.
+        """
+        self.dfa = self.get_dfa([token_pattern.regex_pattern for token_pattern, _ in token_patterns])
+        self.handlers = [handler for _, handler in token_patterns]
+
+    @classmethod
+    def get_dfa(cls, patterns):
+        specification_hash = get_specification_hash(patterns)
+        if specification_hash not in cls._dfa_cache:
+            try:
+                import cla_dfa
+                dfa = load_dfa_module(cla_dfa)
+            except (ImportError, AttributeError):
+                dfa = None
+
+            if dfa is None or dfa.specification_hash != specification_hash:
+                dfa = build_dfa(patterns)
+
+            cls._dfa_cache[specification_hash] = dfa
+
+        return cls._dfa_cache[specification_hash]
+
+    def match(self, string, position=0):
+        """
+        :param string: String to match against all the rules.
+        :param position: Index in `string` where the match should start. The string isn't copied.
+
+        :return: Pair of (lexeme, handler) of the winning rule. If no rule matches, returns ("", None).
+        """
+        end, rule = self.dfa.match(string, position)
+        if rule == NOT_ACCEPTING:
+            return "", None
+
+        return string[position:end], self.handlers[rule]
+
+
+class EngineMismatchError(Exception):
+    """Raised when the tokenizer engines don't agree on the tokens of the same input."""
+    def __init__(self, index, token, expected_token):
+        Exception.__init__(
+            self,
+            "Tokenizer engines mismatch at token #%d: %s != %s" % (index, token, expected_token)
+        )
+        self.index = index
+        self.token = token
+        self.expected_token = expected_token
+
+
+# The keywords are scanned by the ID rule and then looked up in this table (static_cast isn't a valid ID, so it has its
+# own rule).
+KEYWORDS = {
+    keyword: Token(name=keyword.upper(), lexeme=keyword, attribute="")
+    for keyword in (
+        "break", "case", "continue", "default", "else", "float", "if", "int", "read", "switch", "while", "write"
+    )
+}
+
+
 def id_handler(matching_string):
+    keyword = KEYWORDS.get(matching_string)
+    if keyword:
+        return keyword
+
     return Token(name="ID", lexeme=matching_string, attribute=matching_string)
 
 
@@ -68,9 +192,91 @@ def operator_handler(matching_string):
     return Token(name="RELOP", lexeme=matching_string, attribute=matching_string)
 
 
+class NewlineIndex:
+    def __init__(self, raw_content, lazy=False):
+        """
+        The offsets of all the newlines in a source, so the line and the column of any offset can be found by a binary
+        search. The index is built once per source, and the tokens store only offsets.
+
+        :param raw_content: String which represents the CPL program.
+        :param lazy: If True, the newlines are indexed on demand - only up to the largest offset looked up so far.
+        """
+        self.raw_content = raw_content
+        self.newlines = array("L")
+        # The newlines before this offset are indexed.
+        self.indexed_offset = 0
+        if not lazy:
+            self.__index_newlines(len(raw_content))
+
+    def __index_newlines(self, offset):
+        """
+        Indexes the newlines before `offset`.
+        """
+        if offset <= self.indexed_offset:
+            return
+
+        index = self.raw_content.find("\n", self.indexed_offset, offset)
+        while index != -1:
+            self.newlines.append(index)
+            index = self.raw_content.find("\n", index + 1, offset)
+
+        self.indexed_offset = offset
+
+    def get_line(self, offset):
+        """
+        :return: The line number (starts from 1) of the character at `offset`.
+        """
+        self.__index_newlines(offset)
+        return bisect_left(self.newlines, offset) + 1
+
+    def get_column(self, offset):
+        """
+        :return: The column number (starts from 1) of the character at `offset`.
+        """
+        line = self.get_line(offset)
+        line_start = self.newlines[line - 2] + 1 if line > 1 else 0
+        return offset - line_start + 1
+
+
+def constant_handler(name, lexeme, attribute=""):
+    """
+    :return: Handler for rules with a single lexeme. The handler always returns the same (immutable) Token.
+    """
+    token = Token(name=name, lexeme=lexeme, attribute=attribute)
+    return lambda _: token
+
+
+def get_attribute(name, lexeme):
+    """
+    :return: The attribute of a token with the given name and lexeme (the same attribute the rule's handler returns).
+    """
+    if name in ("ID", "RELOP", "ADDOP", "MULOP"):
+        return lexeme
+    elif name == "NUM":
+        return float(lexeme) if "." in lexeme else int(lexeme)
+
+    return ""
+
+
 class CPLTokenizer:
     NOP_TOKEN_NAME = "IGNORE"
     INVALID_TOKEN_NAME = "INVALID_TOKEN"
+    UNTERMINATED_COMMENT_TOKEN_NAME = "UNTERMINATED_COMMENT"
+    # The tokens which are reported as errors (see `InvalidTokenError`) instead of passed to the parser.
+    ERROR_TOKEN_NAMES = (INVALID_TOKEN_NAME, UNTERMINATED_COMMENT_TOKEN_NAME)
+
+    COMMENT_START = "/*"
+    COMMENT_END = "*/"
+
+    # The original engine - tries every rule and calls its handler, then picks the longest match.
+    LEGACY_ENGINE = "legacy"
+    # Single combined regular expression for all the rules (see `MasterTokenPattern`).
+    MASTER_ENGINE = "master"
+    # Table driven DFA which was generated from the rules (see `DFATokenPattern`).
+    DFA_ENGINE = "dfa"
+
+    # The static_cast brackets are recognized by looking at most 4 tokens behind (including the current one).
+    LOOKBEHIND_SIZE = 4
 
     @classmethod
     def nop_handler(cls, matching_string):
@@ -80,59 +286,50 @@ class CPLTokenizer:
     def invalid_token_handler(cls, matching_string):
         return Token(cls.INVALID_TOKEN_NAME, matching_string, "")
 
-    def newline_handler(self):
-        def handler(matching_string):
-            self.line_number += matching_string.count("\n")
-            return self.nop_handler(matching_string)
-
-        return handler
-
-    def __init__(self, raw_content):
+    def __init__(self, raw_content, engine=DFA_ENGINE, compare_engines=False, lazy=False):
         """
-        :param raw_content:
+        :param raw_content: String which represents the CPL program.
+        :param engine: The scanning engine - `MASTER_ENGINE`, `DFA_ENGINE` or `LEGACY_ENGINE`.
+        :param compare_engines: If True, tokenize the input with the legacy engine too and verify both engines
+            produce the same tokens.
+        :param lazy: If True, the input is tokenized on demand - every call to `get_next_token` scans just enough of
+            the input to return the next token (and indexes its newlines), and the tokens aren't stored.
+
+        :raises EngineMismatchError if `compare_engines` is set and the engines don't agree.
+        :raises ValueError if both `compare_engines` and `lazy` are set.
         """
+        if compare_engines and lazy:
+            raise ValueError("Can't compare the engines of a lazy tokenizer.")
+
         self.raw_content = raw_content
+        self.engine = engine
+        self.lazy = lazy
         self.cursor = 0
-        self.line_number = 1
+        self.newline_index = NewlineIndex(raw_content, lazy)
         self.token_patterns = [
-            # Comments - Should be non-greedy regex.
-            (TokenPattern(r"/\*([^*]|[\r\n]|(\*+([^*/]|[\r\n])))*\*+/"), self.newline_handler()),
-
-            # Keywords
-            (TokenPattern("break"), lambda _: Token(name="BREAK", lexeme="break", attribute="")),
-            (TokenPattern("case"), lambda _: Token(name="CASE", lexeme="case", attribute="")),
-            (TokenPattern("continue"), lambda _: Token(name="CONTINUE", lexeme="continue", attribute="")),
-            (TokenPattern("default"), lambda _: Token(name="DEFAULT", lexeme="default", attribute="")),
-            (TokenPattern("else"), lambda _: Token(name="ELSE", lexeme="else", attribute="")),
-            (TokenPattern("float"), lambda _: Token(name="FLOAT", lexeme="float", attribute="")),
-            (TokenPattern("if"), lambda _: Token(name="IF", lexeme="if", attribute="")),
-            (TokenPattern("int"), lambda _: Token(name="INT", lexeme="int", attribute="")),
-            (TokenPattern("read"), lambda _: Token(name="READ", lexeme="read", attribute="")),
-            (TokenPattern("static_cast"), lambda _: Token(name="STATIC_CAST", lexeme="static_cast", attribute="")),
-            (TokenPattern("switch"), lambda _: Token(name="SWITCH", lexeme="switch", attribute="")),
-            (TokenPattern("while"), lambda _: Token(name="WHILE", lexeme="while", attribute="")),
-            (TokenPattern("write"), lambda _: Token(name="WRITE", lexeme="write", attribute="")),
+            # Keywords (the rest of the keywords are recognized by the ID rule, see `KEYWORDS`).
+            (TokenPattern("static_cast"), constant_handler("STATIC_CAST", "static_cast")),
 
             # Symbols
-            (TokenPattern(r"\("), lambda _: Token(name="LEFT_PARENTHESIS", lexeme="(", attribute="")),
-            (TokenPattern(r"\)"), lambda _: Token(name="RIGHT_PARENTHESIS", lexeme=")", attribute="")),
-            (TokenPattern("{"), lambda _: Token(name="LEFT_CURLY_BRACKETS", lexeme="{", attribute="")),
-            (TokenPattern("}"), lambda _: Token(name="RIGHT_CURLY_BRACKETS", lexeme="}", attribute="")),
-            (TokenPattern(","), lambda _: Token(name="COMMA", lexeme=",", attribute="")),
-            (TokenPattern(r"\."), lambda _: Token(name="POINT", lexeme=".", attribute="")),
-            (TokenPattern(":"), lambda _: Token(name="COLON", lexeme=":", attribute="")),
-            (TokenPattern(";"), lambda _: Token(name="SEMICOLON", lexeme=";", attribute="")),
-            (TokenPattern("="), lambda _: Token(name="EQUAL_SIGN", lexeme="=", attribute="")),
+            (TokenPattern(r"\("), constant_handler("LEFT_PARENTHESIS", "(")),
+            (TokenPattern(r"\)"), constant_handler("RIGHT_PARENTHESIS", ")")),
+            (TokenPattern("{"), constant_handler("LEFT_CURLY_BRACKETS", "{")),
+            (TokenPattern("}"), constant_handler("RIGHT_CURLY_BRACKETS", "}")),
+            (TokenPattern(","), constant_handler("COMMA", ",")),
+            (TokenPattern(r"\."), constant_handler("POINT", ".")),
+            (TokenPattern(":"), constant_handler("COLON", ":")),
+            (TokenPattern(";"), constant_handler("SEMICOLON", ";")),
+            (TokenPattern("="), constant_handler("EQUAL_SIGN", "=")),
 
             # Operators
             (TokenPattern(r"==|!=|>=|<=|<|>"), operator_handler),
-            (TokenPattern(r"\+"), lambda _: Token(name="ADDOP", lexeme="+", attribute="+")),
-            (TokenPattern("-"), lambda _: Token(name="ADDOP", lexeme="-", attribute="-")),
-            (TokenPattern(r"\*"), lambda _: Token(name="MULOP", lexeme="*", attribute="*")),
-            (TokenPattern("/"), lambda _: Token(name="MULOP", lexeme="/", attribute="/")),
-            (TokenPattern(r"\|\|"), lambda _: Token(name="OR", lexeme="||", attribute="")),
-            (TokenPattern("&&"), lambda _: Token(name="AND", lexeme="&&", attribute="")),
-            (TokenPattern("!"), lambda _: Token(name="NOT", lexeme="!", attribute="")),
+            (TokenPattern(r"\+"), constant_handler("ADDOP", "+", "+")),
+            (TokenPattern("-"), constant_handler("ADDOP", "-", "-")),
+            (TokenPattern(r"\*"), constant_handler("MULOP", "*", "*")),
+            (TokenPattern("/"), constant_handler("MULOP", "/", "/")),
+            (TokenPattern(r"\|\|"), constant_handler("OR", "||")),
+            (TokenPattern("&&"), constant_handler("AND", "&&")),
+            (TokenPattern("!"), constant_handler("NOT", "!")),
 
             # ID (Must start with letter, no more than 9 characters).
             (TokenPattern(r"[a-zA-Z][a-zA-Z0-9]{0,8}"), id_handler),
@@ -141,46 +338,113 @@ class CPLTokenizer:
             (TokenPattern(r"\d+\.\d*"), float_handler),
             (TokenPattern(r"\d+"), int_handler),
 
-            # New line and whitespace
-            (TokenPattern(r"\n"), self.newline_handler()),
-            (TokenPattern(r"\s"), CPLTokenizer.nop_handler),
+            # New lines and whitespaces - a whole run of them is a single lexeme.
+            (TokenPattern(r"\s+"), CPLTokenizer.nop_handler),
 
             # Else (or the invalid symbols)...
             (TokenPattern(r".{1}"), CPLTokenizer.invalid_token_handler),
             (TokenPattern(r"[a-zA-Z][a-zA-Z0-9]{8,}"), CPLTokenizer.invalid_token_handler),
             (TokenPattern(r"[0-9]+[a-zA-Z0-9]+"), CPLTokenizer.invalid_token_handler),
         ]
-        self._tokens = self.__tokenize_first_pass()
+        if engine == CPLTokenizer.DFA_ENGINE:
+            self.engine_pattern = DFATokenPattern(self.token_patterns)
+        elif engine == CPLTokenizer.MASTER_ENGINE:
+            self.engine_pattern = MasterTokenPattern(self.token_patterns)
+
+        self._lookbehind = deque(maxlen=CPLTokenizer.LOOKBEHIND_SIZE)
         self._tokens_index = 0
+        if lazy:
+            self.token_store = None
+            self._tokens_iterator = self.__generate_tokens()
+        else:
+            self.token_store = TokenStore(raw_content, self.newline_index)
+            for token, start in self.__generate_tokens():
+                self.token_store.append(self.__reclassify(token).name, start, start + len(token.lexeme))
+
+        if compare_engines:
+            self.__compare_with_legacy_engine()
+
+    def __compare_with_legacy_engine(self):
+        """
+        :raises EngineMismatchError if the legacy engine produces different tokens for the same input.
+        """
+        tokens = self.token_store
+        expected_tokens = self.__class__(self.raw_content, engine=CPLTokenizer.LEGACY_ENGINE).token_store
+        for index, (token, expected_token) in enumerate(zip(tokens, expected_tokens)):
+            if token != expected_token:
+                raise EngineMismatchError(index, token, expected_token)
+
+        if len(tokens) != len(expected_tokens):
+            index = min(len(tokens), len(expected_tokens))
+            raise EngineMismatchError(
+                index,
+                tokens[index] if index < len(tokens) else None,
+                expected_tokens[index] if index < len(expected_tokens) else None
+            )
+
+    def get_regex_patterns(self):
+        """
+        :return: List of the rules regular expressions, ordered by priority.
+        """
+        return [token_pattern.regex_pattern for token_pattern, _ in self.token_patterns]
 
-    def __tokenize_first_pass(self):
+    def __generate_tokens(self):
         """
-        :return: List of `ContextTokens`. The list doesn't contain whitespaces and comments.
+        :return: Generator of (Token, start offset). Whitespaces and comments are filtered. The static_cast brackets
+            aren't recognized yet (see `__reclassify`).
         """
-        tokens = []
         while self.cursor < len(self.raw_content):
-            current_string = self.raw_content[self.cursor:]
-
-            # First, lets check if there are any possible matches.
-            possible_matches = self.__get_all_possible_matches(current_string)
-            token = max(possible_matches, key=lambda _token: len(_token.lexeme))
-            self.cursor += len(token.lexeme)
+            start = self.cursor
+            if self.raw_content.startswith(CPLTokenizer.COMMENT_START, start):
+                token, self.cursor = self.__scan_comment(start)
+            else:
+                token = self.__get_longest_match(start)
+                self.cursor += len(token.lexeme)
 
             # Filter whitespaces and comments...
             if token.name != CPLTokenizer.NOP_TOKEN_NAME:
-                tokens.append(ContextToken(token, self.line_number))
+                yield token, start
+
+    def __scan_comment(self, position):
+        """
+        Comments are scanned by searching for the comment's end, instead of by a rule - a regular expression for
+        comments backtracks badly on long or unterminated comments.
+
+        :param position: Index in `raw_content` of a comment start.
+
+        :return: Pair of (Token, the offset after the comment). An unterminated comment takes the rest of the input,
+            and its token is an "/*" `UNTERMINATED_COMMENT_TOKEN_NAME` token.
+        """
+        end = self.raw_content.find(CPLTokenizer.COMMENT_END, position + len(CPLTokenizer.COMMENT_START))
+        if end == -1:
+            unterminated_comment = Token(CPLTokenizer.UNTERMINATED_COMMENT_TOKEN_NAME, CPLTokenizer.COMMENT_START, "")
+            return unterminated_comment, len(self.raw_content)
 
-        return tokens
+        return self.nop_handler(CPLTokenizer.COMMENT_START), end + len(CPLTokenizer.COMMENT_END)
 
-    def __get_all_possible_matches(self, string):
+    def __get_longest_match(self, position):
         """
-        :param string: String.
+        :param position: Index in `raw_content` to match from.
+
+        :return: The Token of the longest match. On a tie, the first rule in `token_patterns` wins.
+        """
+        if self.engine == CPLTokenizer.LEGACY_ENGINE:
+            # First, lets check if there are any possible matches.
+            possible_matches = self.__get_all_possible_matches(position)
+            return max(possible_matches, key=lambda _token: len(_token.lexeme))
+
+        lexeme, handler = self.engine_pattern.match(self.raw_content, position)
+        return handler(lexeme)
+
+    def __get_all_possible_matches(self, position):
+        """
+        :param position: Index in `raw_content` to match from.
 
         :return: Returns list of Tokens, every token represents a possible match.
         """
         possible_matches = []
         for token_pattern, handler in self.token_patterns:
-            lexeme = token_pattern.match(string)
+            lexeme = token_pattern.match(self.raw_content, position)
             if lexeme is not None:
                 token = handler(lexeme)
                 possible_matches.append(token)
@@ -193,26 +457,59 @@ class CPLTokenizer:
 
         :raises StopIteration if there are no more tokens.
         """
-        if self._tokens_index >= len(self._tokens):
+        if self.lazy:
+            token, start = next(self._tokens_iterator)
+            return ContextToken(self.__reclassify(token), self.newline_index.get_line(start))
+
+        if self._tokens_index >= len(self.token_store):
             raise StopIteration()
 
-        token, line = self._tokens[self._tokens_index]
         self._tokens_index += 1
+        return self.token_store[self._tokens_index - 1]
+
+    def get_lark_tokens(self, errors):
+        """
+        :param errors: List, an `InvalidTokenError` is appended to it for every invalid token.
+
+        :return: Generator of the valid tokens as lark tokens. A lazy tokenizer builds them straight from the scanner.
+        """
+        if not self.lazy:
+            for lark_token in self.token_store.get_lark_tokens(errors):
+                yield lark_token
+
+            return
+
+        for token, start in self._tokens_iterator:
+            token = self.__reclassify(token)
+            line = self.newline_index.get_line(start)
+            if token.name in CPLTokenizer.ERROR_TOKEN_NAMES:
+                errors.append(InvalidTokenError(token, line))
+            else:
+                column = self.newline_index.get_column(start)
+                yield LarkToken(token.name, token.attribute, start, line=line, column=column)
+
+    def __reclassify(self, token):
+        """
+        :param token: The next Token in the input.
+
+        :return: The token, or the static_cast bracket token if the token is a '<' or '>' of a static_cast.
+        """
+        self._lookbehind.append(token)
 
         # This is my implementation for lookbehind with un-fixed size. (these aren't RELOP, should be considered as
         # symbols).
         if token.name == "RELOP" and token.attribute == "<" and self.__lookbehind_is_static_cast(2):
-            return ContextToken(Token(name="LEFT_STATIC_CAST_BRACKETS", lexeme="<", attribute=""), line)
+            return Token(name="LEFT_STATIC_CAST_BRACKETS", lexeme="<", attribute="")
         elif token.name == "RELOP" and token.attribute == ">" and self.__lookbehind_is_static_cast(4):
-            return ContextToken(Token(name="RIGHT_STATIC_CAST_BRACKETS", lexeme=">", attribute=""), line)
+            return Token(name="RIGHT_STATIC_CAST_BRACKETS", lexeme=">", attribute="")
 
-        return ContextToken(token, line)
+        return token
 
     def __lookbehind_is_static_cast(self, number_of_tokens_to_lookbehind):
-        if self._tokens_index - number_of_tokens_to_lookbehind < 0:
+        if len(self._lookbehind) < number_of_tokens_to_lookbehind:
             return False
 
-        return self._tokens[self._tokens_index - number_of_tokens_to_lookbehind].token.name == "STATIC_CAST"
+        return self._lookbehind[-number_of_tokens_to_lookbehind].name == "STATIC_CAST"
 
     def __iter__(self):
         return self
@@ -221,39 +518,192 @@ class CPLTokenizer:
         return self.get_next_token()
 
 
-class CLALexerAdapter(Lexer):
-    def __init__(self, *args, **kwargs):
-        Lexer.__init__(self)
+class TokenStore:
+    # The names codes are stored as unsigned chars.
+    MAX_NAMES = 256
 
-    def lex(self, data):
-        for token, line in data:
-            if token.name == CPLTokenizer.INVALID_TOKEN_NAME:
+    def __init__(self, raw_content, newline_index=None):
+        """
+        Compact storage for the tokens of a CPL program. Every token is a row in typed arrays (the token's name code
+        and the lexeme start and end offsets in the source) instead of a `ContextToken` object. The lexeme, the
+        attribute and the line number are computed only when a token is requested.
+
+        :param raw_content: String which represents the CPL program.
+        :param newline_index: The `NewlineIndex` of `raw_content` (built if not given).
+        """
+        self.raw_content = raw_content
+        self.newline_index = newline_index or NewlineIndex(raw_content)
+        self.names = []
+        self.names_codes = {}
+        self.codes = array("B")
+        self.starts = array("L")
+        self.ends = array("L")
+
+    def get_name_code(self, name):
+        code = self.names_codes.get(name)
+        if code is None:
+            if len(self.names) >= TokenStore.MAX_NAMES:
+                raise ValueError("Too many tokens names (%d)." % len(self.names))
+
+            code = self.names_codes[name] = len(self.names)
+            self.names.append(name)
+
+        return code
+
+    def append(self, name, start, end):
+        self.codes.append(self.get_name_code(name))
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def get_line(self, index):
+        return self.newline_index.get_line(self.starts[index])
+
+    def get_column(self, index):
+        return self.newline_index.get_column(self.starts[index])
+
+    def get_token(self, index):
+        name = self.names[self.codes[index]]
+        lexeme = self.raw_content[self.starts[index]:self.ends[index]]
+        return Token(name=name, lexeme=lexeme, attribute=get_attribute(name, lexeme))
+
+    def get_lark_tokens(self, errors):
+        """
+        :param errors: List, an `InvalidTokenError` is appended to it for every invalid token.
+
+        :return: Generator of the valid tokens as lark tokens.
+        """
+        names, codes, starts, ends = self.names, self.codes, self.starts, self.ends
+        newlines = self.newline_index.newlines
+        error_codes = set(self.names_codes.get(name) for name in CPLTokenizer.ERROR_TOKEN_NAMES)
+        # The tokens are ordered, so instead of searching the index for every token, just count the newlines before it.
+        newlines_count = 0
+        for index in range(len(codes)):
+            start = starts[index]
+            while newlines_count < len(newlines) and newlines[newlines_count] < start:
+                newlines_count += 1
+
+            if codes[index] in error_codes:
+                errors.append(InvalidTokenError(self.get_token(index), newlines_count + 1))
                 continue
-            else:
-                yield LarkToken(token.name, value=token.attribute, line=line)
+
+            line_start = newlines[newlines_count - 1] + 1 if newlines_count else 0
+            name = names[codes[index]]
+            value = get_attribute(name, self.raw_content[start:ends[index]])
+            yield LarkToken(name, value, start, line=newlines_count + 1, column=start - line_start + 1)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        return ContextToken(self.get_token(index), self.get_line(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
 
 
 class InvalidTokenError(CPLException):
     """Represents syntax error in the CPL language"""
     def __init__(self, token, line):
-        CPLException.__init__(self, line=line, message="Syntax error: Invalid symbol %s." % token.lexeme)
-
+        if token.name == CPLTokenizer.UNTERMINATED_COMMENT_TOKEN_NAME:
+            message = "Syntax error: Unterminated comment."
+        else:
+            message = "Syntax error: Invalid symbol %s." % token.lexeme
+
+        CPLException.__init__(self, line=line, message=message)
+
+
+def get_lark_tokens(tokens, errors):
+    """
+    :param tokens: Iterable of `ContextToken`s.
+    :param errors: List, an `InvalidTokenError` is appended to it for every invalid token.
+
+    :return: Generator of the valid tokens as lark tokens.
+    """
+    for token, line in tokens:
+        if token.name in CPLTokenizer.ERROR_TOKEN_NAMES:
+            errors.append(InvalidTokenError(token, line))
+        else:
+            yield LarkToken(token.name, value=token.attribute, line=line)
+
+
+def build_ast(tokens, transformer=None):
+    """
+    Parses the tokens while they are produced. If the tokens come from a lazy `CPLTokenizer`, a syntax error stops
+    the tokenizer - the rest of the input isn't lexed. Otherwise, the invalid symbols after the syntax error are
+    reported too.
+
+    A `CPLTokenizer` (or a `TokenStore`) builds the parser's tokens directly, and records the invalid symbols in the
+    same pass.
+
+    :param tokens: Iterable of `ContextToken`s (usually `CPLTokenizer`).
+    :param transformer: Optional `Transformer` which is applied while parsing - its callbacks are called at reduce
+        time, and the trees of their rules are never built (see `cpl_lark.get_inline_parser`).
+
+    :return: pair of (errors, tree). The tree is None if the parsing failed. With a transformer, the tree is the result
+        of its `start` callback.
+    """
+    errors = []
+    if isinstance(tokens, (CPLTokenizer, TokenStore)):
+        lark_tokens = tokens.get_lark_tokens(errors)
+    else:
+        lark_tokens = get_lark_tokens(tokens, errors)
 
-def build_ast(tokens):
-    tokens = list(tokens)
-    errors = [
-         InvalidTokenError(token, line) for token, line in tokens if token.name == CPLTokenizer.INVALID_TOKEN_NAME
-    ]
     tree = None
     try:
         parser = get_default_cpl_parser()
-        tree = parser.parse(tokens)
+        if transformer is not None:
+            parser = cpl_lark.get_inline_parser(parser, transformer)
+
+        tree = parser.parse(lark_tokens)
     except UnexpectedToken as e:
+        if not getattr(tokens, "lazy", False):
+            for _ in lark_tokens:
+                pass
+
         errors.append(CPLException(e.line, "Parsing error! unexpected token! expected one of the following tokens: %s" % ", ".join(e.expected)))
 
     return errors, tree
 
 
+CPL_PARSER_CACHE_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cpl_parser.cache")
+
+_default_cpl_parser = None
+_default_cpl_parser_lock = threading.Lock()
+# Seconds it took to build (or load from the cache) the LALR tables of the default parser (None until it is built).
+parser_build_time = None
+
+
 def get_default_cpl_parser():
-    with open(os.path.join(os.path.dirname(__file__), "cpl.y")) as CPLSyntax:
-        return Lark(CPLSyntax.read(), parser="lalr", lexer=CLALexerAdapter)
+    """
+    The parser is built once per process. It is the generated standalone parser when it is up to date (see
+    `cpl_lark`), otherwise it is built from `cpl.y` with lark, and its LALR tables are cached on disk for the next
+    processes (see `parser_cache`). The parsing state is local to every `parse` call, so the same parser is safely
+    reused by all the compilations, also by concurrent ones (the parser is built under a lock).
+
+    :return: The CPL LALR parser.
+    """
+    global _default_cpl_parser, parser_build_time
+    if _default_cpl_parser is not None:
+        return _default_cpl_parser
+
+    with _default_cpl_parser_lock:
+        if _default_cpl_parser is None:
+            start_time = time.perf_counter()
+            if cpl_lark.STANDALONE:
+                parser, from_cache = cpl_lark.get_standalone_parser(), True
+            else:
+                # Imported here, so the standalone parser never pays for importing lark.
+                from parser_cache import get_cached_parser
+
+                with open(CPL_GRAMMAR_FILENAME) as CPLSyntax:
+                    parser, from_cache = get_cached_parser(CPLSyntax.read(), CPL_PARSER_CACHE_FILENAME)
+
+            parser_build_time = time.perf_counter() - start_time
+            logger.debug(
+                "The CPL LALR tables were %s in %.3f seconds.", "loaded" if from_cache else "built", parser_build_time
+            )
+            # Published last, so the other threads never see a parser before it is complete.
+            _default_cpl_parser = parser
+
+    return _default_cpl_parser
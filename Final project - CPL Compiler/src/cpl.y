@@ -1,13 +1,12 @@
 start: declarations stmt_block
 
-declarations: declarations declaration
-              | epsilon
+declarations: declaration*
 
 declaration: idlist COLON type SEMICOLON
 
 type: INT | FLOAT
 
-idlist: idlist COMMA ID | ID
+idlist: ID (COMMA ID)*
 
 stmt: assignment_stmt
       | input_stmt
@@ -34,8 +33,7 @@ while_stmt: WHILE LEFT_PARENTHESIS boolexpr RIGHT_PARENTHESIS stmt
 
 switch_stmt: SWITCH LEFT_PARENTHESIS expression RIGHT_PARENTHESIS LEFT_CURLY_BRACKETS caselist DEFAULT COLON stmtlist RIGHT_CURLY_BRACKETS
 
-caselist: caselist CASE NUM COLON stmtlist
-          | epsilon
+caselist: (CASE NUM COLON stmtlist)*
 
 break_stmt: BREAK SEMICOLON
 
@@ -43,7 +41,7 @@ continue_stmt: CONTINUE SEMICOLON
 
 stmt_block: LEFT_CURLY_BRACKETS stmtlist RIGHT_CURLY_BRACKETS
 
-stmtlist: stmtlist stmt | epsilon
+stmtlist: stmt*
 
 boolexpr: boolexpr OR boolterm
           | boolterm
@@ -64,7 +62,6 @@ factor: LEFT_PARENTHESIS expression RIGHT_PARENTHESIS
         | ID
         | NUM
 
-epsilon:
 %declare COLON SEMICOLON INT FLOAT ID COMMA EQUAL_SIGN LEFT_PARENTHESIS RIGHT_PARENTHESIS LEFT_CURLY_BRACKETS
 %declare RIGHT_CURLY_BRACKETS LEFT_STATIC_CAST_BRACKETS RIGHT_STATIC_CAST_BRACKETS NUM ADDOP MULOP RELOP AND OR NOT
 %declare CONTINUE BREAK IF ELSE WHILE SWITCH CASE DEFAULT READ WRITE STATIC_CAST
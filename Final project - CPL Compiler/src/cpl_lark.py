@@ -0,0 +1,157 @@
+# File: cpl_lark.py
+# The lark classes which the CPL compiler uses.
+# Author: Nir Moshe.
+"""
+The CPL compiler takes its lark classes (tokens, trees, visitors and errors) from here.
+
+When the generated standalone parser (`cpl_parser.py`, see make_parser.sh) is up to date with `cpl.y`, all the classes
+come from it, and the lark library is not imported at all. Otherwise they come from lark, and the parser is built from
+`cpl.y` (see `parser_cache`). The classes must come from the same place: lark's visitors recognize the trees by their
+class.
+
+Author: Nir Moshe.
+"""
+import hashlib
+import os
+
+__author__ = "Nir Moshe"
+
+CPL_GRAMMAR_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cpl.y")
+
+
+def get_grammar_file_hash():
+    """
+    :return: sha1 of the content of `cpl.y`.
+    """
+    with open(CPL_GRAMMAR_FILENAME, "rb") as grammar_file:
+        return hashlib.sha1(grammar_file.read()).hexdigest()
+
+
+def load_standalone_parser_module(grammar_hash):
+    """
+    :param grammar_hash: sha1 of the current grammar (see `get_grammar_file_hash`).
+
+    :return: The generated `cpl_parser` module, or None if it is missing or was generated from another grammar.
+    """
+    try:
+        import cpl_parser
+    except ImportError:
+        return None
+
+    if getattr(cpl_parser, "GRAMMAR_HASH", None) != grammar_hash:
+        return None
+
+    return cpl_parser
+
+
+_standalone_parser_module = load_standalone_parser_module(get_grammar_file_hash())
+STANDALONE = _standalone_parser_module is not None
+
+if STANDALONE:
+    Discard = _standalone_parser_module.Discard
+    maybe_create_child_filter = _standalone_parser_module.maybe_create_child_filter
+    Parser = _standalone_parser_module._Parser
+    Token = _standalone_parser_module.Token
+    Transformer = _standalone_parser_module.Transformer
+    Tree = _standalone_parser_module.Tree
+    UnexpectedToken = _standalone_parser_module.UnexpectedToken
+    Visitor = _standalone_parser_module.Visitor
+
+    def iter_subtrees(tree):
+        """
+        lark's `Tree.iter_subtrees` (bottom-up order). The standalone generator leaves it out of `Tree`, although the
+        standalone `Visitor` uses it. The parse trees never share subtrees, so there are no duplicates to skip.
+        """
+        subtrees = []
+        stack = [tree]
+        while stack:
+            subtree = stack.pop()
+            subtrees.append(subtree)
+            stack += [child for child in subtree.children if isinstance(child, Tree)]
+
+        return reversed(subtrees)
+
+    Tree.iter_subtrees = iter_subtrees
+else:
+    from lark import Tree, UnexpectedToken
+    from lark.lexer import Token
+    from lark.parse_tree_builder import maybe_create_child_filter
+    from lark.parsers.lalr_parser import _Parser as Parser
+    from lark.visitors import Discard, Transformer, Visitor
+
+
+def get_standalone_parser():
+    """
+    Should be called once - the generated parser renames its rules' aliases when it builds its callbacks.
+
+    :return: The LALR parser of the standalone parser module. It takes an iterable of `Token`s.
+    """
+    return _standalone_parser_module.Lark_StandAlone().parser
+
+
+def get_inline_parser(parser, transformer):
+    """
+    lark's inline transformer (`Lark(..., transformer=...)`) for an existing LALR parser: the transformer's callbacks
+    are called at reduce time, so the trees of their rules are never built. Like lark does, the children of the inlined
+    rules (e.g. the `*` repetitions) are spliced into their parent's children, so the callbacks get the same children
+    as `Transformer.transform` passes them. (`cpl.y` has no aliases, `?` rules or filtered tokens.)
+
+    :param parser: `Parser` (see `cla.get_default_cpl_parser`). Its parse table is shared.
+    :param transformer: `Transformer`. Rules without a callback still build trees.
+
+    :return: `Parser` which returns the result of the transformer's `start` callback.
+    """
+    callbacks = {}
+    for rule, callback in parser.callbacks.items():
+        transformer_callback = getattr(transformer, rule.origin.name, None)
+        if transformer_callback is not None:
+            child_filter = maybe_create_child_filter(rule.expansion, False, False, None)
+            callback = child_filter(transformer_callback) if child_filter else transformer_callback
+
+        callbacks[rule] = callback
+
+    # A `Parser` has the parse table's attributes (states, start_state and end_state).
+    return Parser(parser, callbacks)
+
+
+def transform_iteratively(transformer, tree):
+    """
+    `Transformer.transform` with an explicit stack instead of recursion, so the depth of the tree is not limited by
+    the recursion limit. The transformer's callbacks are called in the same order (bottom-up, left to right), with the
+    list of the transformed children (like `get_inline_parser`, the callbacks' decorators are not supported). Rules
+    without a callback go to the transformer's `__default__`.
+
+    :param transformer: `Transformer`.
+    :param tree: `Tree`.
+
+    :return: The result of the transformer's callback of the root.
+    """
+    # Every frame is (subtree, its transformed children, iterator over the children which were not transformed yet).
+    stack = [(tree, [], iter(tree.children))]
+    while True:
+        subtree, children, remaining_children = stack[-1]
+        for child in remaining_children:
+            if isinstance(child, Tree):
+                stack.append((child, [], iter(child.children)))
+                break
+
+            children.append(child)
+        else:
+            stack.pop()
+            callback = getattr(transformer, subtree.data, None)
+            try:
+                if callback is None:
+                    result = transformer.__default__(subtree.data, children, subtree.meta)
+                else:
+                    result = callback(children)
+            except Discard:
+                # Like `Transformer.transform`, a discarded root is not caught.
+                if not stack:
+                    raise
+
+                continue
+
+            if not stack:
+                return result
+
+            stack[-1][1].append(result)
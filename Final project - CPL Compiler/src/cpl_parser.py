@@ -0,0 +1,2559 @@
+# The file was automatically generated by Lark v0.6.6
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser with a standard lexer
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark.
+#
+#    It is licensed under GPLv2 or above.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, contact me via email.
+#
+#    If GPL is incompatible with your free or open-source project,
+#    contact me and we'll work it out (for free).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 2 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    See <http://www.gnu.org/licenses/>.
+#
+#
+
+class LarkError(Exception):
+    pass
+
+class GrammarError(LarkError):
+    pass
+
+class ParseError(LarkError):
+    pass
+
+class LexError(LarkError):
+    pass
+
+class UnexpectedInput(LarkError):
+    pos_in_stream = None
+
+    def get_context(self, text, span=40):
+        pos = self.pos_in_stream
+        start = max(pos - span, 0)
+        end = pos + span
+        before = text[start:pos].rsplit('\n', 1)[-1]
+        after = text[pos:end].split('\n', 1)[0]
+        return before + after + '\n' + ' ' * len(before) + '^\n'
+
+    def match_examples(self, parse_fn, examples):
+        """ Given a parser instance and a dictionary mapping some label with
+            some malformed syntax examples, it'll return the label for the
+            example that bests matches the current error.
+        """
+        assert self.state is not None, "Not supported for this exception"
+
+        candidate = None
+        for label, example in examples.items():
+            assert not isinstance(example, STRING_TYPE)
+
+            for malformed in example:
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        try:
+                            if ut.token == self.token:  # Try exact match first
+                                return label
+                        except AttributeError:
+                            pass
+                        if not candidate:
+                            candidate = label
+
+        return candidate
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None):
+        message = "No terminal defined for '%s' at line %d col %d" % (seq[lex_pos], line, column)
+
+        self.line = line
+        self.column = column
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.pos_in_stream = lex_pos
+        self.state = state
+
+        message += '\n\n' + self.get_context(seq)
+        if allowed:
+            message += '\nExpecting: %s\n' % allowed
+
+        super(UnexpectedCharacters, self).__init__(message)
+
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    def __init__(self, token, expected, considered_rules=None, state=None):
+        self.token = token
+        self.expected = expected     # XXX str shouldn't necessary
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.considered_rules = considered_rules
+        self.state = state
+        self.pos_in_stream = getattr(token, 'pos_in_stream', None)
+
+        message = ("Unexpected token %r at line %s, column %s.\n"
+                   "Expected one of: \n\t* %s\n"
+                   % (token, self.line, self.column, '\n\t* '.join(self.expected)))
+
+        super(UnexpectedToken, self).__init__(message)
+
+class VisitError(Exception):
+    pass
+
+try:
+    STRING_TYPE = basestring
+except NameError:   # Python 3
+    STRING_TYPE = str
+
+
+import types
+from functools import wraps, partial
+from contextlib import contextmanager
+
+Str = type(u'')
+try:
+    classtype = types.ClassType # Python2
+except AttributeError:
+    classtype = type    # Python3
+
+def smart_decorator(f, create_decorator):
+    if isinstance(f, types.FunctionType):
+        return wraps(f)(create_decorator(f, True))
+
+    elif isinstance(f, (classtype, type, types.BuiltinFunctionType)):
+        return wraps(f)(create_decorator(f, False))
+
+    elif isinstance(f, types.MethodType):
+        return wraps(f)(create_decorator(f.__func__, True))
+
+    elif isinstance(f, partial):
+        # wraps does not work for partials in 2.7: https://bugs.python.org/issue3445
+        return create_decorator(f.__func__, True)
+
+    else:
+        return create_decorator(f.__func__.__call__, True)
+
+
+
+class Meta:
+    pass
+
+class Tree(object):
+    def __init__(self, data, children, meta=None):
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self):
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%s, %s)' % (self.data, self.children)
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            return [ indent_str*level, self._pretty_label(), '\t', '%s' % (self.children[0],), '\n']
+
+        l = [ indent_str*level, self._pretty_label(), '\n' ]
+        for n in self.children:
+            if isinstance(n, Tree):
+                l += n._pretty(level+1, indent_str)
+            else:
+                l += [ indent_str*(level+1), '%s' % (n,), '\n' ]
+
+        return l
+
+    def pretty(self, indent_str='  '):
+        return ''.join(self._pretty(0, indent_str))
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash((self.data, tuple(self.children)))
+
+from inspect import getmembers, getmro
+
+class Discard(Exception):
+    pass
+
+# Transformers
+
+class Transformer:
+    """Visits the tree recursively, starting with the leaves and finally the root (bottom-up)
+
+    Calls its methods (provided by user via inheritance) according to tree.data
+    The returned value replaces the old one in the structure.
+
+    Can be used to implement map or reduce.
+    """
+
+    def _call_userfunc(self, tree, new_children=None):
+        # Assumes tree is already transformed
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                if getattr(f, 'meta', False):
+                    return f(children, tree.meta)
+                elif getattr(f, 'inline', False):
+                    return f(*children)
+                elif getattr(f, 'whole_tree', False):
+                    if new_children is not None:
+                        raise NotImplementedError("Doesn't work with the base Transformer class")
+                    return f(tree)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError('Error trying to process rule "%s":\n\n%s' % (tree.data, e))
+
+    def _transform_children(self, children):
+        for c in children:
+            try:
+                yield self._transform_tree(c) if isinstance(c, Tree) else c
+            except Discard:
+                pass
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree):
+        return self._transform_tree(tree)
+
+    def __mul__(self, other):
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        "Default operation on tree (for override)"
+        return Tree(data, children, meta)
+
+    @classmethod
+    def _apply_decorator(cls, decorator, **kwargs):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+            if name.startswith('_') or name in libmembers:
+                continue
+
+            # Skip if v_args already applied (at the function level)
+            if hasattr(cls.__dict__[name], 'vargs_applied'):
+                continue
+
+            static = isinstance(cls.__dict__[name], (staticmethod, classmethod))
+            setattr(cls, name, decorator(value, static=static, **kwargs))
+        return cls
+
+
+class InlineTransformer(Transformer):   # XXX Deprecated
+    def _call_userfunc(self, tree, new_children=None):
+        # Assumes tree is already transformed
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(object):
+    def __init__(self, *transformers):
+        self.transformers = transformers
+
+    def transform(self, tree):
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return tree
+
+    def __mul__(self, other):
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer):
+    "Non-recursive. Changes the tree in-place instead of returning new instances"
+    def _transform_tree(self, tree):           # Cancel recursion
+        return self._call_userfunc(tree)
+
+    def transform(self, tree):
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_InPlaceRecursive(Transformer):
+    "Recursive. Changes the tree in-place instead of returning new instances"
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+
+# Visitors
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        "Default operation on tree (for override)"
+        return tree
+
+
+class Visitor(VisitorBase):
+    """Bottom-up visitor, non-recursive
+
+    Visits the tree, starting with the leaves and finally the root (bottom-up)
+    Calls its methods (provided by user via inheritance) according to tree.data
+    """
+
+
+    def visit(self, tree):
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+class Visitor_Recursive(VisitorBase):
+    """Bottom-up visitor, recursive
+
+    Visits the tree, starting with the leaves and finally the root (bottom-up)
+    Calls its methods (provided by user via inheritance) according to tree.data
+    """
+
+    def visit(self, tree):
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        f = getattr(self, tree.data, self.__default__)
+        f(tree)
+        return tree
+
+
+
+def visit_children_decor(func):
+    "See Interpreter"
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+
+class Interpreter:
+    """Top-down visitor, recursive
+
+    Visits the tree, starting with the root and finally the leaves (top-down)
+    Calls its methods (provided by user via inheritance) according to tree.data
+
+    Unlike Transformer and Visitor, the Interpreter doesn't automatically visit its sub-branches.
+    The user has to explicitly call visit_children, or use the @visit_children_decor
+    """
+    def visit(self, tree):
+        return getattr(self, tree.data)(tree)
+
+    def visit_children(self, tree):
+        return [self.visit(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+
+
+# Decorators
+
+def _apply_decorator(obj, decorator, **kwargs):
+    try:
+        _apply = obj._apply_decorator
+    except AttributeError:
+        return decorator(obj, **kwargs)
+    else:
+        return _apply(decorator, **kwargs)
+
+
+
+def _inline_args__func(func):
+    @wraps(func)
+    def create_decorator(_f, with_self):
+        if with_self:
+            def f(self, children):
+                return _f(self, *children)
+        else:
+            def f(self, children):
+                return _f(*children)
+        return f
+
+    return smart_decorator(func, create_decorator)
+
+
+def inline_args(obj):   # XXX Deprecated
+    return _apply_decorator(obj, _inline_args__func)
+
+
+
+def _visitor_args_func_dec(func, inline=False, meta=False, whole_tree=False, static=False):
+    assert [whole_tree, meta, inline].count(True) <= 1
+    def create_decorator(_f, with_self):
+        if with_self:
+            def f(self, *args, **kwargs):
+                return _f(self, *args, **kwargs)
+        else:
+            def f(self, *args, **kwargs):
+                return _f(*args, **kwargs)
+        return f
+
+    if static:
+        f = wraps(func)(create_decorator(func, False))
+    else:
+        f = smart_decorator(func, create_decorator)
+    f.vargs_applied = True
+    f.inline = inline
+    f.meta = meta
+    f.whole_tree = whole_tree
+    return f
+
+def v_args(inline=False, meta=False, tree=False):
+    "A convenience decorator factory, for modifying the behavior of user-supplied visitor methods"
+    if [tree, meta, inline].count(True) > 1:
+        raise ValueError("Visitor functions can either accept tree, or meta, or be inlined. These cannot be combined.")
+    def _visitor_args_dec(obj):
+        return _apply_decorator(obj, _visitor_args_func_dec, inline=inline, meta=meta, whole_tree=tree)
+    return _visitor_args_dec
+
+
+
+class Indenter:
+    def __init__(self):
+        self.paren_level = 0
+        self.indent_level = [0]
+
+    def handle_NL(self, token):
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] # Tabs and spaces
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            assert indent == self.indent_level[-1], '%s != %s' % (indent, self.indent_level[-1])
+
+    def process(self, stream):
+        for token in stream:
+            if token.type == self.NL_type:
+                for t in self.handle_NL(token):
+                    yield t
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token(self.DEDENT_type, '')
+
+        assert self.indent_level == [0], self.indent_level
+
+    # XXX Hack for ContextualLexer. Maybe there's a more elegant solution?
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+
+class Token(Str):
+    __slots__ = ('type', 'pos_in_stream', 'value', 'line', 'column', 'end_line', 'end_column')
+
+    def __new__(cls, type_, value, pos_in_stream=None, line=None, column=None):
+        self = super(Token, cls).__new__(cls, value)
+        self.type = type_
+        self.pos_in_stream = pos_in_stream
+        self.value = value
+        self.line = line
+        self.column = column
+        self.end_line = None
+        self.end_column = None
+        return self
+
+    @classmethod
+    def new_borrow_pos(cls, type_, value, borrow_t):
+        return cls(type_, value, borrow_t.pos_in_stream, line=borrow_t.line, column=borrow_t.column)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.pos_in_stream, self.line, self.column, ))
+
+    def __repr__(self):
+        return 'Token(%s, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.pos_in_stream, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return Str.__eq__(self, other)
+
+    __hash__ = Str.__hash__
+
+
+class LineCounter:
+    def __init__(self):
+        self.newline_char = '\n'
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def feed(self, token, test_newline=True):
+        """Consume a token and calculate the new line & column.
+
+        As an optional optimization, set test_newline=False is token doesn't contain a newline.
+        """
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+class _Lex:
+    "Built to serve both Lexer and ContextualLexer"
+    def __init__(self, lexer, state=None):
+        self.lexer = lexer
+        self.state = state
+
+    def lex(self, stream, newline_types, ignore_types):
+        newline_types = frozenset(newline_types)
+        ignore_types = frozenset(ignore_types)
+        line_ctr = LineCounter()
+
+        while line_ctr.char_pos < len(stream):
+            lexer = self.lexer
+            for mre, type_from_index in lexer.mres:
+                m = mre.match(stream, line_ctr.char_pos)
+                if not m:
+                    continue
+
+                t = None
+                value = m.group(0)
+                type_ = type_from_index[m.lastindex]
+                if type_ not in ignore_types:
+                    t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+                    if t.type in lexer.callback:
+                        t = lexer.callback[t.type](t)
+                    yield t
+                else:
+                    if type_ in lexer.callback:
+                        t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+                        lexer.callback[type_](t)
+
+                line_ctr.feed(value, type_ in newline_types)
+                if t:
+                    t.end_line = line_ctr.line
+                    t.end_column = line_ctr.column
+
+                break
+            else:
+                raise UnexpectedCharacters(stream, line_ctr.char_pos, line_ctr.line, line_ctr.column, state=self.state)
+
+
+class UnlessCallback:
+    def __init__(self, mres):
+        self.mres = mres
+
+    def __call__(self, t):
+        for mre, type_from_index in self.mres:
+            m = mre.match(t.value)
+            if m:
+                t.type = type_from_index[m.lastindex]
+                break
+        return t
+
+
+from functools import partial, wraps
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+class PropagatePositions:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree) and getattr(res.meta, 'empty', True):
+            res.meta.empty = True
+
+            for c in children:
+                if isinstance(c, Tree) and c.children and not c.meta.empty:
+                    res.meta.line = c.meta.line
+                    res.meta.column = c.meta.column
+                    res.meta.start_pos = c.meta.start_pos
+                    res.meta.empty = False
+                    break
+                elif isinstance(c, Token):
+                    res.meta.line = c.line
+                    res.meta.column = c.column
+                    res.meta.start_pos = c.pos_in_stream
+                    res.meta.empty = False
+                    break
+
+            for c in reversed(children):
+                if isinstance(c, Tree) and c.children and not c.meta.empty:
+                    res.meta.end_line = c.meta.end_line
+                    res.meta.end_column = c.meta.end_column
+                    res.meta.end_pos = c.meta.end_pos
+                    res.meta.empty = False
+                    break
+                elif isinstance(c, Token):
+                    res.meta.end_line = c.end_line
+                    res.meta.end_column = c.end_column
+                    res.meta.end_pos = c.pos_in_stream + len(c.value)
+                    res.meta.empty = False
+                    break
+
+        return res
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+class ChildFilterLALR(ChildFilter):
+    "Optimized childfilter for LALR (assumes no duplication in parse tree, so it's safe to change it)"
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   # Optimize for left-recursion
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    "Optimized childfilter for LALR (assumes no duplication in parse tree, so it's safe to change it)"
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   # Optimize for left-recursion
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        return self.node_builder(filtered)
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices):
+    # Prepare empty_indices as: How many Nones to insert at each index?
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            # LALR without placeholders
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class Callback(object):
+    pass
+
+
+def ptb_inline_args(func):
+    @wraps(func)
+    def f(children):
+        return func(*children)
+    return f
+
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, keep_all_tokens=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.always_keep_all_tokens = keep_all_tokens
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+        self.user_aliases = {}
+
+    def _init_builders(self, rules):
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = self.always_keep_all_tokens or (options.keep_all_tokens if options else False)
+            expand_single_child = options.expand1 if options else False
+
+            wrapper_chain = filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders and options else None),
+                self.propagate_positions and PropagatePositions,
+            ])
+
+            yield rule, wrapper_chain
+
+
+    def create_callback(self, transformer=None):
+        callback = Callback()
+
+        i = 0
+        for rule, wrapper_chain in self.rule_builders:
+            internal_callback_name = '_cb%d_%s' % (i, rule.origin)
+            i += 1
+
+            user_callback_name = rule.alias or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                assert not getattr(f, 'meta', False), "Meta args not supported for internal transformer"
+                # XXX InlineTransformer is deprecated!
+                if getattr(f, 'inline', False) or isinstance(transformer, InlineTransformer):
+                    f = ptb_inline_args(f)
+            except AttributeError:
+                f = partial(self.tree_class, user_callback_name)
+
+            self.user_aliases[rule] = rule.alias
+            rule.alias = internal_callback_name
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if hasattr(callback, internal_callback_name):
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+            setattr(callback, internal_callback_name, f)
+
+        return callback
+
+
+
+class _Parser:
+    def __init__(self, parse_table, callbacks):
+        self.states = parse_table.states
+        self.start_state = parse_table.start_state
+        self.end_state = parse_table.end_state
+        self.callbacks = callbacks
+
+    def parse(self, seq, set_state=None):
+        token = None
+        stream = iter(seq)
+        states = self.states
+
+        state_stack = [self.start_state]
+        value_stack = []
+
+        if set_state: set_state(self.start_state)
+
+        def get_action(token):
+            state = state_stack[-1]
+            try:
+                return states[state][token.type]
+            except KeyError:
+                expected = [s for s in states[state].keys() if s.isupper()]
+                raise UnexpectedToken(token, expected, state=state)
+
+        def reduce(rule):
+            size = len(rule.expansion)
+            if size:
+                s = value_stack[-size:]
+                del state_stack[-size:]
+                del value_stack[-size:]
+            else:
+                s = []
+
+            value = self.callbacks[rule](s)
+
+            _action, new_state = states[state_stack[-1]][rule.origin.name]
+            assert _action is Shift
+            state_stack.append(new_state)
+            value_stack.append(value)
+
+        # Main LALR-parser loop
+        for token in stream:
+            while True:
+                action, arg = get_action(token)
+                assert arg != self.end_state
+
+                if action is Shift:
+                    state_stack.append(arg)
+                    value_stack.append(token)
+                    if set_state: set_state(arg)
+                    break # next token
+                else:
+                    reduce(arg)
+
+        token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+        while True:
+            _action, arg = get_action(token)
+            if _action is Shift:
+                assert arg == self.end_state
+                val ,= value_stack
+                return val
+            else:
+                reduce(arg)
+
+
+class Symbol(object):
+    is_term = NotImplemented
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        assert isinstance(other, Symbol), other
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+class Terminal(Symbol):
+    is_term = True
+
+    def __init__(self, name, filter_out=False):
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+
+class NonTerminal(Symbol):
+    is_term = False
+
+class Rule(object):
+    """
+        origin : a symbol
+        expansion : a list of symbols
+    """
+    def __init__(self, origin, expansion, alias=None, options=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.options = options
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return hash((self.origin, tuple(self.expansion)))
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+class RuleOptions:
+    def __init__(self, keep_all_tokens=False, expand1=False, priority=None):
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.empty_indices = ()
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+        )
+
+Shift = 0
+Reduce = 1
+import re
+class LexerRegexps: pass
+NEWLINE_TYPES = []
+IGNORE_TYPES = []
+LEXERS = {}
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[0] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[1] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[2] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[3] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[4] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[5] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[6] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[7] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[8] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[9] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[10] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[11] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[12] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[13] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[14] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[15] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[16] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[17] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[18] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[19] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[20] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[21] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[22] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[23] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[24] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[25] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[26] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[27] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[28] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[29] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[30] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[31] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[32] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[33] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[34] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[35] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[36] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[37] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[38] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[39] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[40] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[41] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[42] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[43] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[44] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[45] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[46] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[47] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[48] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[49] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[50] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[51] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[52] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[53] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[54] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[55] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[56] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[57] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[58] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[59] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[60] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[61] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[62] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[63] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[64] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[65] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[66] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[67] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[68] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[69] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[70] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[71] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[72] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[73] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[74] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[75] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[76] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[77] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[78] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[79] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[80] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[81] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[82] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[83] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[84] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[85] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[86] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[87] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[88] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[89] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[90] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[91] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[92] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[93] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[94] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[95] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[96] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[97] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[98] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[99] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[100] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[101] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[102] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[103] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[104] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[105] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[106] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[107] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[108] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[109] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[110] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[111] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[112] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[113] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[114] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[115] = (lexer_regexps)
+MRES = (
+[]
+)
+LEXER_CALLBACK = (
+{}
+)
+lexer_regexps = LexerRegexps()
+lexer_regexps.mres = [(re.compile(p), d) for p, d in MRES]
+lexer_regexps.callback = {n: UnlessCallback([(re.compile(p), d) for p, d in mres])
+                          for n, mres in LEXER_CALLBACK.items()}
+LEXERS[116] = (lexer_regexps)
+class ContextualLexer:
+    def __init__(self):
+        self.lexers = LEXERS
+        self.set_parser_state(None)
+    def set_parser_state(self, state):
+        self.parser_state = state
+    def lex(self, stream):
+        newline_types = NEWLINE_TYPES
+        ignore_types = IGNORE_TYPES
+        lexers = LEXERS
+        l = _Lex(lexers[self.parser_state], self.parser_state)
+        for x in l.lex(stream, newline_types, ignore_types):
+            yield x
+            l.lexer = lexers[self.parser_state]
+            l.state = self.parser_state
+CON_LEXER = ContextualLexer()
+def lex(stream):
+    return CON_LEXER.lex(stream)
+RULES = {
+  0: Rule(NonTerminal('start'), [NonTerminal('declarations'), NonTerminal('stmt_block')], None, RuleOptions(False, False, None)),
+  1: Rule(NonTerminal('declarations'), [], None, RuleOptions(False, False, None)),
+  2: Rule(NonTerminal('declarations'), [NonTerminal('__anon_star_0')], None, RuleOptions(False, False, None)),
+  3: Rule(NonTerminal('declaration'), [NonTerminal('idlist'), Terminal('COLON', False), NonTerminal('type'), Terminal('SEMICOLON', False)], None, RuleOptions(False, False, None)),
+  4: Rule(NonTerminal('type'), [Terminal('INT', False)], None, RuleOptions(False, False, None)),
+  5: Rule(NonTerminal('type'), [Terminal('FLOAT', False)], None, RuleOptions(False, False, None)),
+  6: Rule(NonTerminal('idlist'), [Terminal('ID', False)], None, RuleOptions(False, False, None)),
+  7: Rule(NonTerminal('idlist'), [Terminal('ID', False), NonTerminal('__anon_star_1')], None, RuleOptions(False, False, None)),
+  8: Rule(NonTerminal('stmt'), [NonTerminal('cast_stmt')], None, RuleOptions(False, False, None)),
+  9: Rule(NonTerminal('stmt'), [NonTerminal('switch_stmt')], None, RuleOptions(False, False, None)),
+  10: Rule(NonTerminal('stmt'), [NonTerminal('while_stmt')], None, RuleOptions(False, False, None)),
+  11: Rule(NonTerminal('stmt'), [NonTerminal('assignment_stmt')], None, RuleOptions(False, False, None)),
+  12: Rule(NonTerminal('stmt'), [NonTerminal('if_stmt')], None, RuleOptions(False, False, None)),
+  13: Rule(NonTerminal('stmt'), [NonTerminal('stmt_block')], None, RuleOptions(False, False, None)),
+  14: Rule(NonTerminal('stmt'), [NonTerminal('input_stmt')], None, RuleOptions(False, False, None)),
+  15: Rule(NonTerminal('stmt'), [NonTerminal('output_stmt')], None, RuleOptions(False, False, None)),
+  16: Rule(NonTerminal('stmt'), [NonTerminal('break_stmt')], None, RuleOptions(False, False, None)),
+  17: Rule(NonTerminal('stmt'), [NonTerminal('continue_stmt')], None, RuleOptions(False, False, None)),
+  18: Rule(NonTerminal('assignment_stmt'), [Terminal('ID', False), Terminal('EQUAL_SIGN', False), NonTerminal('expression'), Terminal('SEMICOLON', False)], None, RuleOptions(False, False, None)),
+  19: Rule(NonTerminal('input_stmt'), [Terminal('READ', False), Terminal('LEFT_PARENTHESIS', False), Terminal('ID', False), Terminal('RIGHT_PARENTHESIS', False), Terminal('SEMICOLON', False)], None, RuleOptions(False, False, None)),
+  20: Rule(NonTerminal('output_stmt'), [Terminal('WRITE', False), Terminal('LEFT_PARENTHESIS', False), NonTerminal('expression'), Terminal('RIGHT_PARENTHESIS', False), Terminal('SEMICOLON', False)], None, RuleOptions(False, False, None)),
+  21: Rule(NonTerminal('cast_stmt'), [Terminal('ID', False), Terminal('EQUAL_SIGN', False), Terminal('STATIC_CAST', False), Terminal('LEFT_STATIC_CAST_BRACKETS', False), NonTerminal('type'), Terminal('RIGHT_STATIC_CAST_BRACKETS', False), Terminal('LEFT_PARENTHESIS', False), NonTerminal('expression'), Terminal('RIGHT_PARENTHESIS', False), Terminal('SEMICOLON', False)], None, RuleOptions(False, False, None)),
+  22: Rule(NonTerminal('if_stmt'), [Terminal('IF', False), Terminal('LEFT_PARENTHESIS', False), NonTerminal('boolexpr'), Terminal('RIGHT_PARENTHESIS', False), NonTerminal('stmt'), Terminal('ELSE', False), NonTerminal('stmt')], None, RuleOptions(False, False, None)),
+  23: Rule(NonTerminal('while_stmt'), [Terminal('WHILE', False), Terminal('LEFT_PARENTHESIS', False), NonTerminal('boolexpr'), Terminal('RIGHT_PARENTHESIS', False), NonTerminal('stmt')], None, RuleOptions(False, False, None)),
+  24: Rule(NonTerminal('switch_stmt'), [Terminal('SWITCH', False), Terminal('LEFT_PARENTHESIS', False), NonTerminal('expression'), Terminal('RIGHT_PARENTHESIS', False), Terminal('LEFT_CURLY_BRACKETS', False), NonTerminal('caselist'), Terminal('DEFAULT', False), Terminal('COLON', False), NonTerminal('stmtlist'), Terminal('RIGHT_CURLY_BRACKETS', False)], None, RuleOptions(False, False, None)),
+  25: Rule(NonTerminal('caselist'), [NonTerminal('__anon_star_2')], None, RuleOptions(False, False, None)),
+  26: Rule(NonTerminal('caselist'), [], None, RuleOptions(False, False, None)),
+  27: Rule(NonTerminal('break_stmt'), [Terminal('BREAK', False), Terminal('SEMICOLON', False)], None, RuleOptions(False, False, None)),
+  28: Rule(NonTerminal('continue_stmt'), [Terminal('CONTINUE', False), Terminal('SEMICOLON', False)], None, RuleOptions(False, False, None)),
+  29: Rule(NonTerminal('stmt_block'), [Terminal('LEFT_CURLY_BRACKETS', False), NonTerminal('stmtlist'), Terminal('RIGHT_CURLY_BRACKETS', False)], None, RuleOptions(False, False, None)),
+  30: Rule(NonTerminal('stmtlist'), [], None, RuleOptions(False, False, None)),
+  31: Rule(NonTerminal('stmtlist'), [NonTerminal('__anon_star_3')], None, RuleOptions(False, False, None)),
+  32: Rule(NonTerminal('boolexpr'), [NonTerminal('boolexpr'), Terminal('OR', False), NonTerminal('boolterm')], None, RuleOptions(False, False, None)),
+  33: Rule(NonTerminal('boolexpr'), [NonTerminal('boolterm')], None, RuleOptions(False, False, None)),
+  34: Rule(NonTerminal('boolterm'), [NonTerminal('boolfactor')], None, RuleOptions(False, False, None)),
+  35: Rule(NonTerminal('boolterm'), [NonTerminal('boolterm'), Terminal('AND', False), NonTerminal('boolfactor')], None, RuleOptions(False, False, None)),
+  36: Rule(NonTerminal('boolfactor'), [Terminal('NOT', False), Terminal('LEFT_PARENTHESIS', False), NonTerminal('boolexpr'), Terminal('RIGHT_PARENTHESIS', False)], None, RuleOptions(False, False, None)),
+  37: Rule(NonTerminal('boolfactor'), [NonTerminal('expression'), Terminal('RELOP', False), NonTerminal('expression')], None, RuleOptions(False, False, None)),
+  38: Rule(NonTerminal('expression'), [NonTerminal('expression'), Terminal('ADDOP', False), NonTerminal('term')], None, RuleOptions(False, False, None)),
+  39: Rule(NonTerminal('expression'), [NonTerminal('term')], None, RuleOptions(False, False, None)),
+  40: Rule(NonTerminal('term'), [NonTerminal('term'), Terminal('MULOP', False), NonTerminal('factor')], None, RuleOptions(False, False, None)),
+  41: Rule(NonTerminal('term'), [NonTerminal('factor')], None, RuleOptions(False, False, None)),
+  42: Rule(NonTerminal('factor'), [Terminal('NUM', False)], None, RuleOptions(False, False, None)),
+  43: Rule(NonTerminal('factor'), [Terminal('ID', False)], None, RuleOptions(False, False, None)),
+  44: Rule(NonTerminal('factor'), [Terminal('LEFT_PARENTHESIS', False), NonTerminal('expression'), Terminal('RIGHT_PARENTHESIS', False)], None, RuleOptions(False, False, None)),
+  45: Rule(NonTerminal('__anon_star_0'), [NonTerminal('declaration')], None, None),
+  46: Rule(NonTerminal('__anon_star_0'), [NonTerminal('__anon_star_0'), NonTerminal('declaration')], None, None),
+  47: Rule(NonTerminal('__anon_star_1'), [NonTerminal('__anon_star_1'), Terminal('COMMA', False), Terminal('ID', False)], None, None),
+  48: Rule(NonTerminal('__anon_star_1'), [Terminal('COMMA', False), Terminal('ID', False)], None, None),
+  49: Rule(NonTerminal('__anon_star_2'), [NonTerminal('__anon_star_2'), Terminal('CASE', False), Terminal('NUM', False), Terminal('COLON', False), NonTerminal('stmtlist')], None, None),
+  50: Rule(NonTerminal('__anon_star_2'), [Terminal('CASE', False), Terminal('NUM', False), Terminal('COLON', False), NonTerminal('stmtlist')], None, None),
+  51: Rule(NonTerminal('__anon_star_3'), [NonTerminal('stmt')], None, None),
+  52: Rule(NonTerminal('__anon_star_3'), [NonTerminal('__anon_star_3'), NonTerminal('stmt')], None, None),
+}
+parse_tree_builder = ParseTreeBuilder(RULES.values(), Tree)
+class ParseTable: pass
+parse_table = ParseTable()
+STATES = {
+  0: {0: (1, 1), 1: (0, 1), 2: (0, 2), 3: (0, 3), 4: (0, 4), 5: (0, 5), 6: (0, 6)},
+  1: {7: (0, 7)},
+  2: {8: (1, 6), 9: (0, 8), 10: (0, 9)},
+  3: {8: (0, 10)},
+  4: {0: (1, 45), 2: (1, 45)},
+  5: {0: (1, 2), 2: (0, 2), 3: (0, 3), 4: (0, 11)},
+  6: {11: (0, 12), 0: (0, 13)},
+  7: {},
+  8: {8: (1, 7), 10: (0, 14)},
+  9: {2: (0, 15)},
+  10: {12: (0, 16), 13: (0, 17), 14: (0, 18)},
+  11: {0: (1, 46), 2: (1, 46)},
+  12: {7: (1, 0)},
+  13: {15: (1, 30), 16: (1, 30), 17: (1, 30), 18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 21: (0, 23), 22: (0, 24), 23: (0, 25), 24: (0, 26), 25: (0, 27), 26: (0, 28), 27: (0, 29), 28: (0, 30), 2: (0, 31), 29: (0, 32), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 34: (0, 37), 35: (0, 38), 36: (0, 39)},
+  14: {2: (0, 40)},
+  15: {8: (1, 48), 10: (1, 48)},
+  16: {37: (0, 41)},
+  17: {37: (1, 4), 38: (1, 4)},
+  18: {37: (1, 5), 38: (1, 5)},
+  19: {32: (1, 14), 27: (1, 14), 17: (1, 14), 31: (1, 14), 0: (1, 14), 19: (1, 14), 26: (1, 14), 2: (1, 14), 15: (1, 14), 39: (1, 14), 16: (1, 14), 34: (1, 14), 23: (1, 14)},
+  20: {40: (0, 42)},
+  21: {32: (1, 16), 27: (1, 16), 17: (1, 16), 31: (1, 16), 0: (1, 16), 19: (1, 16), 26: (1, 16), 2: (1, 16), 15: (1, 16), 39: (1, 16), 16: (1, 16), 34: (1, 16), 23: (1, 16)},
+  22: {32: (1, 13), 27: (1, 13), 17: (1, 13), 31: (1, 13), 0: (1, 13), 19: (1, 13), 26: (1, 13), 2: (1, 13), 15: (1, 13), 39: (1, 13), 16: (1, 13), 34: (1, 13), 23: (1, 13)},
+  23: {32: (1, 9), 27: (1, 9), 17: (1, 9), 31: (1, 9), 0: (1, 9), 19: (1, 9), 26: (1, 9), 2: (1, 9), 15: (1, 9), 39: (1, 9), 16: (1, 9), 34: (1, 9), 23: (1, 9)},
+  24: {32: (1, 11), 27: (1, 11), 17: (1, 11), 31: (1, 11), 0: (1, 11), 19: (1, 11), 26: (1, 11), 2: (1, 11), 15: (1, 11), 39: (1, 11), 16: (1, 11), 34: (1, 11), 23: (1, 11)},
+  25: {40: (0, 43)},
+  26: {32: (1, 51), 27: (1, 51), 17: (1, 51), 31: (1, 51), 0: (1, 51), 19: (1, 51), 26: (1, 51), 2: (1, 51), 15: (1, 51), 16: (1, 51), 34: (1, 51), 23: (1, 51)},
+  27: {32: (1, 15), 27: (1, 15), 17: (1, 15), 31: (1, 15), 0: (1, 15), 19: (1, 15), 26: (1, 15), 2: (1, 15), 15: (1, 15), 39: (1, 15), 16: (1, 15), 34: (1, 15), 23: (1, 15)},
+  28: {37: (0, 44)},
+  29: {37: (0, 45)},
+  30: {15: (1, 31), 16: (1, 31), 17: (1, 31), 18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 21: (0, 23), 22: (0, 24), 23: (0, 25), 25: (0, 27), 26: (0, 28), 27: (0, 29), 29: (0, 32), 2: (0, 31), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 34: (0, 37), 35: (0, 38), 24: (0, 46)},
+  31: {41: (0, 47)},
+  32: {32: (1, 12), 27: (1, 12), 17: (1, 12), 31: (1, 12), 0: (1, 12), 19: (1, 12), 26: (1, 12), 2: (1, 12), 15: (1, 12), 39: (1, 12), 16: (1, 12), 34: (1, 12), 23: (1, 12)},
+  33: {32: (1, 8), 27: (1, 8), 17: (1, 8), 31: (1, 8), 0: (1, 8), 19: (1, 8), 26: (1, 8), 2: (1, 8), 15: (1, 8), 39: (1, 8), 16: (1, 8), 34: (1, 8), 23: (1, 8)},
+  34: {40: (0, 48)},
+  35: {40: (0, 49)},
+  36: {32: (1, 10), 27: (1, 10), 17: (1, 10), 31: (1, 10), 0: (1, 10), 19: (1, 10), 26: (1, 10), 2: (1, 10), 15: (1, 10), 39: (1, 10), 16: (1, 10), 34: (1, 10), 23: (1, 10)},
+  37: {40: (0, 50)},
+  38: {32: (1, 17), 27: (1, 17), 17: (1, 17), 31: (1, 17), 0: (1, 17), 19: (1, 17), 26: (1, 17), 2: (1, 17), 15: (1, 17), 39: (1, 17), 16: (1, 17), 34: (1, 17), 23: (1, 17)},
+  39: {16: (0, 51)},
+  40: {8: (1, 47), 10: (1, 47)},
+  41: {0: (1, 3), 2: (1, 3)},
+  42: {42: (0, 52), 43: (0, 53), 2: (0, 54), 44: (0, 55), 40: (0, 56), 45: (0, 57), 46: (0, 58), 47: (0, 59), 48: (0, 60), 49: (0, 61)},
+  43: {2: (0, 62)},
+  44: {32: (1, 27), 27: (1, 27), 17: (1, 27), 31: (1, 27), 0: (1, 27), 19: (1, 27), 26: (1, 27), 2: (1, 27), 15: (1, 27), 39: (1, 27), 16: (1, 27), 34: (1, 27), 23: (1, 27)},
+  45: {32: (1, 28), 27: (1, 28), 17: (1, 28), 31: (1, 28), 0: (1, 28), 19: (1, 28), 26: (1, 28), 2: (1, 28), 15: (1, 28), 39: (1, 28), 16: (1, 28), 34: (1, 28), 23: (1, 28)},
+  46: {32: (1, 52), 27: (1, 52), 17: (1, 52), 31: (1, 52), 0: (1, 52), 19: (1, 52), 26: (1, 52), 2: (1, 52), 15: (1, 52), 16: (1, 52), 34: (1, 52), 23: (1, 52)},
+  47: {44: (0, 63), 42: (0, 52), 2: (0, 54), 40: (0, 56), 45: (0, 57), 50: (0, 64), 46: (0, 58)},
+  48: {42: (0, 52), 2: (0, 54), 40: (0, 56), 45: (0, 57), 46: (0, 58), 44: (0, 65)},
+  49: {42: (0, 52), 2: (0, 54), 40: (0, 56), 45: (0, 57), 46: (0, 58), 44: (0, 66)},
+  50: {42: (0, 52), 49: (0, 61), 43: (0, 53), 2: (0, 54), 44: (0, 55), 40: (0, 56), 45: (0, 57), 46: (0, 58), 47: (0, 67), 48: (0, 60)},
+  51: {32: (1, 29), 27: (1, 29), 17: (1, 29), 31: (1, 29), 0: (1, 29), 7: (1, 29), 19: (1, 29), 26: (1, 29), 2: (1, 29), 15: (1, 29), 39: (1, 29), 16: (1, 29), 34: (1, 29), 23: (1, 29)},
+  52: {51: (1, 42), 52: (1, 42), 53: (1, 42), 54: (1, 42), 55: (1, 42), 37: (1, 42), 56: (1, 42)},
+  53: {51: (1, 33), 54: (1, 33), 55: (0, 68)},
+  54: {51: (1, 43), 52: (1, 43), 53: (1, 43), 54: (1, 43), 55: (1, 43), 37: (1, 43), 56: (1, 43)},
+  55: {53: (0, 69), 52: (0, 70)},
+  56: {42: (0, 52), 2: (0, 54), 40: (0, 56), 45: (0, 57), 46: (0, 58), 44: (0, 71)},
+  57: {51: (1, 39), 52: (1, 39), 53: (1, 39), 54: (1, 39), 55: (1, 39), 37: (1, 39), 56: (0, 72)},
+  58: {51: (1, 41), 52: (1, 41), 53: (1, 41), 54: (1, 41), 55: (1, 41), 37: (1, 41), 56: (1, 41)},
+  59: {51: (0, 73), 54: (0, 74)},
+  60: {51: (1, 34), 54: (1, 34), 55: (1, 34)},
+  61: {40: (0, 75)},
+  62: {51: (0, 76)},
+  63: {37: (0, 77), 52: (0, 70)},
+  64: {57: (0, 78)},
+  65: {52: (0, 70), 51: (0, 79)},
+  66: {51: (0, 80), 52: (0, 70)},
+  67: {51: (0, 81), 54: (0, 74)},
+  68: {42: (0, 52), 2: (0, 54), 44: (0, 55), 40: (0, 56), 45: (0, 57), 48: (0, 82), 46: (0, 58), 49: (0, 61)},
+  69: {42: (0, 52), 2: (0, 54), 40: (0, 56), 45: (0, 57), 44: (0, 83), 46: (0, 58)},
+  70: {45: (0, 84), 42: (0, 52), 46: (0, 58), 2: (0, 54), 40: (0, 56)},
+  71: {51: (0, 85), 52: (0, 70)},
+  72: {42: (0, 52), 46: (0, 86), 2: (0, 54), 40: (0, 56)},
+  73: {18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 21: (0, 23), 22: (0, 24), 23: (0, 25), 25: (0, 27), 26: (0, 28), 24: (0, 87), 27: (0, 29), 29: (0, 32), 2: (0, 31), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 34: (0, 37), 35: (0, 38)},
+  74: {43: (0, 88), 42: (0, 52), 2: (0, 54), 44: (0, 55), 40: (0, 56), 45: (0, 57), 46: (0, 58), 48: (0, 60), 49: (0, 61)},
+  75: {42: (0, 52), 43: (0, 53), 2: (0, 54), 44: (0, 55), 40: (0, 56), 45: (0, 57), 47: (0, 89), 46: (0, 58), 48: (0, 60), 49: (0, 61)},
+  76: {37: (0, 90)},
+  77: {32: (1, 18), 27: (1, 18), 17: (1, 18), 31: (1, 18), 0: (1, 18), 19: (1, 18), 26: (1, 18), 2: (1, 18), 15: (1, 18), 39: (1, 18), 16: (1, 18), 34: (1, 18), 23: (1, 18)},
+  78: {13: (0, 17), 12: (0, 91), 14: (0, 18)},
+  79: {0: (0, 92)},
+  80: {37: (0, 93)},
+  81: {18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 24: (0, 94), 21: (0, 23), 22: (0, 24), 23: (0, 25), 25: (0, 27), 26: (0, 28), 27: (0, 29), 29: (0, 32), 2: (0, 31), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 34: (0, 37), 35: (0, 38)},
+  82: {51: (1, 35), 54: (1, 35), 55: (1, 35)},
+  83: {51: (1, 37), 54: (1, 37), 55: (1, 37), 52: (0, 70)},
+  84: {51: (1, 38), 52: (1, 38), 53: (1, 38), 54: (1, 38), 55: (1, 38), 37: (1, 38), 56: (0, 72)},
+  85: {51: (1, 44), 52: (1, 44), 53: (1, 44), 54: (1, 44), 55: (1, 44), 37: (1, 44), 56: (1, 44)},
+  86: {51: (1, 40), 52: (1, 40), 53: (1, 40), 54: (1, 40), 55: (1, 40), 37: (1, 40), 56: (1, 40)},
+  87: {32: (1, 23), 27: (1, 23), 17: (1, 23), 31: (1, 23), 0: (1, 23), 19: (1, 23), 26: (1, 23), 2: (1, 23), 15: (1, 23), 39: (1, 23), 16: (1, 23), 34: (1, 23), 23: (1, 23)},
+  88: {51: (1, 32), 54: (1, 32), 55: (0, 68)},
+  89: {51: (0, 95), 54: (0, 74)},
+  90: {32: (1, 19), 27: (1, 19), 17: (1, 19), 31: (1, 19), 0: (1, 19), 19: (1, 19), 26: (1, 19), 2: (1, 19), 15: (1, 19), 39: (1, 19), 16: (1, 19), 34: (1, 19), 23: (1, 19)},
+  91: {38: (0, 96)},
+  92: {17: (1, 26), 15: (0, 97), 58: (0, 98), 59: (0, 99)},
+  93: {32: (1, 20), 27: (1, 20), 17: (1, 20), 31: (1, 20), 0: (1, 20), 19: (1, 20), 26: (1, 20), 2: (1, 20), 15: (1, 20), 39: (1, 20), 16: (1, 20), 34: (1, 20), 23: (1, 20)},
+  94: {39: (0, 100)},
+  95: {51: (1, 36), 54: (1, 36), 55: (1, 36)},
+  96: {40: (0, 101)},
+  97: {42: (0, 102)},
+  98: {17: (1, 25), 15: (0, 103)},
+  99: {17: (0, 104)},
+  100: {18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 21: (0, 23), 22: (0, 24), 23: (0, 25), 25: (0, 27), 26: (0, 28), 27: (0, 29), 29: (0, 32), 2: (0, 31), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 34: (0, 37), 24: (0, 105), 35: (0, 38)},
+  101: {44: (0, 106), 42: (0, 52), 2: (0, 54), 40: (0, 56), 45: (0, 57), 46: (0, 58)},
+  102: {8: (0, 107)},
+  103: {42: (0, 108)},
+  104: {8: (0, 109)},
+  105: {32: (1, 22), 27: (1, 22), 17: (1, 22), 31: (1, 22), 0: (1, 22), 19: (1, 22), 26: (1, 22), 2: (1, 22), 15: (1, 22), 39: (1, 22), 16: (1, 22), 34: (1, 22), 23: (1, 22)},
+  106: {51: (0, 110), 52: (0, 70)},
+  107: {15: (1, 30), 16: (1, 30), 17: (1, 30), 18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 21: (0, 23), 22: (0, 24), 23: (0, 25), 24: (0, 26), 25: (0, 27), 26: (0, 28), 27: (0, 29), 36: (0, 111), 28: (0, 30), 2: (0, 31), 29: (0, 32), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 34: (0, 37), 35: (0, 38)},
+  108: {8: (0, 112)},
+  109: {15: (1, 30), 16: (1, 30), 17: (1, 30), 18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 21: (0, 23), 22: (0, 24), 36: (0, 113), 23: (0, 25), 24: (0, 26), 25: (0, 27), 26: (0, 28), 27: (0, 29), 28: (0, 30), 2: (0, 31), 29: (0, 32), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 34: (0, 37), 35: (0, 38)},
+  110: {37: (0, 114)},
+  111: {17: (1, 50), 15: (1, 50)},
+  112: {15: (1, 30), 16: (1, 30), 17: (1, 30), 18: (0, 19), 19: (0, 20), 20: (0, 21), 11: (0, 22), 21: (0, 23), 22: (0, 24), 23: (0, 25), 24: (0, 26), 25: (0, 27), 26: (0, 28), 27: (0, 29), 28: (0, 30), 2: (0, 31), 29: (0, 32), 30: (0, 33), 31: (0, 34), 32: (0, 35), 0: (0, 13), 33: (0, 36), 36: (0, 115), 34: (0, 37), 35: (0, 38)},
+  113: {16: (0, 116)},
+  114: {32: (1, 21), 27: (1, 21), 17: (1, 21), 31: (1, 21), 0: (1, 21), 19: (1, 21), 26: (1, 21), 2: (1, 21), 15: (1, 21), 39: (1, 21), 16: (1, 21), 34: (1, 21), 23: (1, 21)},
+  115: {17: (1, 49), 15: (1, 49)},
+  116: {32: (1, 24), 27: (1, 24), 17: (1, 24), 31: (1, 24), 0: (1, 24), 19: (1, 24), 26: (1, 24), 2: (1, 24), 15: (1, 24), 39: (1, 24), 16: (1, 24), 34: (1, 24), 23: (1, 24)},
+}
+TOKEN_TYPES = (
+{0: 'LEFT_CURLY_BRACKETS',
+ 1: 'start',
+ 2: 'ID',
+ 3: 'idlist',
+ 4: 'declaration',
+ 5: '__anon_star_0',
+ 6: 'declarations',
+ 7: '$END',
+ 8: 'COLON',
+ 9: '__anon_star_1',
+ 10: 'COMMA',
+ 11: 'stmt_block',
+ 12: 'type',
+ 13: 'INT',
+ 14: 'FLOAT',
+ 15: 'CASE',
+ 16: 'RIGHT_CURLY_BRACKETS',
+ 17: 'DEFAULT',
+ 18: 'input_stmt',
+ 19: 'WHILE',
+ 20: 'break_stmt',
+ 21: 'switch_stmt',
+ 22: 'assignment_stmt',
+ 23: 'READ',
+ 24: 'stmt',
+ 25: 'output_stmt',
+ 26: 'BREAK',
+ 27: 'CONTINUE',
+ 28: '__anon_star_3',
+ 29: 'if_stmt',
+ 30: 'cast_stmt',
+ 31: 'SWITCH',
+ 32: 'WRITE',
+ 33: 'while_stmt',
+ 34: 'IF',
+ 35: 'continue_stmt',
+ 36: 'stmtlist',
+ 37: 'SEMICOLON',
+ 38: 'RIGHT_STATIC_CAST_BRACKETS',
+ 39: 'ELSE',
+ 40: 'LEFT_PARENTHESIS',
+ 41: 'EQUAL_SIGN',
+ 42: 'NUM',
+ 43: 'boolterm',
+ 44: 'expression',
+ 45: 'term',
+ 46: 'factor',
+ 47: 'boolexpr',
+ 48: 'boolfactor',
+ 49: 'NOT',
+ 50: 'STATIC_CAST',
+ 51: 'RIGHT_PARENTHESIS',
+ 52: 'ADDOP',
+ 53: 'RELOP',
+ 54: 'OR',
+ 55: 'AND',
+ 56: 'MULOP',
+ 57: 'LEFT_STATIC_CAST_BRACKETS',
+ 58: '__anon_star_2',
+ 59: 'caselist'}
+)
+parse_table.states = {s: {TOKEN_TYPES[t]: (a, RULES[x] if a is Reduce else x) for t, (a, x) in acts.items()}
+                      for s, acts in STATES.items()}
+parse_table.start_state = 0
+parse_table.end_state = 7
+class Lark_StandAlone:
+  def __init__(self, transformer=None, postlex=None):
+     callback = parse_tree_builder.create_callback(transformer=transformer)
+     callbacks = {rule: getattr(callback, rule.alias or rule.origin, None) for rule in RULES.values()}
+     self.parser = _Parser(parse_table, callbacks)
+     self.postlex = postlex
+  def parse(self, stream):
+     tokens = lex(stream)
+     sps = CON_LEXER.set_parser_state
+     if self.postlex: tokens = self.postlex.process(tokens)
+     return self.parser.parse(tokens, sps)
+GRAMMAR_HASH = "d28fbc36335858744a4fc82b8895aab9142e8dba"
@@ -2,73 +2,153 @@
 # Author: Nir Moshe.
 """
 apq.py usage:
-    python cpq.py <cpl_file>.cpl
+    python cpq.py [-O0 | -O1 | -O2] [--enable=<pass>] [--disable=<pass>] [--pass-statistics] <cpl_file>.cpl
 
 This script produces a new file <cpl_file>.qud which contains list of QUAD instructions.
 On errors the script will not create *.qud file and will write the errors to the STDERR.
 
+Options:
+    -O<level>           Optimization level (see optimizer.py), the default is -O0.
+    --enable=<pass>     Run the optimization pass even if the level doesn't include it (can be repeated).
+    --disable=<pass>    Don't run the optimization pass (can be repeated).
+    --pass-statistics   Write the time and the number of instructions of every optimization pass to the STDERR.
+
 Author: Nir Moshe.
 """
 import logging
 import os
 import sys
+import uuid
 
 from cla import CPLTokenizer, build_ast
-from exceptions import CPLCompoundException
-from ir import get_quad, get_ir
-from symbol_table import SymbolTable
+from ir import get_quad, get_ir_from_ast, get_ir_from_tokens, QUADStore
+from optimizer import PassManager
 
 __author__ = "Nir Moshe"
 
+SIGNATURE = "Nir Moshe, 300307824. Compilation Theory."
+
 
 def main():
-    if len(sys.argv) != 2:
+    try:
+        input_filename, pass_manager, print_pass_statistics = parse_arguments(sys.argv[1:])
+    except ValueError as e:
+        print(e)
         print(__doc__)
         sys.exit(1)
 
-    input_filename = sys.argv[1]
     input_filename_no_ext, _ = os.path.splitext(input_filename)
     stderr = logging.getLogger("stderr")
     stderr.addHandler(logging.StreamHandler(sys.stderr))
     stderr.setLevel(logging.INFO)
     with open(input_filename) as input_fd:
-        errors, quad = compiler(input_fd.read())
+        errors, quad = compiler(input_fd.read(), pass_manager=pass_manager)
+        if print_pass_statistics:
+            for statistics in pass_manager.statistics:
+                stderr.info(
+                    "%s: %d -> %d instructions in %.3f seconds." % (
+                        statistics.name, statistics.instructions_before, statistics.instructions_after,
+                        statistics.seconds
+                    )
+                )
+
         if not errors:
-            with open(input_filename_no_ext + ".qud", "w") as output_fd:
-                output_file = logging.getLogger("file_output")
-                output_file.addHandler(logging.StreamHandler(output_fd))
-                output_file.setLevel(logging.INFO)
-                for i in quad:
-                    output_file.info(i.code)
-
-                output_file.info("Nir Moshe, 300307824. Compilation Theory.")
+            write_quad_file(quad, input_filename_no_ext + ".qud")
         else:
             for error in errors:
                 stderr.error("Error in line: %d: %s." % (error.line, error.message))
 
-            stderr.info("Nir Moshe, 300307824. Compilation Theory.")
+            stderr.info(SIGNATURE)
 
 
-def compiler(cpl_string):
+def parse_arguments(arguments):
     """
-    The function simulates a CPL compiler.
+    :param arguments: The command line arguments (see the usage).
 
-    :param cpl_string: String which represent the CPL program.
-    :return pair of two lists (errors, quad).
+    :return: tuple of (input_filename, pass_manager, print_pass_statistics).
+    :raises ValueError: On invalid arguments.
+    """
+    input_filenames = []
+    level = 0
+    enabled = []
+    disabled = []
+    print_pass_statistics = False
+    for argument in arguments:
+        if argument.startswith("-O"):
+            try:
+                level = int(argument[2:])
+            except ValueError:
+                raise ValueError("Invalid optimization level: %s" % argument)
+        elif argument.startswith("--enable="):
+            enabled.append(argument[len("--enable="):])
+        elif argument.startswith("--disable="):
+            disabled.append(argument[len("--disable="):])
+        elif argument == "--pass-statistics":
+            print_pass_statistics = True
+        elif argument.startswith("-"):
+            raise ValueError("Unknown option: %s" % argument)
+        else:
+            input_filenames.append(argument)
+
+    if len(input_filenames) != 1:
+        raise ValueError("Expected a single CPL file.")
+
+    return input_filenames[0], PassManager(level, enabled, disabled), print_pass_statistics
+
+
+def write_quad_file(quad, output_filename):
     """
-    quad = []
-    errors, ast = build_ast(CPLTokenizer(cpl_string))
-    if errors and not ast:
-        return errors, []
+    Writes the QUAD code and the signature line in a single buffered write. The code is written to a temporary file
+    which is renamed to `output_filename` only when it is complete, so a failed run never leaves a partial .qud file.
 
+    :param quad: `QUADStore`.
+    :param output_filename: Path of the .qud file.
+    """
+    temp_filename = "%s.%s.tmp" % (output_filename, uuid.uuid4().hex)
+    # The kernel applies the umask to the mode, as for a file created by `open`.
+    fd = os.open(temp_filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
     try:
-        _errors, symbol_table = SymbolTable.build_form_ast(ast)
+        with os.fdopen(fd, "w") as output_fd:
+            output_fd.writelines(line + "\n" for line in quad.get_lines())
+            output_fd.write(SIGNATURE + "\n")
+
+        os.replace(temp_filename, output_filename)
+    except BaseException:
+        os.remove(temp_filename)
+        raise
+
+
+def compiler(cpl_string, inline=True, pass_manager=None, lazy=False):
+    """
+    The function simulates a CPL compiler.
+
+    :param cpl_string: String which represent the CPL program.
+    :param inline: Generate the IR while parsing (see `get_ir_from_tokens`), instead of building the AST and walking
+        it (once - the symbol table is built in the same pass, see `get_ir_from_ast`).
+    :param pass_manager: `optimizer.PassManager` which optimizes the IR (no optimizations if None).
+    :param lazy: Tokenize the program while parsing it (see `CPLTokenizer`). The compilation stops on the first
+        syntax error, so the invalid symbols after it aren't reported. The command line compiler reports all of
+        them, so it doesn't use it.
+    :return pair of (errors, quad) - list of the errors and `QUADStore`.
+    """
+    tokenizer = CPLTokenizer(cpl_string, lazy=lazy)
+    if inline:
+        errors, ir = get_ir_from_tokens(tokenizer)
+    else:
+        errors, ast = build_ast(tokenizer)
+        if errors and not ast:
+            return errors, QUADStore()
+
+        _errors, ir = get_ir_from_ast(ast)
         errors.extend(_errors)
-        quad = get_quad(get_ir(ast, symbol_table))
-    except CPLCompoundException as exception:
-        errors.extend(exception.exceptions)
 
-    return errors, quad
+    if ir is None:
+        return errors, QUADStore()
+
+    if pass_manager is not None:
+        ir = pass_manager.run(ir)
+
+    return errors, get_quad(ir)
 
 
 if __name__ == "__main__":
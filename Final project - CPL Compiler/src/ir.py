@@ -4,11 +4,13 @@
 CPL IR: Transforms CPL's AST into IR and then to QUAD code.
 """
 import abc
+from array import array
+from enum import IntEnum
 
-from lark.visitors import Transformer
-
+from cla import build_ast
+from cpl_lark import Transformer, transform_iteratively
 from exceptions import CPLException, CPLCompoundException
-from symbol_table import SymbolTable, Types
+from symbol_table import SymbolAlreadyExistsError, SymbolTable, Types
 
 __author__ = "Nir Moshe"
 
@@ -19,79 +21,113 @@ class SemanticError(CPLException):
         CPLException.__init__(self, line, "Semantic error: " + message)
 
 
-class TemporaryVariables(object):
-    variables_counter = 0
+class CompilationContext(object):
+    """
+    The state of a single compilation - the numbering of its temporary variables and labels. Every compilation has its
+    own context (see `CPLTransformer`), so compilations can run concurrently, e.g. `cpq.compiler` in a thread pool.
+    """
+    __slots__ = ("variables_counter", "labels_counter")
 
-    @staticmethod
-    def get_new_temporary_variable():
-        TemporaryVariables.variables_counter += 1
-        return "t%d" % TemporaryVariables.variables_counter
+    def __init__(self):
+        self.variables_counter = 0
+        self.labels_counter = 0
 
-    @staticmethod
-    def reset():
-        TemporaryVariables.variables_counter = 0
+    def get_new_temporary_variable(self):
+        self.variables_counter += 1
+        return "t%d" % self.variables_counter
+
+    def get_new_label(self, prefix=""):
+        label = Label("%s_label_%d" % (prefix, self.labels_counter))
+        self.labels_counter += 1
+        return label
 
 
 class Label(object):
-    labels_counter = 0
+    __slots__ = ("name",)
 
-    def __init__(self, prefix=""):
-        self.name = "%s_label_%d" % (prefix, Label.labels_counter)
-        Label.labels_counter += 1
+    def __init__(self, name):
+        self.name = name
 
     @property
     def code(self):
         return self.name + ":"
 
-    @staticmethod
-    def reset():
-        Label.labels_counter = 0
+
+class Opcode(IntEnum):
+    """The QUAD instructions. Their values are stored in `QUADStore.opcodes`."""
+    IMLT = 0
+    RMLT = 1
+    IDIV = 2
+    RDIV = 3
+    IADD = 4
+    RADD = 5
+    ISUB = 6
+    RSUB = 7
+    IEQL = 8
+    REQL = 9
+    INQL = 10
+    RNQL = 11
+    IGRT = 12
+    RGRT = 13
+    ILSS = 14
+    RLSS = 15
+    IINP = 16
+    RINP = 17
+    IPRT = 18
+    RPRT = 19
+    IASN = 20
+    RASN = 21
+    ITOR = 22
+    RTOI = 23
+    JMPZ = 24
+    JUMP = 25
+    HALT = 26
 
 
 class QUADInstruction(object):
+    __slots__ = ("dest", "op1", "op2", "type", "operator")
+
     QUAD_OPERATORS_TABLE = {
-        ("*", Types.INT): "IMLT",
-        ("*", Types.FLOAT): "RMLT",
-        ("/", Types.INT): "IDIV",
-        ("/", Types.FLOAT): "RDIV",
-        ("+", Types.INT): "IADD",
-        ("+", Types.FLOAT): "RADD",
-        ("-", Types.INT): "ISUB",
-        ("-", Types.FLOAT): "RSUB",
-        ("==", Types.INT): "IEQL",
-        ("==", Types.FLOAT): "REQL",
-        ("!=", Types.INT): "INQL",
-        ("!=", Types.FLOAT): "RNQL",
-        (">", Types.INT): "IGRT",
-        (">", Types.FLOAT): "RGRT",
-        ("<", Types.INT): "ILSS",
-        ("<", Types.FLOAT): "RLSS",
-        ("READ", Types.INT): "IINP",
-        ("READ", Types.FLOAT): "RINP",
-        ("WRITE", Types.INT): "IPRT",
-        ("WRITE", Types.FLOAT): "RPRT",
-        ("=", Types.INT): "IASN",
-        ("=", Types.FLOAT): "RASN",
-        ("CAST_TO_REAL", Types.INT): "ITOR",
-        ("CAST_TO_INT", Types.FLOAT): "RTOI",
-        ("conditional_jump", Types.INT): "JMPZ",
-        ("jump", Types.INT): "JUMP",
-        ("halt", Types.INT): "HALT"
+        ("*", Types.INT): Opcode.IMLT,
+        ("*", Types.FLOAT): Opcode.RMLT,
+        ("/", Types.INT): Opcode.IDIV,
+        ("/", Types.FLOAT): Opcode.RDIV,
+        ("+", Types.INT): Opcode.IADD,
+        ("+", Types.FLOAT): Opcode.RADD,
+        ("-", Types.INT): Opcode.ISUB,
+        ("-", Types.FLOAT): Opcode.RSUB,
+        ("==", Types.INT): Opcode.IEQL,
+        ("==", Types.FLOAT): Opcode.REQL,
+        ("!=", Types.INT): Opcode.INQL,
+        ("!=", Types.FLOAT): Opcode.RNQL,
+        (">", Types.INT): Opcode.IGRT,
+        (">", Types.FLOAT): Opcode.RGRT,
+        ("<", Types.INT): Opcode.ILSS,
+        ("<", Types.FLOAT): Opcode.RLSS,
+        ("READ", Types.INT): Opcode.IINP,
+        ("READ", Types.FLOAT): Opcode.RINP,
+        ("WRITE", Types.INT): Opcode.IPRT,
+        ("WRITE", Types.FLOAT): Opcode.RPRT,
+        ("=", Types.INT): Opcode.IASN,
+        ("=", Types.FLOAT): Opcode.RASN,
+        ("CAST_TO_REAL", Types.INT): Opcode.ITOR,
+        ("CAST_TO_INT", Types.FLOAT): Opcode.RTOI,
+        ("conditional_jump", Types.INT): Opcode.JMPZ,
+        ("jump", Types.INT): Opcode.JUMP,
+        ("halt", Types.INT): Opcode.HALT
     }
 
     def __init__(self, dest, op1, op2, operator, type):
         self.dest, self.op1, self.op2, self.type = dest, op1, op2, type
         self.operator = operator
 
+    @property
+    def opcode(self):
+        return self.QUAD_OPERATORS_TABLE[(self.operator, self.type)]
+
     @property
     def code(self):
-        inst = "%s %s %s %s" % (
-            self.QUAD_OPERATORS_TABLE[(self.operator, self.type)],
-            self.dest,
-            self.op1,
-            self.op2
-        )
-        return inst.strip()
+        return get_quad_line(self.opcode, self.dest, self.op1, self.op2)
 
     @classmethod
     def get_not(cls, dest, op1, type):
@@ -113,6 +149,161 @@ class QUADInstruction(object):
         return cls("UNDEF", "", "", "jump", Types.INT)
 
 
+def get_quad_line(opcode, dest, op1, op2):
+    """
+    :return: String, the text of the QUAD instruction (as written to the .qud file).
+    """
+    return ("%s %s %s %s" % (opcode.name, dest, op1, op2)).strip()
+
+
+class QUADStore(object):
+    """
+    Compact storage for a QUAD program. Every instruction is a row in typed arrays - its opcode (`Opcode`) and the
+    codes of its operands in the interned operands table (the jumps' destinations are line numbers, so they are
+    operands as well). The text of an instruction is produced only when it is requested (see `get_lines`) - the
+    optimizer works on the IR before the store is built, and the QUAD simulator (`interpret_quad_store` in
+    resources/quad_simulator.py) reads the rows with `get_instruction`.
+    """
+    __slots__ = ("operands", "operands_codes", "opcodes", "dests", "ops1", "ops2")
+
+    def __init__(self):
+        self.operands = []
+        self.operands_codes = {}
+        self.opcodes = array("B")
+        self.dests = array("I")
+        self.ops1 = array("I")
+        self.ops2 = array("I")
+
+    def get_operand_code(self, operand):
+        # 1 and 1.0 are different operands, so the floats' type is a part of their key.
+        key = (float, operand) if type(operand) == float else operand
+        code = self.operands_codes.get(key)
+        if code is None:
+            code = self.operands_codes[key] = len(self.operands)
+            self.operands.append(operand)
+
+        return code
+
+    def append(self, opcode, dest, op1, op2):
+        self.opcodes.append(opcode)
+        self.dests.append(self.get_operand_code(dest))
+        self.ops1.append(self.get_operand_code(op1))
+        self.ops2.append(self.get_operand_code(op2))
+
+    def set_dest(self, index, dest):
+        self.dests[index] = self.get_operand_code(dest)
+
+    def get_instruction(self, index):
+        """
+        :return: tuple of (opcode, dest, op1, op2) of the instruction in `index` (0 based).
+        """
+        operands = self.operands
+        return (
+            Opcode(self.opcodes[index]),
+            operands[self.dests[index]],
+            operands[self.ops1[index]],
+            operands[self.ops2[index]]
+        )
+
+    def get_lines(self):
+        """
+        :return: Generator of the instructions' text, in order.
+        """
+        operands = self.operands
+        for opcode, dest, op1, op2 in zip(self.opcodes, self.dests, self.ops1, self.ops2):
+            yield get_quad_line(Opcode(opcode), operands[dest], operands[op1], operands[op2])
+
+    def __len__(self):
+        return len(self.opcodes)
+
+
+class Code(object):
+    """
+    IR code fragment - a rope of instructions. Joining fragments (`+`) is O(1), the result just points at the joined
+    fragments, so the instructions are never copied - the program's rope is iterated once, by `get_quad`.
+    """
+    __slots__ = ("parts",)
+
+    def __init__(self, *parts):
+        # Every part is a `Code` or a list of instructions.
+        self.parts = parts
+
+    def __add__(self, other):
+        return Code(self, other)
+
+    def __radd__(self, other):
+        return Code(other, self)
+
+    def __iter__(self):
+        # The rope is as deep as the program's nesting, so it's walked without recursion.
+        stack = [iter(self.parts)]
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, Code):
+                    stack.append(iter(part.parts))
+                    break
+
+                for instruction in part:
+                    yield instruction
+            else:
+                stack.pop()
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+
+class PatchList(object):
+    """
+    Backpatch list - the jumps of the `break`/`continue` statements which wait for their target label. Merging lists
+    (`+`) is O(1) and empty lists are never kept, so walking a list costs only its jumps. Every list is patched once,
+    by the statement which owns the target (see `WhileStmt` and `SwitchStmt`).
+    """
+    __slots__ = ("parts",)
+
+    def __init__(self, *parts):
+        # Every part is a non empty `PatchList` or a `break`/`continue` statement.
+        self.parts = parts
+
+    def __bool__(self):
+        return bool(self.parts)
+
+    def __add__(self, other):
+        if not other:
+            return self
+
+        if not self:
+            return other
+
+        return PatchList(self, other)
+
+    def __iter__(self):
+        stack = [iter(self.parts)]
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, PatchList):
+                    stack.append(iter(part.parts))
+                    break
+
+                yield part
+            else:
+                stack.pop()
+
+    def patch(self, label):
+        """
+        :param label: `Label`, the target of all the jumps in the list.
+        """
+        for statement in self:
+            statement.jump.dest = label.name
+
+
+EMPTY_PATCH_LIST = PatchList()
+
+
 def handle_semantic_error(func):
     def wraps(self, tree):
         cpl_object = func(self, tree)
@@ -127,34 +318,69 @@ def handle_semantic_error(func):
 class CPLTransformer(Transformer):
     """
     Iterates over the AST bottom to top. Implements the "visitor" design pattern.
+
+    Without a symbol table, the transformer builds it from the declarations. In CPL the declarations come before the
+    statements, so the symbol table is completed before the first statement is transformed (or reduced, see
+    `get_ir_from_tokens`).
+
+    The temporary variables and the labels are numbered by the transformer's `CompilationContext` - a new one unless
+    `context` is given.
     """
-    def __init__(self, symbol_table):
-        self.symbol_table = symbol_table
+    def __init__(self, symbol_table=None, context=None):
+        self.context = CompilationContext() if context is None else context
+        self.builds_symbol_table = symbol_table is None
+        self.symbol_table = SymbolTable() if self.builds_symbol_table else symbol_table
+        self.symbol_table_errors = []
         self.errors = []
 
+    def idlist(self, tree):
+        # The IDs are separated by commas.
+        return tree[::2]
+
+    def declaration(self, tree):
+        if not self.builds_symbol_table:
+            return None
+
+        ids, _, declaration_type, _ = tree
+        for token in ids:
+            try:
+                self.symbol_table.add_symbol(name=token.value, type=declaration_type, line=token.line)
+            except SymbolAlreadyExistsError as exception:
+                self.symbol_table_errors.append(exception)
+
+    def declarations(self, tree):
+        return None
+
+    def transform(self, tree):
+        """
+        Transforms the tree without recursion (see `cpl_lark.transform_iteratively`), so deeply nested blocks and
+        expressions don't hit the recursion limit.
+        """
+        return transform_iteratively(self, tree)
+
     @handle_semantic_error
     def factor(self, tree):
         return Factor(tree, self.symbol_table)
 
     @handle_semantic_error
     def term(self, tree):
-        return Term(tree)
+        return Term(tree, self.context)
 
     @handle_semantic_error
     def expression(self, tree):
-        return Expression(tree)
+        return Expression(tree, self.context)
 
     @handle_semantic_error
     def boolfactor(self, tree):
-        return BoolFactor(tree)
+        return BoolFactor(tree, self.context)
 
     @handle_semantic_error
     def boolterm(self, tree):
-        return BoolTerm(tree)
+        return BoolTerm(tree, self.context)
 
     @handle_semantic_error
     def boolexpr(self, tree):
-        return BoolExpr(tree)
+        return BoolExpr(tree, self.context)
 
     @handle_semantic_error
     def input_stmt(self, tree):
@@ -178,7 +404,7 @@ class CPLTransformer(Transformer):
 
     @handle_semantic_error
     def if_stmt(self, tree):
-        return IfStmt(tree)
+        return IfStmt(tree, self.context)
 
     @handle_semantic_error
     def stmt(self, tree):
@@ -202,7 +428,7 @@ class CPLTransformer(Transformer):
 
     @handle_semantic_error
     def while_stmt(self, tree):
-        return WhileStmt(tree)
+        return WhileStmt(tree, self.context)
 
     @handle_semantic_error
     def caselist(self, tree):
@@ -210,7 +436,7 @@ class CPLTransformer(Transformer):
 
     @handle_semantic_error
     def switch_stmt(self, tree):
-        return SwitchStmt(tree)
+        return SwitchStmt(tree, self.context)
 
     @handle_semantic_error
     def start(self, tree):
@@ -222,8 +448,14 @@ class CPLObject(object):
     Base object for CPL expressions. Every type of expression should inherit from this class.
     The class contains set of functions/tools which might be useful, most of them solve common problems during the IR
     generation.
+
+    The IR objects are created for every node of the program, so all of them are slotted. `CPLObject` is also mixed
+    into statements, so it has no slots of its own: the expressions declare `EXPRESSION_SLOTS`. (`errors` is set only
+    when there are semantic errors, see `handle_semantic_error`.)
     """
     __metaclass__ = abc.ABCMeta
+    __slots__ = ()
+    EXPRESSION_SLOTS = ("type", "value", "code", "errors")
 
     def get_node_type(self):
         return self.NODE_TYPE
@@ -240,24 +472,24 @@ class CPLObject(object):
         self.value = subtree[index].value
         self.code = subtree[index].code
 
-    def handle_binary_operation(self, subtree):
+    def handle_binary_operation(self, subtree, context):
         left = subtree[0]
         operator_token = subtree[1].value
         right = subtree[2]
-        self.handle_binary_operation_default_values(subtree)
-        self.code.append(QUADInstruction(self.value, left.value, right.value, operator_token, self.type))
+        self.handle_binary_operation_default_values(subtree, context)
+        self.code += [QUADInstruction(self.value, left.value, right.value, operator_token, self.type)]
 
-    def handle_binary_operation_default_values(self, subtree):
+    def handle_binary_operation_default_values(self, subtree, context):
         left = subtree[0]
         right = subtree[2]
-        self.value = TemporaryVariables.get_new_temporary_variable()
+        self.value = context.get_new_temporary_variable()
 
         if left.type == right.type:
             self.type = left.type
             conversion_code = []
         else:
             self.type = Types.FLOAT
-            temp = TemporaryVariables.get_new_temporary_variable()
+            temp = context.get_new_temporary_variable()
             if left.type == Types.INT:
                 conversion_code = [QUADInstruction(temp, left.value, "", "CAST_TO_REAL", Types.INT)]
                 left.value = temp
@@ -273,16 +505,21 @@ class CPLObject(object):
 
 
 class CPLStatement(object):
+    __slots__ = ("breaks", "continues", "code", "errors")
+
     def __init__(self):
-        self.breaks = set()
-        self.continues = set()
+        # The jumps which are not patched yet (see `PatchList`).
+        self.breaks = EMPTY_PATCH_LIST
+        self.continues = EMPTY_PATCH_LIST
 
     def add_properties(self, stmt):
-        self.breaks = self.breaks.union(stmt.breaks)
-        self.continues = self.continues.union(stmt.continues)
+        self.breaks += stmt.breaks
+        self.continues += stmt.continues
 
 
 class Program(CPLStatement):
+    __slots__ = ()
+
     def __init__(self, tree):
         CPLStatement.__init__(self)
         self.add_properties(tree[1])
@@ -313,7 +550,9 @@ class SwitchStmt(CPLStatement):
         default: default.code
         end_switch:
     """
-    def __init__(self, tree):
+    __slots__ = ()
+
+    def __init__(self, tree, context):
         CPLStatement.__init__(self)
         condition = tree[2]
         caselist = tree[5]
@@ -324,61 +563,60 @@ class SwitchStmt(CPLStatement):
                 message="Invalid switch condition! the condition must be integer!"
             )]
 
-        self.continues = default_stmt.continues.union(caselist.continues)
+        self.continues = caselist.continues + default_stmt.continues
         cases = caselist.cases
 
-        labels = {num: Label("case_%d" % num) for num in cases}
-        end_label = Label("end_switch")
-        default_label = Label("default")
+        labels = {num: context.get_new_label("case_%d" % num) for num in cases}
+        end_label = context.get_new_label("end_switch")
+        default_label = context.get_new_label("default")
         cases_code = []
         ordered_cases = list(cases.items())
         for i, (case_condition, stmt) in enumerate(ordered_cases):
-            temp = TemporaryVariables.get_new_temporary_variable()
-            cases_code.append(labels[case_condition])
-            cases_code.append(QUADInstruction(temp, condition.value, case_condition, "==", Types.INT))
+            temp = context.get_new_temporary_variable()
             if i + 1 < len(ordered_cases):
                 next_state, _ = ordered_cases[i + 1]
-                cases_code.append(QUADInstruction.get_conditional_jump(temp, labels[next_state]))
+                next_case_label = labels[next_state]
             else:
-                cases_code.append(QUADInstruction.get_conditional_jump(temp, default_label))
-
-            cases_code += stmt.code
-            cases_code.append(QUADInstruction.get_jump(end_label))
+                next_case_label = default_label
+
+            cases_code.append(
+                [
+                    labels[case_condition],
+                    QUADInstruction(temp, condition.value, case_condition, "==", Types.INT),
+                    QUADInstruction.get_conditional_jump(temp, next_case_label)
+                ] +
+                stmt.code +
+                [QUADInstruction.get_jump(end_label)]
+            )
 
-        self.code = (condition.code + cases_code + [default_label] + default_stmt.code + [end_label])
-        for _break in caselist.breaks.union(default_stmt.breaks):
-            _break.label = end_label
+        self.code = (condition.code + Code(*cases_code) + [default_label] + default_stmt.code + [end_label])
+        (caselist.breaks + default_stmt.breaks).patch(end_label)
 
 
 class Caselist(CPLStatement):
+    __slots__ = ("cases",)
+
     def __init__(self, tree, symbol_table):
         CPLStatement.__init__(self)
         self.cases = {}
-        if isinstance(tree[0], Caselist):
-            caselist = tree[0]
-            self.add_properties(caselist)
-            self.add_properties(tree[4])
-            num = Factor([tree[2]], symbol_table)
+        self.errors = []
+        # Every case is: CASE NUM COLON stmtlist.
+        for i in range(0, len(tree), 4):
+            case_token, num_token, stmtlist = tree[i], tree[i + 1], tree[i + 3]
+            self.add_properties(stmtlist)
+            num = Factor([num_token], symbol_table)
             if num.type != Types.INT:
-                self.errors = [
-                    SemanticError(line=tree[1].line, message="switch case type must be integer!")
-                ]
+                self.errors.append(SemanticError(line=case_token.line, message="switch case type must be integer!"))
 
-            self.cases.update(caselist.cases)
             if num.value in self.cases:
-                error = SemanticError(
-                    line=tree[1].line,
+                self.errors.append(SemanticError(
+                    line=case_token.line,
                     message="Duplicate cases (%d) in the same switch!" % num.value
-                )
-                if hasattr(self, "errors"):
-                    self.errors.append(error)
-                else:
-                    self.errors = [error]
+                ))
 
-            self.cases[num.value] = tree[4]
-            self.code = caselist.code + tree[4].code
-        else:
-            self.code = []
+            self.cases[num.value] = stmtlist
+
+        self.code = Code(*[tree[i + 3].code for i in range(0, len(tree), 4)])
 
 
 class WhileStmt(CPLStatement):
@@ -393,10 +631,12 @@ class WhileStmt(CPLStatement):
         end_while_label:
 
     """
-    def __init__(self, tree):
+    __slots__ = ()
+
+    def __init__(self, tree, context):
         CPLStatement.__init__(self)
-        condition_label = Label("condition")
-        end_while_label = Label("end_while")
+        condition_label = context.get_new_label("condition")
+        end_while_label = context.get_new_label("end_while")
         condition = tree[2]
         self.code = (
                 [condition_label] +
@@ -406,25 +646,24 @@ class WhileStmt(CPLStatement):
                 [QUADInstruction.get_jump(condition_label), end_while_label]
         )
 
-        for _break in tree[4].breaks:
-            _break.label = end_while_label
-
-        for _continue in tree[4].continues:
-            _continue.label = condition_label
+        tree[4].breaks.patch(end_while_label)
+        tree[4].continues.patch(condition_label)
 
 
 class StmtList(CPLStatement):
+    __slots__ = ()
+
     def __init__(self, tree):
         CPLStatement.__init__(self)
-        if isinstance(tree[0], StmtList):
-            self.add_properties(tree[0])
-            self.add_properties(tree[1])
-            self.code = tree[0].code + tree[1].code
-        else:
-            self.code = []
+        for stmt in tree:
+            self.add_properties(stmt)
+
+        self.code = Code(*[stmt.code for stmt in tree])
 
 
 class StmtBlock(CPLStatement):
+    __slots__ = ()
+
     def __init__(self, tree):
         CPLStatement.__init__(self)
         self.add_properties(tree[1])
@@ -432,36 +671,32 @@ class StmtBlock(CPLStatement):
 
 
 class ContinueStmt(CPLStatement):
+    __slots__ = ("line", "jump")
+
     def __init__(self, tree):
         CPLStatement.__init__(self)
-        self.label = None
         self.line = tree[0].line
-        self.continues.add(self)
-
-    @property
-    def code(self):
-        if self.label:
-            return [QUADInstruction.get_jump(self.label)]
-        else:
-            return [self]
+        # The target is patched by the enclosing statement.
+        self.jump = QUADInstruction.get_jump(None)
+        self.code = [self.jump]
+        self.continues = PatchList(self)
 
 
 class BreakStmt(CPLStatement):
+    __slots__ = ("line", "jump")
+
     def __init__(self, tree):
         CPLStatement.__init__(self)
-        self.label = None
         self.line = tree[0].line
-        self.breaks.add(self)
-
-    @property
-    def code(self):
-        if self.label:
-            return [QUADInstruction.get_jump(self.label)]
-        else:
-            return [self]
+        # The target is patched by the enclosing statement.
+        self.jump = QUADInstruction.get_jump(None)
+        self.code = [self.jump]
+        self.breaks = PatchList(self)
 
 
 class Stmt(CPLStatement):
+    __slots__ = ()
+
     def __init__(self, tree):
         CPLStatement.__init__(self)
         self.code = tree[0].code
@@ -481,15 +716,17 @@ class IfStmt(CPLStatement):
         end_if_label:
 
     """
-    def __init__(self, tree):
+    __slots__ = ()
+
+    def __init__(self, tree, context):
         CPLStatement.__init__(self)
         boolexpr = tree[2]
         true_stmt = tree[4]
         false_stmt = tree[6]
         self.add_properties(true_stmt)
         self.add_properties(false_stmt)
-        else_label = Label("else")
-        end_if_label = Label("endif")
+        else_label = context.get_new_label("else")
+        end_if_label = context.get_new_label("endif")
         self.code = (
                 boolexpr.code +
                 [QUADInstruction.get_conditional_jump(boolexpr.value, else_label)] +
@@ -502,6 +739,7 @@ class IfStmt(CPLStatement):
 
 class CastStmt(CPLObject, CPLStatement):
     NODE_TYPE = "cast_stmt"
+    __slots__ = ("type", "value")
 
     def __init__(self, tree, symbol_table):
         CPLStatement.__init__(self)
@@ -514,17 +752,19 @@ class CastStmt(CPLObject, CPLStatement):
                 SemanticError(line=tree[1].line, message="Invalid static_cast! can't assign float to int!")
             ]
 
-        self.code = expression.code
         if expression.type == Types.INT and self.type == Types.FLOAT:
-            self.code.append(QUADInstruction(self.value, expression.value, "", "CAST_TO_REAL", Types.INT))
+            cast = QUADInstruction(self.value, expression.value, "", "CAST_TO_REAL", Types.INT)
         elif expression.type == Types.FLOAT and self.type == Types.INT:
-            self.code.append(QUADInstruction(self.value, expression.value, "", "CAST_TO_INT", Types.FLOAT))
+            cast = QUADInstruction(self.value, expression.value, "", "CAST_TO_INT", Types.FLOAT)
         else:
-            self.code.append(QUADInstruction(self.value, expression.value, "", "=", self.type))
+            cast = QUADInstruction(self.value, expression.value, "", "=", self.type)
+
+        self.code = expression.code + [cast]
 
 
 class AssignmentStmt(CPLObject, CPLStatement):
     NODE_TYPE = "AssignmentStmt"
+    __slots__ = ("type", "value")
 
     def __init__(self, tree, symbol_table):
         CPLStatement.__init__(self)
@@ -542,60 +782,64 @@ class AssignmentStmt(CPLObject, CPLStatement):
 
 class OutputStatement(CPLObject, CPLStatement):
     NODE_TYPE = "output_stmt"
+    __slots__ = ("type", "value")
 
     def __init__(self, tree):
         CPLStatement.__init__(self)
         self.copy_properties_of_node(tree, index=2)
-        self.code.append(QUADInstruction(self.value, "", "", "WRITE", self.type))
+        self.code += [QUADInstruction(self.value, "", "", "WRITE", self.type)]
 
 
 class InputStatement(CPLObject, CPLStatement):
     NODE_TYPE = "input_stmt"
+    __slots__ = ("type", "value")
 
     def __init__(self, tree, symbol_table):
         CPLStatement.__init__(self)
         tree[2] = Factor([tree[2]], symbol_table)
         self.copy_properties_of_node(tree, index=2)
-        self.code = [QUADInstruction(self.value, "", "", "READ", self.type)]
+        self.code = Code([QUADInstruction(self.value, "", "", "READ", self.type)])
 
 
 class BoolExpr(CPLObject):
     NODE_TYPE = "boolexpr"
+    __slots__ = CPLObject.EXPRESSION_SLOTS
 
-    def __init__(self, tree):
+    def __init__(self, tree, context):
         if self.get_subtree_node_type(tree) == BoolTerm.NODE_TYPE:
             self.copy_properties_of_node(tree)
         else:
-            self.handle_or(tree)
+            self.handle_or(tree, context)
 
-    def handle_or(self, subtree):
+    def handle_or(self, subtree, context):
         """
         Generates "||" by replacing the operator with the following snippet:
             (a || b) -> (a + b > 0)
         """
         left = subtree[0]
         right = subtree[2]
-        self.handle_binary_operation_default_values(subtree)
+        self.handle_binary_operation_default_values(subtree, context)
         self.code += QUADInstruction.get_or(self.value, left.value, right.value)
 
 
 class BoolTerm(CPLObject):
     NODE_TYPE = "boolterm"
+    __slots__ = CPLObject.EXPRESSION_SLOTS
 
-    def __init__(self, tree):
+    def __init__(self, tree, context):
         if self.get_subtree_node_type(tree) == BoolFactor.NODE_TYPE:
             self.copy_properties_of_node(tree)
         else:
-            self.handle_and(tree)
+            self.handle_and(tree, context)
 
-    def handle_and(self, subtree):
+    def handle_and(self, subtree, context):
         """
         Generates "&&" by replacing the operator with the following snippet:
             (a && b) -> ((a == 1) == b)
         """
         left = subtree[0]
         right = subtree[2]
-        self.handle_binary_operation_default_values(subtree)
+        self.handle_binary_operation_default_values(subtree, context)
         self.code += [
             QUADInstruction(self.value, left.value, 1, "==", self.type),
             QUADInstruction(self.value, right.value, self.value, "==", self.type)
@@ -604,16 +848,17 @@ class BoolTerm(CPLObject):
 
 class BoolFactor(CPLObject):
     NODE_TYPE = "boolfactor"
+    __slots__ = CPLObject.EXPRESSION_SLOTS
 
-    def __init__(self, tree):
+    def __init__(self, tree, context):
         if self.get_subtree_node_type(tree) == Expression.NODE_TYPE:
             operator = tree[1].value
             if operator == ">=":
-                self.handle_larger_or_equal(tree)
+                self.handle_larger_or_equal(tree, context)
             elif operator == "<=":
-                self.handle_smaller_or_equal(tree)
+                self.handle_smaller_or_equal(tree, context)
             else:
-                self.handle_binary_operation(tree)
+                self.handle_binary_operation(tree, context)
         else:
             self.handle_boolexpression(tree)
 
@@ -629,33 +874,33 @@ class BoolFactor(CPLObject):
         """
 
         self.copy_properties_of_node(tree, index=2)
-        self.code.append(QUADInstruction.get_not(self.value, self.value, self.type))
+        self.code += [QUADInstruction.get_not(self.value, self.value, self.type)]
 
-    def handle_larger_or_equal(self, subtree):
+    def handle_larger_or_equal(self, subtree, context):
         """
         Generates ">=" by replacing the operator with the following snippet:
             (a >= b) -> ((a > b) || (a == b))
         """
         left = subtree[0]
         right = subtree[2]
-        self.handle_binary_operation_default_values(subtree)
-        self.value = TemporaryVariables.get_new_temporary_variable()
-        temp = TemporaryVariables.get_new_temporary_variable()
+        self.handle_binary_operation_default_values(subtree, context)
+        self.value = context.get_new_temporary_variable()
+        temp = context.get_new_temporary_variable()
         self.code += [
             QUADInstruction(temp, left.value, right.value, "==", self.type),
             QUADInstruction(self.value, left.value, right.value, ">", self.type)
         ] + QUADInstruction.get_or(self.value, self.value, temp)
 
-    def handle_smaller_or_equal(self, subtree):
+    def handle_smaller_or_equal(self, subtree, context):
         """
         Generates "<=" by replacing the operator with the following snippet:
             (a <= b) -> ((a < b) || (a == b))
         """
         left = subtree[0]
         right = subtree[2]
-        self.handle_binary_operation_default_values(subtree)
-        self.value = TemporaryVariables.get_new_temporary_variable()
-        temp = TemporaryVariables.get_new_temporary_variable()
+        self.handle_binary_operation_default_values(subtree, context)
+        self.value = context.get_new_temporary_variable()
+        temp = context.get_new_temporary_variable()
         self.code += [
             QUADInstruction(temp, left.value, right.value, "==", self.type),
             QUADInstruction(self.value, left.value, right.value, "<", self.type)
@@ -664,26 +909,29 @@ class BoolFactor(CPLObject):
 
 class Expression(CPLObject):
     NODE_TYPE = "expression"
+    __slots__ = CPLObject.EXPRESSION_SLOTS
 
-    def __init__(self, subtree):
+    def __init__(self, subtree, context):
         if self.get_subtree_node_type(subtree) == Term.NODE_TYPE:
             self.copy_properties_of_node(subtree)
         else:
-            self.handle_binary_operation(subtree)
+            self.handle_binary_operation(subtree, context)
 
 
 class Term(CPLObject):
     NODE_TYPE = "term"
+    __slots__ = CPLObject.EXPRESSION_SLOTS
 
-    def __init__(self, subtree):
+    def __init__(self, subtree, context):
         if self.get_subtree_node_type(subtree) == Factor.NODE_TYPE:
             self.copy_properties_of_node(subtree)
         else:
-            self.handle_binary_operation(subtree)
+            self.handle_binary_operation(subtree, context)
 
 
 class Factor(CPLObject):
     NODE_TYPE = "factor"
+    __slots__ = CPLObject.EXPRESSION_SLOTS
 
     def __init__(self, ast_subtree, symbol_table):
         first_token = ast_subtree[0]
@@ -699,7 +947,7 @@ class Factor(CPLObject):
         self.value = (
             float(ast_subtree[0].value) if self.type == Types.FLOAT else int(ast_subtree[0].value)
         )
-        self.code = []
+        self.code = Code()
 
     def handle_id(self, ast_subtree, symbol_table):
         symbol = symbol_table.get_symbol(ast_subtree[0].value)
@@ -712,12 +960,12 @@ class Factor(CPLObject):
             ]
             self.type = None
             self.value = ast_subtree[0].value
-            self.code = []
+            self.code = Code()
             return
 
         self.type = symbol.type
         self.value = symbol.name
-        self.code = []
+        self.code = Code()
 
     @staticmethod
     def get_num_type(number):
@@ -729,45 +977,110 @@ class Factor(CPLObject):
 
 def get_ir(cpl_ast, symbol_table):
     """Transforms the CPL AST into IR."""
-    Label.reset()
-    TemporaryVariables.reset()
     transformer = CPLTransformer(symbol_table)
     ir_tree = transformer.transform(cpl_ast)
     if transformer.errors:
         raise CPLCompoundException(transformer.errors)
 
-    ir = []
-    for instruction in ir_tree.code:
-        if type(instruction) in (BreakStmt, ContinueStmt):
-            ir.append(instruction.code[0])
-        else:
-            ir.append(instruction)
+    return get_program_ir(ir_tree)
 
-    return ir
+
+def get_ir_from_ast(cpl_ast):
+    """
+    Builds the symbol table and the IR in a single pass over the AST.
+
+    :param cpl_ast: The CPL AST (see `cla.build_ast`).
+
+    :return: pair of (errors, ir). The errors are ordered like `cpq.compiler` reports them: the symbol table errors
+        and then the semantic errors. The ir is None if there are errors.
+    """
+    transformer = CPLTransformer()
+    return get_transformer_ir(transformer, transformer.transform(cpl_ast), [])
+
+
+def get_ir_from_tokens(tokens):
+    """
+    Parses the tokens straight into IR - the `CPLTransformer` callbacks are called at reduce time (see
+    `cla.build_ast`), so the AST is never built.
+
+    :param tokens: Iterable of `ContextToken`s (usually `CPLTokenizer`).
+
+    :return: pair of (errors, ir). The errors are ordered like `cpq.compiler` reports them: the syntax errors, the
+        symbol table errors and then the semantic errors. The ir is None if there are errors.
+    """
+    transformer = CPLTransformer()
+    errors, program = build_ast(tokens, transformer)
+    if program is None:
+        return errors, None
+
+    return get_transformer_ir(transformer, program, errors)
+
+
+def get_transformer_ir(transformer, program, errors):
+    """
+    :param transformer: `CPLTransformer` which built its symbol table.
+    :param program: `Program`, the result of the transformer.
+    :param errors: List of the errors found before the transformation (extended by the transformer's errors).
+
+    :return: pair of (errors, ir). The ir is None if there are errors.
+    """
+    errors += transformer.symbol_table_errors + transformer.errors
+    if errors:
+        return errors, None
+
+    return errors, get_program_ir(program)
+
+
+def get_program_ir(program):
+    """
+    :param program: `Program`.
+
+    :return: The IR of the program - its `Code` rope, which is not copied.
+    """
+    return program.code
+
+
+class UndefinedLabelError(KeyError):
+    """Raised when the IR jumps to a label which is never defined (the baseline `get_quad` raised a `KeyError`)."""
+    def __init__(self, label_names):
+        KeyError.__init__(self, "Jumps to undefined labels: %s" % ", ".join(sorted(label_names)))
+        self.label_names = label_names
 
 
 def get_quad(ir_code):
-    """Transforms IR code into QUAD code - changing all the labels into line numbers."""
-    line_number = 1
-    labels = {}
-    _quad = []
+    """
+    Transforms IR code into QUAD code in a single pass - every instruction gets its final line number when it is
+    stored, and the labels are dropped. A jump to a label which was already stored gets its line number at once, and
+    a forward jump waits in the label's patch list until the label is reached.
+
+    :param ir_code: Iterable of IR instructions and `Label`s (see `get_program_ir`).
+
+    :return: `QUADStore`.
+    :raises UndefinedLabelError: If a jump's label is not in the IR - the jump would be left with line 0.
+    """
+    quad = QUADStore()
+    lines = {}
+    pending_jumps = {}
     for inst in ir_code:
         if type(inst) == Label:
-            labels[inst.name] = line_number
-        else:
-            _quad.append(inst)
-            line_number += 1
-
-    quad = []
-    for inst in _quad:
-        if inst.operator == "jump":
-            quad.append(QUADInstruction(labels[inst.dest], "", "", "jump", Types.INT))
-        elif inst.operator == "conditional_jump":
-            quad .append(
-                QUADInstruction(labels[inst.dest], inst.op1, "", "conditional_jump", Types.INT)
-            )
+            # The label stands for the next line (lines are numbered from 1).
+            line_number = len(quad) + 1
+            lines[inst.name] = line_number
+            for index in pending_jumps.pop(inst.name, ()):
+                quad.set_dest(index, line_number)
         else:
-            quad.append(inst)
+            dest = inst.dest
+            if inst.operator in ("jump", "conditional_jump"):
+                if dest in lines:
+                    dest = lines[dest]
+                else:
+                    pending_jumps.setdefault(dest, []).append(len(quad))
+                    # Patched when the label is reached.
+                    dest = 0
 
-    return quad
+            quad.append(inst.opcode, dest, inst.op1, inst.op2)
 
+    if pending_jumps:
+        raise UndefinedLabelError(list(pending_jumps))
+
+    return quad
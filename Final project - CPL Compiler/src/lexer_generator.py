@@ -0,0 +1,437 @@
+# File: lexer_generator.py
+# Compiles the CPL tokens rules into a minimized DFA.
+# Author: Nir Moshe.
+"""
+lexer_generator.py usage:
+    python lexer_generator.py > cla_dfa.py
+
+This script transforms the tokens rules of `CPLTokenizer` into a minimized DFA and writes it as a Python module (just
+like Flex does with its rules). The DFA has the same semantics as the rules list - the longest match wins, and on a
+tie the first rule wins.
+
+The construction is the classic one: every rule's regular expression is parsed into a Thompson NFA, all the NFAs are
+joined by a new start state, the subset construction turns the NFA into a DFA, and Moore's algorithm minimizes it.
+The DFA works on characters classes (characters which no rule can tell apart) instead of characters, so the
+transitions table stays small.
+
+Author: Nir Moshe.
+"""
+import hashlib
+import re
+import sys
+import textwrap
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+__author__ = "Nir Moshe"
+
+# Representatives of the non-ASCII characters. The regular expressions can only tell them apart by `\s` and `\d`.
+NON_ASCII_REPRESENTATIVES = {
+    (False, False): "\u00e9",
+    (True, False): "\u00a0",
+    (False, True): "\u0663",
+}
+
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: lambda char: re.match(r"\d", char) is not None,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda char: re.match(r"\D", char) is not None,
+    sre_constants.CATEGORY_SPACE: lambda char: re.match(r"\s", char) is not None,
+    sre_constants.CATEGORY_NOT_SPACE: lambda char: re.match(r"\S", char) is not None,
+}
+
+DEAD_STATE = -1
+NOT_ACCEPTING = -1
+
+
+class UnsupportedPatternError(Exception):
+    """Raised when a rule uses a regular expression feature which can't be compiled into the DFA."""
+    def __init__(self, pattern, feature):
+        Exception.__init__(self, "Can't compile %r into a DFA: %s isn't supported." % (pattern, feature))
+
+
+class CharacterSet(object):
+    def __init__(self, pattern, items, negate=False):
+        """
+        Represents a single character in a regular expression: a literal, '.' or a [...] set.
+
+        :param pattern: The rule's regular expression (for error messages).
+        :param items: List of sre_parse items - (LITERAL, code), (RANGE, (low, high)) or (CATEGORY, category).
+        :param negate: True for [^...] sets.
+        """
+        self.items = items
+        self.negate = negate
+        for op, av in items:
+            if op == sre_constants.LITERAL and av >= 128:
+                raise UnsupportedPatternError(pattern, "non-ASCII literal")
+            elif op == sre_constants.RANGE and av[1] >= 128:
+                raise UnsupportedPatternError(pattern, "non-ASCII range")
+            elif op == sre_constants.CATEGORY and av not in CATEGORIES:
+                raise UnsupportedPatternError(pattern, "category %s" % av)
+            elif op not in (sre_constants.LITERAL, sre_constants.RANGE, sre_constants.CATEGORY):
+                raise UnsupportedPatternError(pattern, op)
+
+    def contains(self, char):
+        code = ord(char)
+        for op, av in self.items:
+            if op == sre_constants.LITERAL and code == av:
+                break
+            elif op == sre_constants.RANGE and av[0] <= code <= av[1]:
+                break
+            elif op == sre_constants.CATEGORY and CATEGORIES[av](char):
+                break
+        else:
+            return self.negate
+
+        return not self.negate
+
+
+class NFA(object):
+    """Thompson NFA. Every transition consumes one character out of a `CharacterSet`."""
+    def __init__(self):
+        self.epsilons = []
+        self.transitions = []
+        self.character_sets = []
+
+    def add_state(self):
+        self.epsilons.append([])
+        self.transitions.append([])
+        return len(self.epsilons) - 1
+
+    def add_transition(self, source, character_set, target):
+        self.character_sets.append(character_set)
+        self.transitions[source].append((len(self.character_sets) - 1, target))
+
+    def add_pattern(self, pattern):
+        """
+        :param pattern: String which represents a regular expression.
+
+        :return: Pair of (start, end) states of the pattern's automaton.
+        """
+        return self._add_subpattern(pattern, sre_parse.parse(pattern))
+
+    def _add_subpattern(self, pattern, subpattern):
+        start = end = self.add_state()
+        for op, av in subpattern:
+            node_start, node_end = self._add_node(pattern, op, av)
+            self.epsilons[end].append(node_start)
+            end = node_end
+
+        return start, end
+
+    def _add_node(self, pattern, op, av):
+        if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+            negate = op == sre_constants.NOT_LITERAL
+            return self._add_character(CharacterSet(pattern, [(sre_constants.LITERAL, av)], negate))
+        elif op == sre_constants.ANY:
+            return self._add_character(CharacterSet(pattern, [(sre_constants.LITERAL, ord("\n"))], negate=True))
+        elif op == sre_constants.IN:
+            negate = bool(av) and av[0][0] == sre_constants.NEGATE
+            return self._add_character(CharacterSet(pattern, av[1:] if negate else av, negate))
+        elif op == sre_constants.SUBPATTERN:
+            return self._add_subpattern(pattern, av[-1])
+        elif op == sre_constants.BRANCH:
+            start, end = self.add_state(), self.add_state()
+            for branch in av[1]:
+                branch_start, branch_end = self._add_subpattern(pattern, branch)
+                self.epsilons[start].append(branch_start)
+                self.epsilons[branch_end].append(end)
+
+            return start, end
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            return self._add_repeat(pattern, *av)
+
+        raise UnsupportedPatternError(pattern, op)
+
+    def _add_character(self, character_set):
+        start, end = self.add_state(), self.add_state()
+        self.add_transition(start, character_set, end)
+        return start, end
+
+    def _add_repeat(self, pattern, minimum, maximum, subpattern):
+        start = end = self.add_state()
+        for _ in range(minimum):
+            node_start, node_end = self._add_subpattern(pattern, subpattern)
+            self.epsilons[end].append(node_start)
+            end = node_end
+
+        if maximum == sre_constants.MAXREPEAT:
+            node_start, node_end = self._add_subpattern(pattern, subpattern)
+            self.epsilons[end].append(node_start)
+            self.epsilons[node_end].append(end)
+        else:
+            optional_end = self.add_state()
+            for _ in range(maximum - minimum):
+                node_start, node_end = self._add_subpattern(pattern, subpattern)
+                self.epsilons[end].append(node_start)
+                self.epsilons[end].append(optional_end)
+                end = node_end
+
+            self.epsilons[end].append(optional_end)
+            end = optional_end
+
+        return start, end
+
+    def epsilon_closure(self, states):
+        closure = set(states)
+        stack = list(states)
+        while stack:
+            for target in self.epsilons[stack.pop()]:
+                if target not in closure:
+                    closure.add(target)
+                    stack.append(target)
+
+        return frozenset(closure)
+
+
+class DFA(object):
+    def __init__(self, ascii_classes, non_ascii_classes, accepting, transitions, specification_hash):
+        """
+        Table driven DFA. State 0 is the start state.
+
+        :param ascii_classes: Tuple, the character class of every ASCII character.
+        :param non_ascii_classes: Dictionary of (char.isspace(), char.isdecimal()) -> the character class.
+        :param accepting: Tuple, the index of the rule accepted by every state (or `NOT_ACCEPTING`).
+        :param transitions: Tuple of tuples, transitions[state][character class] is the next state (or `DEAD_STATE`).
+        :param specification_hash: Hash of the rules the DFA was built from (see `get_specification_hash`).
+        """
+        self.ascii_classes = ascii_classes
+        self.non_ascii_classes = non_ascii_classes
+        self.accepting = accepting
+        self.transitions = transitions
+        self.specification_hash = specification_hash
+
+    def get_character_class(self, char):
+        code = ord(char)
+        if code < 128:
+            return self.ascii_classes[code]
+
+        return self.non_ascii_classes[(char.isspace(), char.isdecimal())]
+
+    def match(self, string, position=0):
+        """
+        :param string: String to match.
+        :param position: Index in `string` where the match should start.
+
+        :return: Pair of (end, rule index) of the longest match. If nothing matches returns (position, NOT_ACCEPTING).
+        """
+        ascii_classes, accepting, transitions = self.ascii_classes, self.accepting, self.transitions
+        state = 0
+        end, rule = position, NOT_ACCEPTING
+        for index in range(position, len(string)):
+            code = ord(string[index])
+            state = transitions[state][ascii_classes[code] if code < 128 else self.get_character_class(string[index])]
+            if state == DEAD_STATE:
+                break
+
+            if accepting[state] != NOT_ACCEPTING:
+                end, rule = index + 1, accepting[state]
+
+        return end, rule
+
+
+def get_specification_hash(patterns):
+    """
+    :param patterns: List of regular expressions (strings).
+
+    :return: String, a hash which identifies the rules list.
+    """
+    return hashlib.sha1("\n".join(patterns).encode("utf-8")).hexdigest()
+
+
+def get_character_classes(character_sets):
+    """
+    Splits the characters into classes. Two characters are in the same class iff every `CharacterSet` contains both
+    of them or none of them.
+
+    :return: Tuple of (ascii_classes, non_ascii_classes, number of classes, list of the classes representatives).
+    """
+    signatures = {}
+    representatives = []
+
+    def get_class(char):
+        signature = tuple(character_set.contains(char) for character_set in character_sets)
+        if signature not in signatures:
+            signatures[signature] = len(representatives)
+            representatives.append(char)
+
+        return signatures[signature]
+
+    ascii_classes = tuple(get_class(chr(code)) for code in range(128))
+    non_ascii_classes = {key: get_class(char) for key, char in NON_ASCII_REPRESENTATIVES.items()}
+    return ascii_classes, non_ascii_classes, len(representatives), representatives
+
+
+def build_dfa(patterns):
+    """
+    :param patterns: List of regular expressions (strings), ordered by priority.
+
+    :return: The minimized `DFA` of the rules.
+    """
+    nfa = NFA()
+    nfa_start = nfa.add_state()
+    nfa_accepting = {}
+    for rule, pattern in enumerate(patterns):
+        start, end = nfa.add_pattern(pattern)
+        nfa.epsilons[nfa_start].append(start)
+        nfa_accepting[end] = rule
+
+    ascii_classes, non_ascii_classes, classes_count, representatives = get_character_classes(nfa.character_sets)
+    set_classes = [
+        frozenset(index for index, char in enumerate(representatives) if character_set.contains(char))
+        for character_set in nfa.character_sets
+    ]
+
+    # Subset construction.
+    start = nfa.epsilon_closure([nfa_start])
+    states = {start: 0}
+    queue = [start]
+    accepting = []
+    transitions = []
+    for nfa_states in queue:
+        rules = [nfa_accepting[state] for state in nfa_states if state in nfa_accepting]
+        accepting.append(min(rules) if rules else NOT_ACCEPTING)
+        moves = [set() for _ in range(classes_count)]
+        for state in nfa_states:
+            for character_set, target in nfa.transitions[state]:
+                for character_class in set_classes[character_set]:
+                    moves[character_class].add(target)
+
+        row = []
+        for move in moves:
+            if not move:
+                row.append(DEAD_STATE)
+                continue
+
+            target = nfa.epsilon_closure(move)
+            if target not in states:
+                states[target] = len(queue)
+                queue.append(target)
+
+            row.append(states[target])
+
+        transitions.append(row)
+
+    accepting, transitions = minimize(accepting, transitions)
+    return DFA(
+        ascii_classes,
+        non_ascii_classes,
+        tuple(accepting),
+        tuple(tuple(row) for row in transitions),
+        get_specification_hash(patterns)
+    )
+
+
+def minimize(accepting, transitions):
+    """
+    Removes the states which can't reach an accepting state, then merges the equivalent states (Moore's algorithm).
+
+    :return: Pair of the new (accepting, transitions). The start state stays 0.
+    """
+    # States which can't reach an accepting state are dead - the longest match can't go through them.
+    predecessors = [set() for _ in transitions]
+    for state, row in enumerate(transitions):
+        for target in row:
+            if target != DEAD_STATE:
+                predecessors[target].add(state)
+
+    alive = set(state for state, rule in enumerate(accepting) if rule != NOT_ACCEPTING)
+    stack = list(alive)
+    while stack:
+        for predecessor in predecessors[stack.pop()]:
+            if predecessor not in alive:
+                alive.add(predecessor)
+                stack.append(predecessor)
+
+    transitions = [[target if target in alive else DEAD_STATE for target in row] for row in transitions]
+
+    # Moore's algorithm - refine the partition until every block has the same accepted rule and the same transitions.
+    blocks = [accepting[state] for state in range(len(transitions))]
+    while True:
+        signatures = {}
+        new_blocks = []
+        for state, row in enumerate(transitions):
+            signature = (blocks[state], tuple(DEAD_STATE if target == DEAD_STATE else blocks[target] for target in row))
+            new_blocks.append(signatures.setdefault(signature, len(signatures)))
+
+        if len(signatures) == len(set(blocks)):
+            break
+
+        blocks = new_blocks
+
+    # Renumber the blocks by the order of their first state, so the start state stays 0.
+    numbers = {}
+    for state in range(len(transitions)):
+        numbers.setdefault(new_blocks[state], len(numbers))
+
+    new_accepting = [NOT_ACCEPTING] * len(numbers)
+    new_transitions = [None] * len(numbers)
+    for state, row in enumerate(transitions):
+        block = numbers[new_blocks[state]]
+        if new_transitions[block] is None:
+            new_accepting[block] = accepting[state]
+            new_transitions[block] = [
+                DEAD_STATE if target == DEAD_STATE else numbers[new_blocks[target]] for target in row
+            ]
+
+    return new_accepting, new_transitions
+
+
+def write_dfa_module(dfa, output):
+    """
+    Writes the DFA tables as a Python module.
+
+    :param dfa: `DFA` object.
+    :param output: File like object.
+    """
+    def format_table(name, value):
+        return textwrap.fill(
+            "%s = %r" % (name, value),
+            width=120,
+            subsequent_indent="    ",
+            break_long_words=False
+        ) + "\n"
+
+    output.write("# The file was automatically generated by lexer_generator.py - don't edit it!\n")
+    output.write('"""\nMinimized DFA of the CPL tokens rules (%d states).\n"""\n\n' % len(dfa.transitions))
+    output.write(format_table("SPECIFICATION_HASH", dfa.specification_hash))
+    output.write(format_table("ASCII_CLASSES", dfa.ascii_classes))
+    output.write(format_table("NON_ASCII_CLASSES", dfa.non_ascii_classes))
+    output.write(format_table("ACCEPTING", dfa.accepting))
+    output.write("TRANSITIONS = (\n")
+    for row in dfa.transitions:
+        output.write(textwrap.fill(repr(row) + ",", width=120, initial_indent="    ", subsequent_indent="     "))
+        output.write("\n")
+
+    output.write(")\n")
+
+
+def load_dfa_module(module):
+    """
+    :param module: Module which was written by `write_dfa_module`.
+
+    :return: `DFA` object.
+    """
+    return DFA(
+        module.ASCII_CLASSES,
+        module.NON_ASCII_CLASSES,
+        module.ACCEPTING,
+        module.TRANSITIONS,
+        module.SPECIFICATION_HASH
+    )
+
+
+def main():
+    if len(sys.argv) != 1:
+        print(__doc__)
+        sys.exit(1)
+
+    from cla import CPLTokenizer
+    write_dfa_module(build_dfa(CPLTokenizer("", engine=CPLTokenizer.LEGACY_ENGINE).get_regex_patterns()), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
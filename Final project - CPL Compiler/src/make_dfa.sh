@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+set -e
+# Generated into a temporary file, so a failed generation never leaves a broken cla_dfa.py.
+temp_file="cla_dfa.py.$$.tmp"
+trap 'rm -f "$temp_file"' EXIT
+python lexer_generator.py > "$temp_file"
+mv "$temp_file" cla_dfa.py
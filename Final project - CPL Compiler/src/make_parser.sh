@@ -0,0 +1,10 @@
+#!/usr/bin/env bash
+set -e
+# Generated into a temporary file, so a failed generation never leaves a broken cpl_parser.py (which would be taken
+# as up to date - see cpl_lark.py).
+temp_file="cpl_parser.py.$$.tmp"
+trap 'rm -f "$temp_file"' EXIT
+# The generator iterates over sets, so the hash seed is fixed to make its output reproducible.
+PYTHONHASHSEED=0 python -m lark.tools.standalone cpl.y > "$temp_file"
+python -c "from cpl_lark import get_grammar_file_hash; print('GRAMMAR_HASH = \"%s\"' % get_grammar_file_hash())" >> "$temp_file"
+mv "$temp_file" cpl_parser.py
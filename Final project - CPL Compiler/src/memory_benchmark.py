@@ -0,0 +1,93 @@
+# Measures the memory the CPL compiler needs per QUAD instruction.
+# Author: Nir Moshe.
+"""
+memory_benchmark.py usage:
+    python memory_benchmark.py [<number of statement groups>]
+
+Compiles a large generated CPL program and prints the memory (traced by tracemalloc) per emitted QUAD instruction:
+the memory which is kept by the QUAD code, and the peak memory of the compilation.
+
+Author: Nir Moshe.
+"""
+import gc
+import sys
+import tracemalloc
+
+from cla import CPLTokenizer
+from cpq import compiler
+from ir import get_ir_from_tokens
+
+__author__ = "Nir Moshe"
+
+DEFAULT_SIZE = 2000
+STATEMENTS_GROUP = """
+    c = b + c * 2;
+    if (a > b && c <= 3.5) write(a); else { read(b); }
+    while (b < 10) { b = b + 1; if (b == 5) break; else continue; }
+    switch (b) { case 1: x = static_cast<int>(c); break; default: write(x); }
+"""
+
+
+def generate_program(size):
+    """
+    :param size: Number of statement groups (every group has assignments, if, while and switch statements).
+
+    :return: String, the CPL program.
+    """
+    return "a, b, x: int; c: float; {%s}" % (STATEMENTS_GROUP * size)
+
+
+def measure_memory(cpl_program):
+    """
+    :param cpl_program: String, valid CPL program.
+
+    :return: tuple of (number of QUAD instructions, bytes kept per instruction, peak bytes per instruction).
+    """
+    tracemalloc.start()
+    try:
+        errors, quad = compiler(cpl_program)
+        # Only the memory which is still referenced is kept.
+        gc.collect()
+        kept_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    if errors:
+        raise ValueError("The program has %d errors." % len(errors))
+
+    return len(quad), kept_memory / len(quad), peak_memory / len(quad)
+
+
+def measure_ir_memory(cpl_program):
+    """
+    The IR is what the QUAD code was kept as before the `QUADStore`.
+
+    :param cpl_program: String, valid CPL program.
+
+    :return: The bytes the IR of the program keeps per QUAD instruction.
+    """
+    tracemalloc.start()
+    try:
+        errors, ir = get_ir_from_tokens(CPLTokenizer(cpl_program))
+        gc.collect()
+        kept_memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    if errors:
+        raise ValueError("The program has %d errors." % len(errors))
+
+    return kept_memory / len(compiler(cpl_program)[1])
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    # The first compilation builds the parser, so it is not measured.
+    compiler(generate_program(1))
+    instructions, kept, peak = measure_memory(generate_program(size))
+    print("%d QUAD instructions: %.1f bytes kept, %.1f bytes peak per instruction." % (instructions, kept, peak))
+    print("The IR keeps %.1f bytes per instruction." % measure_ir_memory(generate_program(size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+# File: optimizer.py
+# Optimization passes over the CPL IR.
+# Author: Nir Moshe.
+"""
+The optimizer runs between the IR generation and the QUAD emission (`ir.get_quad`). Every pass takes the IR - a list of
+`QUADInstruction`s and `Label`s - and returns the optimized IR. The passes are registered in order, each with the
+optimization level which enables it (see `register_pass`), and `PassManager` runs the passes of a level:
+
+    -O0     No optimizations.
+    -O1     Control flow cleanups - jumps to jumps, unreachable code and jumps to the next line.
+    -O2     -O1, and folding of the single use temporaries into the assignments.
+
+Author: Nir Moshe.
+"""
+from collections import namedtuple
+import logging
+import time
+
+from cfg import ControlFlowGraph
+from ir import Label
+from symbol_table import Types
+
+__author__ = "Nir Moshe"
+
+logger = logging.getLogger(__name__)
+
+OptimizationPass = namedtuple("OptimizationPass", ["name", "level", "function"])
+# The number of instructions (the labels are not counted) before and after the pass.
+PassStatistics = namedtuple("PassStatistics", ["name", "seconds", "instructions_before", "instructions_after"])
+
+OPTIMIZATION_LEVELS = (0, 1, 2)
+# The registered passes, in the order they run.
+PASSES = []
+
+
+class UnknownPassError(ValueError):
+    """Raised when a pass which is not registered is enabled or disabled."""
+    def __init__(self, name):
+        ValueError.__init__(self, "Unknown optimization pass: %s" % name)
+
+
+def register_pass(level):
+    """
+    Decorator which registers an optimization pass (after the passes which are already registered). The name of the
+    pass is the function's name.
+
+    :param level: The lowest optimization level which runs the pass.
+    """
+    def register(function):
+        PASSES.append(OptimizationPass(function.__name__, level, function))
+        return function
+
+    return register
+
+
+class PassManager(object):
+    """
+    Runs the passes of an optimization level in order, and records the statistics of every pass of the last run.
+    """
+    def __init__(self, level=0, enabled=(), disabled=()):
+        """
+        :param level: The optimization level (see `OPTIMIZATION_LEVELS`).
+        :param enabled: Names of passes to run even if their level is higher.
+        :param disabled: Names of passes not to run.
+
+        :raises UnknownPassError: If one of the names is not a registered pass.
+        """
+        if level not in OPTIMIZATION_LEVELS:
+            raise ValueError("Invalid optimization level: %s" % level)
+
+        names = set(optimization_pass.name for optimization_pass in PASSES)
+        for name in list(enabled) + list(disabled):
+            if name not in names:
+                raise UnknownPassError(name)
+
+        self.level = level
+        self.passes = [
+            optimization_pass for optimization_pass in PASSES
+            if (optimization_pass.level <= level or optimization_pass.name in enabled) and
+            optimization_pass.name not in disabled
+        ]
+        self.statistics = []
+
+    def run(self, ir):
+        """
+        :param ir: Iterable of IR instructions and `Label`s (see `ir.get_program_ir`).
+
+        :return: The optimized IR (`ir` itself if there are no passes to run).
+        """
+        # Every run gets a new list, so the statistics of different compilations (or threads) are never mixed.
+        self.statistics = statistics = []
+        if not self.passes:
+            return ir
+
+        ir = list(ir)
+        instructions = count_instructions(ir)
+        for optimization_pass in self.passes:
+            start_time = time.perf_counter()
+            ir = optimization_pass.function(ir)
+            seconds = time.perf_counter() - start_time
+            instructions_before, instructions = instructions, count_instructions(ir)
+            statistics.append(PassStatistics(optimization_pass.name, seconds, instructions_before, instructions))
+            logger.debug(
+                "%s: %d -> %d instructions in %.3f seconds.",
+                optimization_pass.name, instructions_before, instructions, seconds
+            )
+
+        return ir
+
+
+def count_instructions(ir):
+    return sum(1 for inst in ir if type(inst) != Label)
+
+
+def is_jump(inst):
+    return inst.operator in ("jump", "conditional_jump")
+
+
+def get_next_instructions(ir):
+    """
+    :return: dict of label name -> the first instruction after the label (labels at the end are missing).
+    """
+    next_instructions = {}
+    next_instruction = None
+    for inst in reversed(ir):
+        if type(inst) == Label:
+            if next_instruction is not None:
+                next_instructions[inst.name] = next_instruction
+        else:
+            next_instruction = inst
+
+    return next_instructions
+
+
+@register_pass(level=1)
+def thread_jumps(ir):
+    """
+    Retargets the jumps to a label followed by `goto other_label` straight to the final label of the chain.
+    """
+    next_instructions = get_next_instructions(ir)
+    final_targets = {}
+    for inst in ir:
+        if type(inst) == Label or not is_jump(inst):
+            continue
+
+        # Follow the chain, and remember the final target of all the labels on it.
+        chain = []
+        target = inst.dest
+        while target not in final_targets:
+            next_instruction = next_instructions.get(target)
+            if next_instruction is None or next_instruction.operator != "jump" or target in chain:
+                # The chain ends (or loops forever, then the label is a target as good as any on the loop).
+                final_targets[target] = target
+                break
+
+            chain.append(target)
+            target = next_instruction.dest
+
+        for label_name in chain:
+            final_targets[label_name] = final_targets[target]
+
+        inst.dest = final_targets[target]
+
+    return ir
+
+
+@register_pass(level=1)
+def remove_unreachable_code(ir):
+    """
+    Removes the basic blocks which can't be reached from the start of the program (see `cfg`), and then the labels
+    which no jump targets.
+    """
+    control_flow_graph = ControlFlowGraph(ir)
+    control_flow_graph.remove_unreachable_blocks()
+    ir = control_flow_graph.get_ir()
+    targets = set(inst.dest for inst in ir if type(inst) != Label and is_jump(inst))
+    return [inst for inst in ir if type(inst) != Label or inst.name in targets]
+
+
+@register_pass(level=1)
+def remove_jumps_to_next_line(ir):
+    """
+    Removes the jumps to a label which is right after them (only labels between the jump and its target).
+    """
+    optimized_ir = []
+    # The index of the last jump in `optimized_ir`, while only labels follow it.
+    last_jump_index = None
+    for inst in ir:
+        if type(inst) == Label:
+            if last_jump_index is not None and optimized_ir[last_jump_index].dest == inst.name:
+                del optimized_ir[last_jump_index]
+                last_jump_index = None
+        else:
+            last_jump_index = len(optimized_ir) if is_jump(inst) else None
+
+        optimized_ir.append(inst)
+
+    return optimized_ir
+
+
+def get_result_type(inst):
+    """
+    :return: The type of the value which the instruction writes to its `dest` (`inst.type` is the operands' type).
+    """
+    if inst.operator in ("==", "!=", ">", "<", "CAST_TO_INT"):
+        return Types.INT
+
+    if inst.operator == "CAST_TO_REAL":
+        return Types.FLOAT
+
+    return inst.type
+
+
+@register_pass(level=2)
+def fold_single_use_values(ir):
+    """
+    Folds a value which is used once, by the assignment right after it, into the assignment's variable:
+        t1 = a + b
+        c = t1      ->      c = a + b
+    Only if the value has the type of the assignment - `RASN c t1` assigns an int `t1` to a float `c`, and folding it
+    would write an int into `c`.
+    """
+    definitions = {}
+    uses = {}
+    for inst in ir:
+        if type(inst) == Label or inst.operator == "halt":
+            continue
+
+        if inst.operator == "WRITE":
+            read_operands = (inst.dest,)
+        elif is_jump(inst):
+            read_operands = (inst.op1,)
+        else:
+            read_operands = (inst.op1, inst.op2)
+            definitions[inst.dest] = definitions.get(inst.dest, 0) + 1
+
+        for operand in read_operands:
+            if type(operand) == str and operand:
+                uses[operand] = uses.get(operand, 0) + 1
+
+    optimized_ir = []
+    for inst in ir:
+        if type(inst) != Label and inst.operator == "=" and optimized_ir:
+            previous = optimized_ir[-1]
+            value = inst.op1
+            if (
+                type(previous) != Label and previous.dest == value and definitions.get(value) == 1 and
+                uses.get(value) == 1 and previous.operator not in ("WRITE", "jump", "conditional_jump", "halt") and
+                get_result_type(previous) == inst.type
+            ):
+                previous.dest = inst.dest
+                continue
+
+        optimized_ir.append(inst)
+
+    return optimized_ir
@@ -0,0 +1,150 @@
+# File: parser_cache.py
+# On-disk cache of the CPL LALR parse table.
+# Author: Nir Moshe.
+"""
+Building the LALR automaton of `cpl.y` is the most expensive part of creating the CPL parser, and it has to be done
+again by every new process. This module pickles the grammar rules and the parse table into a cache file on the first
+use, and later runs just load them.
+
+The cache file keeps the key it was built for - a hash of the grammar text, the parser configuration and the lark
+version. When the key does not match (e.g. `cpl.y` was changed) the table is rebuilt and the cache is rewritten.
+
+The cache file is unpickled, so anyone who can replace it can run code in the compiler. It must be kept in a directory
+which only its owner can write (by default it is next to the sources, see `cla.CPL_PARSER_CACHE_FILENAME`).
+
+Author: Nir Moshe.
+"""
+import hashlib
+import os
+import pickle
+import uuid
+
+import lark
+from lark.common import ParserConf
+from lark.load_grammar import load_grammar
+from lark.parse_tree_builder import ParseTreeBuilder
+from lark.parsers.lalr_analysis import LALR_Analyzer, ParseTable, Shift, Reduce
+from lark.parsers.lalr_parser import _Parser
+from lark.tree import Tree
+
+__author__ = "Nir Moshe"
+
+# Bump it whenever the content of the cache file changes.
+CACHE_FORMAT_VERSION = 1
+START_RULE = "start"
+
+
+def get_grammar_hash(grammar):
+    """
+    :param grammar: String, lark grammar.
+
+    :return: The key of the parse table cache - covers the grammar and everything that affects the parse table.
+    """
+    configuration = "lalr;start=%s;lark=%s;format=%d" % (START_RULE, lark.__version__, CACHE_FORMAT_VERSION)
+    return hashlib.sha1((configuration + "\n" + grammar).encode("utf-8")).hexdigest()
+
+
+def build_parse_table(grammar):
+    """
+    :param grammar: String, lark grammar.
+
+    :return: pair of (rules, parse_table).
+    """
+    rules = load_grammar(grammar, "<cpl>").compile()[1]
+    analyzer = LALR_Analyzer(ParserConf(rules, None, START_RULE))
+    analyzer.compute_lookahead()
+    return rules, analyzer.parse_table
+
+
+class LALRParser(_Parser):
+    """
+    LALR parser over a precomputed parse table. It builds the same trees as `Lark(grammar, parser="lalr")`, and just
+    like it, it takes an iterable of lark tokens.
+    """
+    def __init__(self, rules, parse_table):
+        # `create_callback` renames the rules' aliases, so it must not run before the rules are pickled.
+        callback = ParseTreeBuilder(rules, Tree).create_callback()
+        callbacks = {rule: getattr(callback, rule.alias or rule.origin, None) for rule in rules}
+        _Parser.__init__(self, parse_table, callbacks)
+        self.rules = rules
+
+
+def dump_parse_table(key, rules, parse_table, cache_file):
+    """
+    Writes the cache. `Shift` and `Reduce` are compared by identity, so the actions are stored as booleans.
+
+    :param key: The cache key (see `get_grammar_hash`).
+    :param rules: The grammar rules.
+    :param parse_table: The LALR parse table of the rules.
+    :param cache_file: Binary file object.
+    """
+    states = {
+        state: {token_type: (action is Shift, argument) for token_type, (action, argument) in actions.items()}
+        for state, actions in parse_table.states.items()
+    }
+    pickle.dump(
+        (key, rules, states, parse_table.start_state, parse_table.end_state),
+        cache_file,
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def load_parse_table(key, cache_file):
+    """
+    :param key: The expected cache key (see `get_grammar_hash`).
+    :param cache_file: Binary file object.
+
+    :return: pair of (rules, parse_table), or None if the cache was built for another key.
+    """
+    cached_key, rules, states, start_state, end_state = pickle.load(cache_file)
+    if cached_key != key:
+        return None
+
+    states = {
+        state: {
+            token_type: (Shift if is_shift else Reduce, argument)
+            for token_type, (is_shift, argument) in actions.items()
+        }
+        for state, actions in states.items()
+    }
+    return rules, ParseTable(states, start_state, end_state)
+
+
+def get_cached_parser(grammar, cache_filename):
+    """
+    Loads the parser from the cache, and (re)builds the cache if it is missing or out of date. A cache which can not
+    be written (e.g. read only directory) only costs the speedup.
+
+    :param grammar: String, lark grammar.
+    :param cache_filename: Path of the cache file.
+
+    :return: pair of (parser, loaded_from_cache).
+    """
+    key = get_grammar_hash(grammar)
+    try:
+        with open(cache_filename, "rb") as cache_file:
+            cached = load_parse_table(key, cache_file)
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+        cached = None
+
+    if cached is not None:
+        return LALRParser(*cached), True
+
+    rules, parse_table = build_parse_table(grammar)
+    try:
+        # Write to a temporary file and rename it, so a concurrent run never reads a partial cache. The kernel applies
+        # the umask to the mode, so the other users of a shared install can read the cache (see `cpq.write_quad_file`).
+        temp_filename = "%s.%s.tmp" % (cache_filename, uuid.uuid4().hex)
+        fd = os.open(temp_filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as cache_file:
+                dump_parse_table(key, rules, parse_table, cache_file)
+
+            os.replace(temp_filename, cache_filename)
+        except BaseException:
+            os.remove(temp_filename)
+            raise
+    except OSError:
+        pass
+
+    return LALRParser(rules, parse_table), False
@@ -1,7 +1,6 @@
 from collections import namedtuple
 
-from lark.visitors import Visitor
-
+from cpl_lark import Visitor
 from exceptions import CPLException, CPLCompoundException
 
 __author__ = "Nir Moshe"
@@ -0,0 +1,126 @@
+# Author: Nir Moshe.
+# Testing the control flow graph of the CPL IR.
+
+import unittest
+import sys
+sys.path.append("..")
+
+from cfg import ControlFlowGraph
+from cla import CPLTokenizer
+from ir import Label, QUADInstruction, UndefinedLabelError, get_ir_from_tokens, get_quad
+from optimizer import PassManager
+from symbol_table import Types
+
+
+def get_program_ir(cpl_program):
+    errors, ir = get_ir_from_tokens(CPLTokenizer(cpl_program))
+    assert not errors, errors
+    return list(ir)
+
+
+def get_blocks_code(control_flow_graph):
+    return [[inst.code for inst in block.instructions] for block in control_flow_graph.blocks]
+
+
+class ControlFlowGraphTest(unittest.TestCase):
+    def test_while(self):
+        ir = get_program_ir("a: int; { read(a); while (a < 10) { if (a > 5) break; else a = a + 1; } write(a); }")
+        control_flow_graph = ControlFlowGraph(ir)
+        blocks = control_flow_graph.blocks
+        self.assertEqual(
+            [
+                ["IINP a"],
+                ["ILSS t1 a 10", "JMPZ end_while_label_3 t1"],
+                ["IGRT t2 a 5", "JMPZ else_label_0 t2"],
+                ["JUMP end_while_label_3"],
+                # The jump to the end of the `if` is unreachable (the `break` jumps before it).
+                ["JUMP endif_label_1"],
+                ["IADD t3 a 1", "IASN a t3"],
+                ["JUMP condition_label_2"],
+                ["IPRT a", "HALT"]
+            ],
+            get_blocks_code(control_flow_graph)
+        )
+        self.assertIs(blocks[1], control_flow_graph.blocks_by_label["condition_label_2"])
+        # The `endif` label starts the block of the jump back to the condition.
+        self.assertIs(blocks[6], control_flow_graph.blocks_by_label["endif_label_1"])
+        self.assertEqual([blocks[1]], blocks[0].successors)
+        self.assertEqual([blocks[7], blocks[2]], blocks[1].successors)
+        self.assertEqual([blocks[0], blocks[6]], blocks[1].predecessors)
+        self.assertEqual([blocks[1], blocks[3]], blocks[7].predecessors)
+        self.assertEqual([], blocks[4].predecessors)
+        self.assertEqual([], blocks[7].successors)
+
+    def test_linearize(self):
+        ir = get_program_ir("a: int; { while (a < 10) { switch (a) { case 1: break; default: a = a + 2; } } }")
+        self.assertEqual(ir, ControlFlowGraph(ir).get_ir())
+
+    def test_remove_unreachable_blocks(self):
+        loop, unused = Label("loop"), Label("unused")
+        ir = [
+            QUADInstruction("", "", "", "halt", Types.INT),
+            # An unreachable loop.
+            loop, QUADInstruction("a", "", "", "WRITE", Types.INT), QUADInstruction.get_jump(loop),
+            unused, QUADInstruction.get_jump(loop)
+        ]
+        control_flow_graph = ControlFlowGraph(ir)
+        self.assertEqual(2, control_flow_graph.remove_unreachable_blocks())
+        self.assertEqual([["HALT"]], get_blocks_code(control_flow_graph))
+        self.assertEqual({}, control_flow_graph.blocks_by_label)
+        self.assertEqual(["HALT"], list(get_quad(control_flow_graph.get_ir()).get_lines()))
+
+    def test_undefined_label(self):
+        ir = [
+            QUADInstruction.get_jump(Label("missing")), QUADInstruction.get_conditional_jump("t1", Label("other")),
+            QUADInstruction("", "", "", "halt", Types.INT)
+        ]
+        with self.assertRaises(UndefinedLabelError) as context:
+            ControlFlowGraph(ir)
+
+        self.assertEqual(["missing", "other"], sorted(context.exception.label_names))
+        # The optimizer builds the graph before `get_quad`, and fails with the same error.
+        for level in (1, 2):
+            with self.assertRaises(UndefinedLabelError):
+                PassManager(level).run(ir)
+
+    def test_empty(self):
+        control_flow_graph = ControlFlowGraph([])
+        self.assertEqual([], control_flow_graph.blocks)
+        self.assertEqual(0, control_flow_graph.remove_unreachable_blocks())
+
+    def test_size(self):
+        loop = "while (a < 1) { if (a > 2) break; else a = a + 1; }\n"
+        for size in (1, 1000):
+            ir = get_program_ir("a: int; { %s }" % (loop * size))
+            control_flow_graph = ControlFlowGraph(ir)
+            # Every loop has 6 blocks (see `test_while`) with 8 edges, and the `HALT` is in a block of its own.
+            self.assertEqual(6 * size + 1, len(control_flow_graph.blocks))
+            self.assertEqual(8 * size, sum(len(block.successors) for block in control_flow_graph.blocks))
+            self.assertEqual(
+                len([inst for inst in ir if type(inst) != Label]),
+                sum(len(block.instructions) for block in control_flow_graph.blocks)
+            )
+
+            # The search walks the successors of every reachable block once.
+            visits = []
+            for block in control_flow_graph.blocks:
+                block.successors = CountingList(visits, block.successors)
+
+            self.assertEqual(size, control_flow_graph.remove_unreachable_blocks())
+            self.assertEqual(5 * size + 1, len(visits))
+            self.assertEqual(len(visits), len(set(map(id, visits))))
+
+
+class CountingList(list):
+    """List which records itself in `visits` every time it's iterated."""
+    def __init__(self, visits, items):
+        list.__init__(self, items)
+        self.visits = visits
+
+    def __iter__(self):
+        self.visits.append(self)
+        return list.__iter__(self)
+
+
+if __name__ == "__main__":
+    unittest.main()
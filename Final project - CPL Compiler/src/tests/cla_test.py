@@ -7,11 +7,14 @@
 
 __author__ = "Nir Moshe"
 
+from array import array
 import unittest
+import os
 import sys
 sys.path.append("..")
 
-from cla import Token, CPLTokenizer, ContextToken
+import cla
+from cla import Token, CPLTokenizer, ContextToken, EngineMismatchError, NewlineIndex, TokenStore, build_ast
 
 
 def get_tokens(tokenizer):
@@ -113,6 +116,46 @@ class CLATest(unittest.TestCase):
             get_tokens(tokenizer)
         )
 
+    def test_unterminated_comment(self):
+        tokenizer = CPLTokenizer("a /* b\n c */ d\n/* e\n f")
+        self.assertEqual(
+            [
+                ContextToken(Token(name="ID", lexeme="a", attribute="a"), 1),
+                ContextToken(Token(name="ID", lexeme="d", attribute="d"), 2),
+                ContextToken(Token(name="UNTERMINATED_COMMENT", lexeme="/*", attribute=""), 3),
+            ],
+            list(tokenizer)
+        )
+
+        program = "a: int; { a = 1; } /* a = 2;"
+        for tokens in (CPLTokenizer(program), CPLTokenizer(program, lazy=True), list(CPLTokenizer(program))):
+            errors, _ = build_ast(tokens)
+            self.assertEqual(
+                [(1, "Syntax error: Unterminated comment.")],
+                [(error.line, error.message) for error in errors]
+            )
+
+        # The message depends on the token's type, not on its lexeme.
+        invalid_token = Token(name="INVALID_TOKEN", lexeme="/*", attribute="")
+        self.assertEqual("Syntax error: Invalid symbol /*.", cla.InvalidTokenError(invalid_token, 1).message)
+
+    def test_pathological_comments(self):
+        programs = [
+            ("/*" + "*" * 1000000, Token(name="UNTERMINATED_COMMENT", lexeme="/*", attribute=""), 0),
+            ("/*" + "*" * 1000000 + "/ a", Token(name="ID", lexeme="a", attribute="a"), 2),
+            ("/*" + " /* a " * 100000, Token(name="UNTERMINATED_COMMENT", lexeme="/*", attribute=""), 0),
+            ("/*" + "*\n" * 100000 + "*/ a", Token(name="ID", lexeme="a", attribute="a"), 2),
+        ]
+        for program, token, matches in programs:
+            program = FindCountingString(program)
+            tokenizer = CPLTokenizer(program, lazy=True)
+            match_calls = MatchCalls(program)
+            tokenizer.engine_pattern = CountingPattern(tokenizer.engine_pattern, match_calls)
+            self.assertEqual([token], get_tokens(tokenizer))
+            # The comment is a single search for its end, the rules only match the whitespace and the ID after it.
+            self.assertEqual([CPLTokenizer.COMMENT_END], program.searches)
+            self.assertEqual(matches, len(match_calls.positions))
+
     def test_relop(self):
         tokenizer = CPLTokenizer("== != < > >= <=")
         self.assertEqual(
@@ -160,6 +203,28 @@ class CLATest(unittest.TestCase):
             get_tokens(tokenizer)
         )
 
+    def test_keywords(self):
+        keywords = "break case continue default else float if int read static_cast switch while write"
+        self.assertEqual(
+            [Token(name=keyword.upper(), lexeme=keyword, attribute="") for keyword in keywords.split()],
+            get_tokens(CPLTokenizer(keywords))
+        )
+
+        not_keywords = "breaks iff int9 While whilewhil staticcas"
+        self.assertEqual(
+            [Token(name="ID", lexeme=lexeme, attribute=lexeme) for lexeme in not_keywords.split()],
+            get_tokens(CPLTokenizer(not_keywords))
+        )
+        self.assertEqual(
+            [
+                Token(name="ID", lexeme="static", attribute="static"),
+                Token(name="INVALID_TOKEN", lexeme="_", attribute=""),
+                Token(name="ID", lexeme="cas", attribute="cas"),
+                Token(name="INVALID_TOKEN", lexeme="whilewhile", attribute=""),
+            ],
+            get_tokens(CPLTokenizer("static_cas whilewhile"))
+        )
+
     def test_id(self):
         for i in range(1, 10):
             tokenizer = CPLTokenizer("a" * i)
@@ -249,6 +314,243 @@ class CLATest(unittest.TestCase):
             [token for token in tokenizer]
         )
 
+    def test_engines_match_legacy_engine(self):
+        programs = [
+            "    int main() { int;}",
+            "== != < > >= <= + - * / || && ! ( ) { } , : ; = . @ $",
+            "a aaaaaaaaa aaaaaaaaaa break1 breakbreak static_cast<int>(x) 100ff0x 3. 3.14 9999999999 int9",
+            "/* comment */ /** with * stars **/ a /* unterminated",
+            "/**/ /***/ */ ** /* a\n** b */ \u0663 3.\u0663 \u00e9 \u00a0 \r\t\x0b",
+        ]
+        demos_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cpl_demos")
+        for filename in sorted(os.listdir(demos_directory)):
+            if filename.endswith(".cpl"):
+                with open(os.path.join(demos_directory, filename)) as demo:
+                    programs.append(demo.read())
+
+        for program in programs:
+            legacy_tokens = list(CPLTokenizer(program, engine=CPLTokenizer.LEGACY_ENGINE))
+            for engine in (CPLTokenizer.MASTER_ENGINE, CPLTokenizer.DFA_ENGINE):
+                self.assertEqual(legacy_tokens, list(CPLTokenizer(program, engine=engine, compare_engines=True)))
+
+    def test_compare_engines_mismatch(self):
+        class BrokenTokenizer(CPLTokenizer):
+            def __init__(self, raw_content, engine=CPLTokenizer.DFA_ENGINE, compare_engines=False):
+                if engine == CPLTokenizer.LEGACY_ENGINE:
+                    raw_content = raw_content.replace("b", "c")
+
+                CPLTokenizer.__init__(self, raw_content, engine, compare_engines)
+
+        with self.assertRaises(EngineMismatchError) as context:
+            BrokenTokenizer("a b", compare_engines=True)
+
+        self.assertEqual(1, context.exception.index)
+
+    def test_lazy_tokenizer(self):
+        demos_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cpl_demos")
+        for filename in sorted(os.listdir(demos_directory)):
+            if not filename.endswith(".cpl"):
+                continue
+
+            with open(os.path.join(demos_directory, filename)) as demo:
+                program = demo.read()
+
+            self.assertEqual(list(CPLTokenizer(program)), list(CPLTokenizer(program, lazy=True)))
+
+    def test_lazy_tokenizer_stops_on_syntax_error(self):
+        program = "a: int; { a = ; @ }" + " a = a + 1;" * 10000
+        tokenizer = CPLTokenizer(program, lazy=True)
+        errors, tree = build_ast(tokenizer)
+        self.assertIsNone(tree)
+        self.assertEqual(1, len(errors))
+        self.assertLess(tokenizer.cursor, 20)
+        self.assertLess(tokenizer.newline_index.indexed_offset, 20)
+
+        # The eager tokenizer still reports the invalid symbols after the syntax error.
+        errors, tree = build_ast(CPLTokenizer(program))
+        self.assertEqual(2, len(errors))
+
+    def test_token_store(self):
+        program = "a: float; { a = static_cast<float>(3) + 2.5 @ a > 1; #}"
+        tokenizer = CPLTokenizer(program)
+        store = tokenizer.token_store
+        self.assertIsInstance(store, TokenStore)
+        self.assertEqual(list(CPLTokenizer(program, lazy=True)), list(store))
+        self.assertEqual(list(store), list(tokenizer))
+        errors = []
+        lark_tokens = list(store.get_lark_tokens(errors))
+        self.assertEqual(
+            ["Syntax error: Invalid symbol @.", "Syntax error: Invalid symbol #."],
+            [error.message for error in errors]
+        )
+        self.assertEqual([1, 1], [error.line for error in errors])
+        self.assertEqual(len(store) - 2, len(lark_tokens))
+
+        # A row is 1 byte of name code and 2 offsets.
+        columns = (store.codes, store.starts, store.ends)
+        self.assertEqual([len(store)] * 3, [len(column) for column in columns])
+        self.assertEqual(1, store.codes.itemsize)
+        self.assertLessEqual(sum(column.itemsize for column in columns), 17)
+
+    def test_newline_index(self):
+        program = "a\n  bc\n\n/* x\n*/ d"
+        newline_index = NewlineIndex(program)
+        self.assertEqual([1, 6, 7, 12], list(newline_index.newlines))
+        self.assertEqual((1, 1), (newline_index.get_line(0), newline_index.get_column(0)))
+        self.assertEqual((1, 2), (newline_index.get_line(1), newline_index.get_column(1)))
+        self.assertEqual((2, 3), (newline_index.get_line(4), newline_index.get_column(4)))
+        self.assertEqual((5, 4), (newline_index.get_line(16), newline_index.get_column(16)))
+
+        lazy_newline_index = NewlineIndex(program, lazy=True)
+        self.assertEqual([], list(lazy_newline_index.newlines))
+        self.assertEqual((2, 3), (lazy_newline_index.get_line(4), lazy_newline_index.get_column(4)))
+        self.assertEqual([1], list(lazy_newline_index.newlines))
+        self.assertEqual((1, 2), (lazy_newline_index.get_line(1), lazy_newline_index.get_column(1)))
+        self.assertEqual((5, 4), (lazy_newline_index.get_line(16), lazy_newline_index.get_column(16)))
+        self.assertEqual(list(newline_index.newlines), list(lazy_newline_index.newlines))
+
+        store = CPLTokenizer(program).token_store
+        self.assertEqual([1, 2, 5], [store.get_line(index) for index in range(len(store))])
+        self.assertEqual([1, 3, 4], [store.get_column(index) for index in range(len(store))])
+        self.assertEqual(
+            [(1, 1), (2, 3), (5, 4)],
+            [(token.line, token.column) for token in store.get_lark_tokens([])]
+        )
+
+    def test_lark_tokens(self):
+        program = "a: float;\n{ a = static_cast<float>(3) @ ; }"
+        for lazy in (False, True):
+            errors = []
+            lark_tokens = list(CPLTokenizer(program, lazy=lazy).get_lark_tokens(errors))
+            self.assertEqual(["Syntax error: Invalid symbol @."], [error.message for error in errors])
+            self.assertEqual(
+                [("ID", "a", 1, 1), ("COLON", "", 1, 2), ("FLOAT", "", 1, 4), ("SEMICOLON", "", 1, 9)],
+                [(token.type, token.value, token.line, token.column) for token in lark_tokens[:4]]
+            )
+            self.assertEqual(
+                ["STATIC_CAST", "LEFT_STATIC_CAST_BRACKETS", "FLOAT", "RIGHT_STATIC_CAST_BRACKETS"],
+                [token.type for token in lark_tokens[7:11]]
+            )
+            self.assertEqual([2] * 12, [token.line for token in lark_tokens[4:]])
+
+    def test_default_parser_is_memoized(self):
+        parser = cla.get_default_cpl_parser()
+        self.assertIs(parser, cla.get_default_cpl_parser())
+        self.assertIsInstance(cla.parser_build_time, float)
+
+        # The same parser is reused by consecutive compilations.
+        program = "a: int; { a = 1; write(a); }"
+        first_errors, first_tree = build_ast(CPLTokenizer(program))
+        build_ast(CPLTokenizer("a: int; { a = ; }"))
+        second_errors, second_tree = build_ast(CPLTokenizer(program))
+        self.assertEqual(([], first_tree), (second_errors, second_tree))
+        self.assertEqual([], first_errors)
+
+    def test_flat_lists(self):
+        def get_depth(tree):
+            return 1 + max([get_depth(child) for child in tree.children if hasattr(child, "children")] or [0])
+
+        def get_program(size):
+            ids = ", ".join("a%d" % i for i in range(size))
+            cases = " ".join("case %d: a0 = %d;" % (i, i) for i in range(size))
+            return "%s: int; { %s switch (a0) { %s default: } }" % (ids, "a0 = 1; " * size, cases)
+
+        errors, small_tree = build_ast(CPLTokenizer(get_program(2)))
+        self.assertEqual([], errors)
+        errors, tree = build_ast(CPLTokenizer(get_program(200)))
+        self.assertEqual([], errors)
+        self.assertEqual(get_depth(small_tree), get_depth(tree))
+
+        declarations, stmt_block = tree.children
+        self.assertEqual(200 * 2 - 1, len(declarations.children[0].children[0].children))
+        stmtlist = stmt_block.children[1]
+        self.assertEqual(["stmt"] * 201, [stmt.data for stmt in stmtlist.children])
+        caselist = stmtlist.children[-1].children[0].children[5]
+        self.assertEqual(200 * 4, len(caselist.children))
+
+    def test_build_ast_from_token_store(self):
+        program = "a: int; { a = 1 @ ; @ }"
+        store_errors, store_tree = build_ast(CPLTokenizer(program))
+        errors, tree = build_ast(list(CPLTokenizer(program, lazy=True)))
+        self.assertEqual([(error.line, error.message) for error in errors], [
+            (error.line, error.message) for error in store_errors
+        ])
+        self.assertEqual(tree, store_tree)
+
+
+class FindCountingString(str):
+    """String which records the substrings it searches for, except the newlines (see `NewlineIndex`)."""
+    def __init__(self, string):
+        str.__init__(self)
+        self.searches = []
+
+    def find(self, substring, *args):
+        if substring != "\n":
+            self.searches.append(substring)
+
+        return str.find(self, substring, *args)
+
+
+class MatchCalls:
+    """The positions of the patterns' `match` calls on a program. The calls on any other string are only counted."""
+    def __init__(self, program):
+        self.program = program
+        self.positions = array("L")
+        self.other_strings = 0
+
+
+class CountingPattern:
+    """Token pattern which records its `match` calls."""
+    def __init__(self, pattern, calls):
+        self.pattern = pattern
+        self.calls = calls
+
+    def match(self, string, position=0):
+        if string is self.calls.program:
+            self.calls.positions.append(position)
+        else:
+            self.calls.other_strings += 1
+
+        return self.pattern.match(string, position)
+
+
+class CLAScalingTest(unittest.TestCase):
+    LINE = "abcdefghi = abcdefghi + 123456789; /* The quick brown fox jumps over the lazy dog. */\n"
+
+    def get_match_calls(self, engine, lines):
+        """
+        :return: `MatchCalls` of all the patterns.
+        """
+        program = self.LINE * lines
+        # A lazy tokenizer scans on demand, so its patterns are replaced before the scanning starts.
+        tokenizer = CPLTokenizer(program, engine=engine, lazy=True)
+        calls = MatchCalls(program)
+        if engine == CPLTokenizer.LEGACY_ENGINE:
+            tokenizer.token_patterns = [
+                (CountingPattern(token_pattern, calls), handler) for token_pattern, handler in tokenizer.token_patterns
+            ]
+        else:
+            tokenizer.engine_pattern = CountingPattern(tokenizer.engine_pattern, calls)
+
+        self.assertEqual(lines * 6, sum(1 for _ in tokenizer))
+        # The patterns match in place - the rest of the input is never copied.
+        self.assertEqual(0, calls.other_strings)
+        # Every position is matched once by the engine (or once by every rule of the legacy engine).
+        rules = len(tokenizer.token_patterns) if engine == CPLTokenizer.LEGACY_ENGINE else 1
+        self.assertEqual(rules * len(set(calls.positions)), len(calls.positions), engine)
+        return calls
+
+    def test_linear_scanning(self):
+        # About 800 KB and 3.2 MB of input.
+        for engine in (CPLTokenizer.DFA_ENGINE, CPLTokenizer.MASTER_ENGINE, CPLTokenizer.LEGACY_ENGINE):
+            calls = len(self.get_match_calls(engine, 9000).positions)
+            self.assertEqual(4 * calls, len(self.get_match_calls(engine, 36000).positions), engine)
+
+    def test_bounded_patterns(self):
+        # A match call costs the length of its lexeme - no rule may run over the rest of the input (".*" or ".+").
+        for regex_pattern in CPLTokenizer("").get_regex_patterns():
+            self.assertNotRegex(regex_pattern, r"(?<!\\)\.[*+]")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,89 @@
+# Author: Nir Moshe.
+# Testing the choice between the standalone CPL parser and lark.
+
+import os
+import subprocess
+import unittest
+import sys
+sys.path.append("..")
+
+import cpl_lark
+from cla import build_ast, CPLTokenizer, get_default_cpl_parser
+from cpl_lark import (
+    Discard, get_grammar_file_hash, load_standalone_parser_module, transform_iteratively, Transformer, Tree
+)
+
+try:
+    import cpl_parser
+except ImportError:
+    cpl_parser = None
+
+SOURCE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@unittest.skipIf(cpl_parser is None, "Run make_parser.sh")
+class CPLLarkTest(unittest.TestCase):
+    def test_generated_module_is_up_to_date(self):
+        self.assertEqual(get_grammar_file_hash(), cpl_parser.GRAMMAR_HASH, "Run make_parser.sh")
+        self.assertTrue(cpl_lark.STANDALONE)
+        self.assertIs(cpl_parser.Tree, Tree)
+
+    def test_outdated_module_is_not_used(self):
+        self.assertIs(cpl_parser, load_standalone_parser_module(cpl_parser.GRAMMAR_HASH))
+        self.assertIsNone(load_standalone_parser_module("0" * 40))
+
+    def test_standalone_parser(self):
+        self.assertIsInstance(get_default_cpl_parser(), cpl_parser._Parser)
+        errors, tree = build_ast(CPLTokenizer("a, b: int; { a = b + 1; }"))
+        self.assertEqual([], errors)
+        subtrees = [subtree.data for subtree in tree.iter_subtrees()]
+        self.assertEqual("start", subtrees[-1])
+        self.assertEqual(1, subtrees.count("declaration"))
+
+    def test_compiler_does_not_import_lark(self):
+        output = subprocess.check_output(
+            [
+                sys.executable, "-c",
+                "import sys, cpq; cpq.compiler('a: int; { read(a); write(a); }'); print('lark' in sys.modules)"
+            ],
+            cwd=SOURCE_DIRECTORY
+        )
+        self.assertEqual(b"False", output.strip())
+
+
+class SumTransformer(Transformer):
+    def number(self, children):
+        return int(children[0])
+
+    def sum(self, children):
+        return sum(children)
+
+    def comment(self, children):
+        raise Discard()
+
+
+class TransformIterativelyTest(unittest.TestCase):
+    def test_same_as_transform(self):
+        tree = Tree("start", [
+            Tree("sum", [Tree("number", ["1"]), Tree("sum", [Tree("number", ["2"])])]),
+            # No callback.
+            Tree("group", [Tree("number", ["3"]), "x"])
+        ])
+        expected = SumTransformer().transform(tree)
+        self.assertEqual(Tree("start", [3, Tree("group", [3, "x"])]), expected)
+        self.assertEqual(expected, transform_iteratively(SumTransformer(), tree))
+
+    def test_discard(self):
+        tree = Tree("sum", [Tree("number", ["1"]), Tree("comment", []), Tree("number", ["2"])])
+        self.assertEqual(3, transform_iteratively(SumTransformer(), tree))
+
+    def test_deep_tree(self):
+        tree = Tree("number", ["1"])
+        for _ in range(10000):
+            tree = Tree("sum", [tree])
+
+        self.assertEqual(1, transform_iteratively(SumTransformer(), tree))
+
+
+if __name__ == "__main__":
+    unittest.main()
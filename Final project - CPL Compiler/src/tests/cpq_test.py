@@ -0,0 +1,78 @@
+# Author: Nir Moshe.
+# Testing the .qud output of the CPL compiler.
+
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+sys.path.append("..")
+
+from cpq import compiler, parse_arguments, write_quad_file, SIGNATURE
+from optimizer import UnknownPassError
+
+
+class FailingQUADStore:
+    """`QUADStore` whose lines fail in the middle of the writing."""
+    def get_lines(self):
+        yield "HALT"
+        raise IOError("Disk is full")
+
+
+class WriteQUADFileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.output_filename = os.path.join(self.directory, "program.qud")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write(self):
+        errors, quad = compiler("a: int; { read(a); write(a); }")
+        self.assertEqual([], errors)
+        write_quad_file(quad, self.output_filename)
+        with open(self.output_filename) as output_fd:
+            self.assertEqual("IINP a\nIPRT a\nHALT\n%s\n" % SIGNATURE, output_fd.read())
+
+        self.assertEqual(["program.qud"], os.listdir(self.directory))
+        # The permissions of a file created by `open`.
+        reference_filename = os.path.join(self.directory, "reference")
+        open(reference_filename, "w").close()
+        self.assertEqual(os.stat(reference_filename).st_mode, os.stat(self.output_filename).st_mode)
+
+    def test_no_partial_output(self):
+        with self.assertRaises(IOError):
+            write_quad_file(FailingQUADStore(), self.output_filename)
+
+        self.assertEqual([], os.listdir(self.directory))
+
+
+class ParseArgumentsTest(unittest.TestCase):
+    def test_default(self):
+        input_filename, pass_manager, print_pass_statistics = parse_arguments(["program.cpl"])
+        self.assertEqual("program.cpl", input_filename)
+        self.assertEqual(0, pass_manager.level)
+        self.assertFalse(print_pass_statistics)
+
+    def test_options(self):
+        input_filename, pass_manager, print_pass_statistics = parse_arguments(
+            ["-O1", "--disable=thread_jumps", "--enable=fold_single_use_values", "--pass-statistics", "program.cpl"]
+        )
+        self.assertEqual("program.cpl", input_filename)
+        self.assertEqual(
+            ["remove_unreachable_code", "remove_jumps_to_next_line", "fold_single_use_values"],
+            [optimization_pass.name for optimization_pass in pass_manager.passes]
+        )
+        self.assertTrue(print_pass_statistics)
+
+    def test_invalid_arguments(self):
+        for arguments in ([], ["a.cpl", "b.cpl"], ["-O9", "a.cpl"], ["-Ox", "a.cpl"], ["--verbose", "a.cpl"]):
+            with self.assertRaises(ValueError):
+                parse_arguments(arguments)
+
+        with self.assertRaises(UnknownPassError):
+            parse_arguments(["--disable=no_such_pass", "a.cpl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
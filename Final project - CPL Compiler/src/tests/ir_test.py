@@ -1,16 +1,24 @@
 # Author: Nir Moshe.
 # Date: 31-Jan-2019
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest import main, TestCase
+import copy
+import gc
+import os
 import sys
+import tracemalloc
 sys.path.append("..")
 
-from lark import Tree
-
-from cla import CPLTokenizer
-from cpl_ast import build_ast
-from ir import CPLTransformer, TemporaryVariables, Label, get_ir, SemanticError
-from symbol_table import SymbolTable, Types
+from cla import CPLTokenizer, InvalidTokenError, build_ast
+from cpl_lark import Transformer, Tree
+from cpq import compiler
+from memory_benchmark import generate_program, measure_ir_memory, measure_memory
+from ir import (
+    Code, CompilationContext, CPLTransformer, Label, Opcode, PatchList, QUADInstruction, QUADStore, get_ir,
+    get_ir_from_tokens, get_program_ir, get_quad, SemanticError, UndefinedLabelError
+)
+from symbol_table import SymbolAlreadyExistsError, SymbolTable, Types
 
 
 class FakeToken:
@@ -20,8 +28,6 @@ class FakeToken:
 
 class QuadTransformerTest(TestCase):
     def setUp(self):
-        TemporaryVariables.reset()
-        Label.reset()
         symbol_table = SymbolTable()
         symbol_table.add_symbol("a_int", Types.INT, 1)
         symbol_table.add_symbol("b_int", Types.INT, 1)
@@ -156,7 +162,7 @@ class QuadTransformerTest(TestCase):
             ],
         }
         for operator, instructions in operators_to_instructions.items():
-            TemporaryVariables.reset()
+            self.transformer.context = CompilationContext()
             tree = Tree("boolexpr", [
                 Tree("boolterm", [
                     Tree("boolfactor", [
@@ -368,8 +374,8 @@ class QuadTransformerTest(TestCase):
             }
         }
         """
-        ast = build_ast(CPLTokenizer(cpl_program))
-        sym = SymbolTable.build_form_ast(ast)
+        _, ast = build_ast(CPLTokenizer(cpl_program))
+        _, sym = SymbolTable.build_form_ast(ast)
         code = [i.code for i in get_ir(ast, sym)]
         self.assertEqual(code, [
             'case_1_label_3:',
@@ -420,8 +426,8 @@ class QuadTransformerTest(TestCase):
             }
         }
         """
-        ast = build_ast(CPLTokenizer(cpl_program))
-        sym = SymbolTable.build_form_ast(ast)
+        _, ast = build_ast(CPLTokenizer(cpl_program))
+        _, sym = SymbolTable.build_form_ast(ast)
         code = [i.code for i in get_ir(ast, sym)]
         self.assertEqual(code, [
             'condition_label_2:',
@@ -444,5 +450,259 @@ class QuadTransformerTest(TestCase):
         ])
 
 
+class InlineIRTest(TestCase):
+    DEMOS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cpl_demos")
+
+    def test_same_as_ast(self):
+        for filename in sorted(os.listdir(self.DEMOS_DIRECTORY)):
+            if not filename.endswith(".cpl"):
+                continue
+
+            with open(os.path.join(self.DEMOS_DIRECTORY, filename)) as demo:
+                cpl_program = demo.read()
+
+            ast_errors, ast_quad = compiler(cpl_program, inline=False)
+            errors, quad = compiler(cpl_program)
+            self.assertEqual(
+                [(error.line, error.message) for error in ast_errors],
+                [(error.line, error.message) for error in errors],
+                filename
+            )
+            if not errors:
+                self.assertEqual(list(ast_quad.get_lines()), list(quad.get_lines()), filename)
+
+    def test_lazy_tokenizer(self):
+        for filename in sorted(os.listdir(self.DEMOS_DIRECTORY)):
+            if not filename.endswith(".cpl"):
+                continue
+
+            with open(os.path.join(self.DEMOS_DIRECTORY, filename)) as demo:
+                cpl_program = demo.read()
+
+            errors, quad = compiler(cpl_program)
+            lazy_errors, lazy_quad = compiler(cpl_program, lazy=True)
+            if not errors:
+                self.assertEqual([], lazy_errors, filename)
+                self.assertEqual(list(quad.get_lines()), list(lazy_quad.get_lines()), filename)
+            else:
+                # The lazy compilation stops on the first syntax error.
+                self.assertLessEqual(len(lazy_errors), len(errors), filename)
+                self.assertEqual(errors[0].line, lazy_errors[0].line, filename)
+
+    def test_symbol_table_in_the_same_pass(self):
+        cpl_program = """
+        a, b: int;
+        c, a: float;
+        d: float;
+        { b = 1; }
+        """
+        _, ast = build_ast(CPLTokenizer(cpl_program))
+        expected_errors, expected_symbol_table = SymbolTable.build_form_ast(ast)
+        ast_transformer = CPLTransformer()
+        ast_transformer.transform(ast)
+        inline_transformer = CPLTransformer()
+        build_ast(CPLTokenizer(cpl_program), inline_transformer)
+        for transformer in (ast_transformer, inline_transformer):
+            self.assertEqual(expected_symbol_table.symbols, transformer.symbol_table.symbols)
+            self.assertEqual(
+                [(error.line, error.message) for error in expected_errors],
+                [(error.line, error.message) for error in transformer.symbol_table_errors]
+            )
+
+    def test_errors_order(self):
+        cpl_program = """
+        a, b: int;
+        a: float;
+        {
+            b = c + 1; @
+        }
+        """
+        errors, ir = get_ir_from_tokens(CPLTokenizer(cpl_program))
+        self.assertIsNone(ir)
+        self.assertEqual(
+            [(5, InvalidTokenError), (3, SymbolAlreadyExistsError), (5, SemanticError), (5, SemanticError)],
+            [(error.line, type(error)) for error in errors]
+        )
+        self.assertEqual([error.message for error in compiler(cpl_program, inline=False)[0]], [
+            error.message for error in errors
+        ])
+
+
+class CodeTest(TestCase):
+    def test_join(self):
+        code = Code([1, 2]) + [3] + Code()
+        code = [0] + code + Code(Code([4]), [5, 6])
+        self.assertEqual([0, 1, 2, 3, 4, 5, 6], list(code))
+        self.assertEqual([0, 1, 2, 3, 4, 5, 6], code)
+        self.assertNotEqual([0, 1], code)
+        self.assertEqual([], Code())
+
+    def test_deep_rope(self):
+        code = Code()
+        for i in range(10000):
+            code = [i] + code + [i]
+
+        self.assertEqual(list(range(9999, -1, -1)) + list(range(10000)), list(code))
+
+    def test_join_without_copying(self):
+        instructions = [1, 2]
+        code = Code(instructions)
+        joined = [0] + code + [3]
+        # Every join is a single new node which points at the joined parts.
+        self.assertEqual(2, len(joined.parts))
+        self.assertIs(code, joined.parts[0].parts[1])
+        self.assertIs(instructions, code.parts[0])
+        instructions.append(2.5)
+        self.assertEqual([0, 1, 2, 2.5, 3], joined)
+
+
+class GetQuadTest(TestCase):
+    def test_backpatching(self):
+        start, end = Label("start"), Label("end")
+        forward_jump = QUADInstruction.get_conditional_jump("t1", end)
+        backward_jump = QUADInstruction.get_jump(start)
+        halt = QUADInstruction("", "", "", "halt", Types.INT)
+        quad = get_quad(Code([start, forward_jump], [backward_jump, end, end], [halt]))
+        self.assertIsInstance(quad, QUADStore)
+        self.assertEqual(["JMPZ 3 t1", "JUMP 1", "HALT"], list(quad.get_lines()))
+        self.assertEqual((Opcode.JMPZ, 3, "t1", ""), quad.get_instruction(0))
+        self.assertEqual((Opcode.JUMP, 1, "", ""), quad.get_instruction(1))
+
+    def test_undefined_label(self):
+        jumps = [QUADInstruction.get_jump(Label("missing")), QUADInstruction.get_conditional_jump("t1", Label("other"))]
+        with self.assertRaises(UndefinedLabelError) as context:
+            get_quad(Code(jumps, [QUADInstruction("", "", "", "halt", Types.INT)]))
+
+        self.assertEqual(["missing", "other"], sorted(context.exception.label_names))
+        self.assertIsInstance(context.exception, KeyError)
+
+    def test_operands_table(self):
+        quad = QUADStore()
+        quad.append(Opcode.IASN, "a", 1, "")
+        quad.append(Opcode.RASN, "b", 1.0, "")
+        quad.append(Opcode.IADD, "a", "a", 1)
+        self.assertEqual(["a", 1, "", "b", 1.0], quad.operands)
+        self.assertEqual(["IASN a 1", "RASN b 1.0", "IADD a a 1"], list(quad.get_lines()))
+
+
+class CompilationContextTest(TestCase):
+    def test_concurrent_compilations(self):
+        demos_directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cpl_demos")
+        programs = []
+        for filename in sorted(os.listdir(demos_directory)):
+            if filename.endswith(".cpl") and filename != "errors.cpl":
+                with open(os.path.join(demos_directory, filename)) as demo:
+                    programs.append(demo.read())
+
+        expected = [list(compiler(program)[1].get_lines()) for program in programs]
+        switch_interval = sys.getswitchinterval()
+        # Switch threads very often, so the compilations interleave.
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(compiler, programs * 8))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(expected * 8, [list(quad.get_lines()) for _, quad in results])
+
+
+class MemoryTest(TestCase):
+    def test_slotted_ir(self):
+        context = CompilationContext()
+        transformer = CPLTransformer(context=context)
+        _, ast = build_ast(CPLTokenizer(generate_program(1)))
+        objects = [context, context.get_new_label(), transformer.transform(ast)]
+        objects += list(objects[-1].code)
+        for cpl_object in objects:
+            self.assertFalse(hasattr(cpl_object, "__dict__"), type(cpl_object).__name__)
+
+    @staticmethod
+    def get_kept_memory(build):
+        """
+        :return: The bytes kept by the objects `build` returns, per object.
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            objects = build()
+            kept_memory, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return kept_memory / len(objects)
+
+    def test_bytes_per_instruction(self):
+        # The object sizes depend on the interpreter, so the memory is compared with baselines measured here.
+        cpl_program = generate_program(100)
+        instructions, kept, _ = measure_memory(cpl_program)
+        self.assertGreater(instructions, 3000)
+        # The IR keeps ~4.5 times the memory of its `QUADStore`.
+        self.assertLess(kept, 0.4 * measure_ir_memory(cpl_program))
+
+    def test_slotted_instructions(self):
+        class UnslottedInstruction(object):
+            pass
+
+        def copy_unslotted():
+            unslotted_instructions = []
+            for instruction in instructions:
+                unslotted_instruction = UnslottedInstruction()
+                for name in QUADInstruction.__slots__:
+                    setattr(unslotted_instruction, name, getattr(instruction, name))
+
+                unslotted_instructions.append(unslotted_instruction)
+
+            return unslotted_instructions
+
+        _, ir = get_ir_from_tokens(CPLTokenizer(generate_program(10)))
+        instructions = [instruction for instruction in ir if isinstance(instruction, QUADInstruction)]
+        slotted = self.get_kept_memory(lambda: [copy.copy(instruction) for instruction in instructions])
+        # ~2/3 on CPython 3.11, where the instance dictionaries are already compact.
+        self.assertLess(slotted, 0.8 * self.get_kept_memory(copy_unslotted))
+
+
+class PatchListTest(TestCase):
+    def test_merge(self):
+        patch_list = PatchList() + PatchList(1) + PatchList()
+        patch_list = PatchList(0) + patch_list + PatchList(PatchList(2), 3)
+        self.assertEqual([0, 1, 2, 3], list(patch_list))
+        self.assertFalse(PatchList() + PatchList())
+        single = PatchList(1)
+        self.assertIs(single, PatchList() + single + PatchList())
+
+    def test_deep_breaks(self):
+        depth = 3000
+        cpl_program = "a: int; { while (a < 1) %s break; continue; %s }" % ("{ a = a + 1; " * depth, "}" * depth)
+        errors, quad = compiler(cpl_program)
+        self.assertEqual([], errors)
+        quad = list(quad.get_lines())
+        # The loop ends at the HALT, its condition is at line 1.
+        self.assertEqual(["JUMP %d" % len(quad), "JUMP 1", "JUMP 1", "HALT"], quad[-4:])
+
+
+class DeepProgramTest(TestCase):
+    def test_deep_nesting(self):
+        depth = 5000
+        cpl_program = "a: int; {%s while (a < 1) a = %s1%s; %s}" % ("{" * depth, "(" * depth, ")" * depth, "}" * depth)
+        for inline in (True, False):
+            errors, quad = compiler(cpl_program, inline=inline)
+            self.assertEqual([], errors)
+            self.assertEqual(["ILSS t1 a 1", "JMPZ 5 t1", "IASN a 1", "JUMP 1", "HALT"], list(quad.get_lines()))
+
+    def test_long_program(self):
+        size = 5000
+        cpl_program = "a: int; { %s }" % ("if (a > 1) a = a - 1; else { read(a); }\n" * size)
+        for inline in (True, False):
+            errors, quad = compiler(cpl_program, inline=inline)
+            self.assertEqual([], errors)
+            self.assertEqual(size * 6 + 1, len(quad))
+
+    def test_same_as_recursive_transform(self):
+        _, ast = build_ast(CPLTokenizer("a, b: int; { while (a < b) { if (a > 1) a = a - 1; else break; } }"))
+        expected = [i.code for i in get_program_ir(Transformer.transform(CPLTransformer(), ast))]
+        self.assertEqual(expected, [i.code for i in get_program_ir(CPLTransformer().transform(ast))])
+
+
 if __name__ == "__main__":
     main()
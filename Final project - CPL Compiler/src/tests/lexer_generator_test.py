@@ -0,0 +1,61 @@
+# Author: Nir Moshe.
+# Testing the CPL DFA generator.
+
+import io
+import types
+import unittest
+import sys
+sys.path.append("..")
+
+import cla_dfa
+from cla import CPLTokenizer
+from lexer_generator import (
+    build_dfa, get_specification_hash, load_dfa_module, write_dfa_module, NOT_ACCEPTING, UnsupportedPatternError
+)
+
+
+class LexerGeneratorTest(unittest.TestCase):
+    def test_longest_match(self):
+        dfa = build_dfa(["if", "[a-z]+", r"\d+\.\d*", r"\d+"])
+        self.assertEqual((2, 0), dfa.match("if("))
+        self.assertEqual((3, 1), dfa.match("iff("))
+        self.assertEqual((2, 3), dfa.match("12"))
+        self.assertEqual((3, 2), dfa.match("12.a"))
+        self.assertEqual((5, 1), dfa.match("  abc1", 2))
+        self.assertEqual((0, NOT_ACCEPTING), dfa.match("!"))
+
+    def test_repeat(self):
+        dfa = build_dfa(["[a-z]{2,3}", "[a-z]{4,}", "[^a-z]"])
+        self.assertEqual((0, NOT_ACCEPTING), dfa.match("a"))
+        self.assertEqual((3, 0), dfa.match("abc"))
+        self.assertEqual((6, 1), dfa.match("abcdef"))
+        self.assertEqual((1, 2), dfa.match("é"))
+
+    def test_minimized(self):
+        # "a|b" and "[ab]" are the same language - 2 states (start and accept).
+        self.assertEqual(2, len(build_dfa(["a|b"]).transitions))
+        self.assertEqual(2, len(build_dfa(["[ab]"]).transitions))
+        self.assertEqual(2, len(build_dfa(["(a|b)+"]).transitions))
+
+    def test_unsupported_pattern(self):
+        with self.assertRaises(UnsupportedPatternError):
+            build_dfa([r"\bword"])
+
+    def test_write_and_load(self):
+        dfa = build_dfa(["if", "[a-z]+"])
+        output = io.StringIO()
+        write_dfa_module(dfa, output)
+        module = types.ModuleType("dfa_module")
+        exec(output.getvalue(), module.__dict__)
+        loaded_dfa = load_dfa_module(module)
+        self.assertEqual(dfa.transitions, loaded_dfa.transitions)
+        self.assertEqual(dfa.accepting, loaded_dfa.accepting)
+        self.assertEqual((3, 1), loaded_dfa.match("iff"))
+
+    def test_generated_module_is_up_to_date(self):
+        patterns = CPLTokenizer("", engine=CPLTokenizer.LEGACY_ENGINE).get_regex_patterns()
+        self.assertEqual(get_specification_hash(patterns), cla_dfa.SPECIFICATION_HASH, "Run make_dfa.sh")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+# Author: Nir Moshe.
+# Testing the optimization passes of the CPL compiler.
+
+from contextlib import redirect_stdout
+import io
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import unittest
+import sys
+sys.path.append("..")
+
+from cpq import compiler, write_quad_file
+from ir import Label, QUADInstruction, get_quad
+from optimizer import (
+    fold_single_use_values, remove_jumps_to_next_line, remove_unreachable_code, thread_jumps, PassManager, PASSES,
+    UnknownPassError
+)
+from symbol_table import Types
+
+SOURCE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUAD_SIMULATOR = os.path.join(os.path.dirname(SOURCE_DIRECTORY), "resources", "quad_simulator.py")
+DEMOS_DIRECTORY = os.path.join(SOURCE_DIRECTORY, "cpl_demos")
+sys.path.append(os.path.dirname(QUAD_SIMULATOR))
+
+import quad_simulator
+
+
+def get_code(ir):
+    return list(get_quad(ir).get_lines())
+
+
+def assign(dest, value):
+    return QUADInstruction(dest, value, "", "=", Types.INT)
+
+
+def write(value):
+    return QUADInstruction(value, "", "", "WRITE", Types.INT)
+
+
+def halt():
+    return QUADInstruction("", "", "", "halt", Types.INT)
+
+
+class PassesTest(unittest.TestCase):
+    def test_thread_jumps(self):
+        first, second, third = Label("first"), Label("second"), Label("third")
+        ir = [
+            QUADInstruction.get_conditional_jump("a", first),
+            first, second, QUADInstruction.get_jump(third),
+            third, QUADInstruction.get_jump(second),
+            halt()
+        ]
+        # The loop of jumps stays a loop.
+        self.assertEqual(["JMPZ 3 a", "JUMP 3", "JUMP 3", "HALT"], get_code(thread_jumps(ir)))
+
+    def test_remove_unreachable_code(self):
+        used, unused = Label("used"), Label("unused")
+        ir = [
+            QUADInstruction.get_jump(used),
+            write("a"), unused, write("b"),
+            used, write("c"),
+            halt(), write("d")
+        ]
+        self.assertEqual(["JUMP 2", "IPRT c", "HALT"], get_code(remove_unreachable_code(ir)))
+
+    def test_remove_jumps_to_next_line(self):
+        next_line, loop = Label("next_line"), Label("loop")
+        ir = [
+            loop, QUADInstruction.get_conditional_jump("a", next_line),
+            Label("other"), next_line, QUADInstruction.get_jump(loop),
+            halt()
+        ]
+        self.assertEqual(["JUMP 1", "HALT"], get_code(remove_jumps_to_next_line(ir)))
+
+    def test_fold_single_use_values(self):
+        ir = [
+            QUADInstruction("t1", "a", "b", "+", Types.INT), assign("t2", "t1"), assign("c", "t2"),
+            # Used twice.
+            QUADInstruction("t3", "a", 1, "+", Types.INT), assign("d", "t3"), write("t3"),
+            # Not right before the assignment.
+            QUADInstruction("t4", "a", 1, "+", Types.INT), Label("label"), assign("e", "t4"),
+            halt()
+        ]
+        self.assertEqual(
+            ["IADD c a b", "IADD t3 a 1", "IASN d t3", "IPRT t3", "IADD t4 a 1", "IASN e t4", "HALT"],
+            get_code(fold_single_use_values(ir))
+        )
+
+    def test_fold_only_the_same_type(self):
+        ir = [
+            # An int value assigned to a float variable.
+            QUADInstruction("t1", "a", "b", "+", Types.INT), QUADInstruction("c", "t1", "", "=", Types.FLOAT),
+            # The casts and the comparisons write a value of another type than their operands.
+            QUADInstruction("t2", "a", "", "CAST_TO_REAL", Types.INT), QUADInstruction("d", "t2", "", "=", Types.FLOAT),
+            QUADInstruction("t3", "x", "y", "<", Types.FLOAT), assign("e", "t3"),
+            QUADInstruction("t4", "x", "y", "<", Types.FLOAT), QUADInstruction("f", "t4", "", "=", Types.FLOAT),
+            halt()
+        ]
+        self.assertEqual(
+            ["IADD t1 a b", "RASN c t1", "ITOR d a", "RLSS e x y", "RLSS t4 x y", "RASN f t4", "HALT"],
+            get_code(fold_single_use_values(ir))
+        )
+
+
+class PassManagerTest(unittest.TestCase):
+    def test_levels(self):
+        self.assertEqual([], PassManager(0).passes)
+        self.assertEqual(
+            ["thread_jumps", "remove_unreachable_code", "remove_jumps_to_next_line"],
+            [optimization_pass.name for optimization_pass in PassManager(1).passes]
+        )
+        self.assertEqual(PASSES, PassManager(2).passes)
+        with self.assertRaises(ValueError):
+            PassManager(3)
+
+    def test_enable_and_disable(self):
+        pass_manager = PassManager(1, enabled=["fold_single_use_values"], disabled=["thread_jumps"])
+        self.assertEqual(
+            ["remove_unreachable_code", "remove_jumps_to_next_line", "fold_single_use_values"],
+            [optimization_pass.name for optimization_pass in pass_manager.passes]
+        )
+        with self.assertRaises(UnknownPassError):
+            PassManager(2, disabled=["no_such_pass"])
+
+    def test_statistics(self):
+        pass_manager = PassManager(2)
+        errors, quad = compiler("a, b: int; { a = b + 1; }", pass_manager=pass_manager)
+        self.assertEqual([], errors)
+        self.assertEqual(["IADD a b 1", "HALT"], list(quad.get_lines()))
+        self.assertEqual(
+            [(optimization_pass.name, 3, 3) for optimization_pass in PASSES[:-1]] + [("fold_single_use_values", 3, 2)],
+            [(statistics.name, statistics.instructions_before, statistics.instructions_after)
+             for statistics in pass_manager.statistics]
+        )
+
+        # A reused pass manager keeps only the statistics of the last compilation.
+        compiler("a: int; { write(a); }", pass_manager=pass_manager)
+        self.assertEqual(
+            [(optimization_pass.name, 2, 2) for optimization_pass in PASSES],
+            [(statistics.name, statistics.instructions_before, statistics.instructions_after)
+             for statistics in pass_manager.statistics]
+        )
+
+
+class SimulatorTest(unittest.TestCase):
+    """Runs the optimized programs on the QUAD simulator."""
+    INPUT = "2\n7\n1\n5\n3\n"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def simulate(self, cpl_program, level):
+        """
+        :return: pair of (the output of the program, number of executed instructions).
+        """
+        errors, quad = compiler(cpl_program, pass_manager=PassManager(level))
+        self.assertEqual([], errors)
+        quad_filename = os.path.join(self.directory, "program.qud")
+        write_quad_file(quad, quad_filename)
+        simulator = subprocess.run(
+            [sys.executable, QUAD_SIMULATOR, quad_filename, "-t"],
+            input=self.INPUT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True
+        )
+        # The trace (-t) writes a line for every executed instruction (also right after the input prompts).
+        trace = re.compile(r"Executing `[^`]*`\n")
+        output = trace.sub("", simulator.stdout).splitlines() + simulator.stderr.splitlines()
+        return output, len(trace.findall(simulator.stdout))
+
+    def simulate_quad_store(self, cpl_program, level):
+        """
+        :return: The output of the program, interpreted from the rows of its `QUADStore` (no .qud file).
+        """
+        errors, quad = compiler(cpl_program, pass_manager=PassManager(level))
+        self.assertEqual([], errors)
+        return self.interpret_quad_store(quad)
+
+    def interpret_quad_store(self, quad):
+        output, errors_output = io.StringIO(), io.StringIO()
+        stdin, stderr = sys.stdin, quad_simulator.stderr
+        # The simulator imports `stderr` from `sys`, so its errors are redirected through the module.
+        sys.stdin, quad_simulator.stderr = io.StringIO(self.INPUT), errors_output
+        try:
+            with redirect_stdout(output):
+                quad_simulator.interpret_quad_store(quad)
+        finally:
+            sys.stdin, quad_simulator.stderr = stdin, stderr
+
+        return output.getvalue().splitlines() + errors_output.getvalue().splitlines()
+
+    def test_demos(self):
+        for filename in sorted(os.listdir(DEMOS_DIRECTORY)):
+            if not filename.endswith(".cpl") or filename == "errors.cpl":
+                continue
+
+            with open(os.path.join(DEMOS_DIRECTORY, filename)) as demo:
+                cpl_program = demo.read()
+
+            output, executed = self.simulate(cpl_program, 0)
+            self.assertEqual(output, self.simulate_quad_store(cpl_program, 0), filename)
+            for level in (1, 2):
+                optimized_output, optimized_executed = self.simulate(cpl_program, level)
+                self.assertEqual(output, optimized_output, filename)
+                self.assertLessEqual(optimized_executed, executed, filename)
+                self.assertEqual(output, self.simulate_quad_store(cpl_program, level), filename)
+
+    def test_fewer_executed_instructions(self):
+        cpl_program = """
+        i, sum: int;
+        {
+            i = 0;
+            sum = 0;
+            while (i < 100) {
+                if (i > 50) sum = sum + i * 2; else { sum = sum - 1; }
+                i = i + 1;
+            }
+            write(sum);
+        }
+        """
+        output, executed = self.simulate(cpl_program, 0)
+        optimized_output, optimized_executed = self.simulate(cpl_program, 2)
+        self.assertEqual(["7299"], output)
+        self.assertEqual(output, optimized_output)
+        self.assertLess(optimized_executed, executed * 0.85)
+
+        # Every row is read from the store once, although the loop executes it many times.
+        _, quad = compiler(cpl_program)
+        counting_quad = CountingQUADStore(quad)
+        self.assertEqual(output, self.interpret_quad_store(counting_quad))
+        self.assertEqual(len(set(counting_quad.rows)), len(counting_quad.rows))
+        self.assertLess(len(counting_quad.rows), executed / 10)
+        # The constants are passed to the simulator as numbers, not as text.
+        self.assertEqual(("IASN", ("i", 0)), quad_simulator.quad_store_rows(quad)[0])
+
+
+class CountingQUADStore:
+    """`QUADStore` which records the rows which are read."""
+    def __init__(self, quad):
+        self.quad = quad
+        self.rows = []
+
+    def __len__(self):
+        return len(self.quad)
+
+    def get_instruction(self, index):
+        self.rows.append(index)
+        return self.quad.get_instruction(index)
+
+
+if __name__ == "__main__":
+    unittest.main()
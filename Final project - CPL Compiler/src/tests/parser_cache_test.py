@@ -0,0 +1,172 @@
+# Author: Nir Moshe.
+# Testing the on-disk cache of the CPL parse table.
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+import sys
+sys.path.append("..")
+
+from lark import Lark, UnexpectedToken
+from lark.lexer import Lexer
+
+from cla import CPLTokenizer, CPL_GRAMMAR_FILENAME
+from cpq import compiler
+from parser_cache import get_cached_parser, get_grammar_hash
+
+GRAMMAR = """
+start: items
+items: items item | item
+item: NUM | LEFT_PARENTHESIS items RIGHT_PARENTHESIS
+%declare NUM LEFT_PARENTHESIS RIGHT_PARENTHESIS
+"""
+
+
+class PassThroughLexer(Lexer):
+    """Lexer for lark which takes ready lark tokens."""
+    def __init__(self, lexer_conf):
+        Lexer.__init__(self)
+
+    def lex(self, data):
+        return iter(data)
+
+
+def get_lark_tokens(program):
+    return list(CPLTokenizer(program).get_lark_tokens([]))
+
+
+class ParserCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_filename = os.path.join(self.directory, "parser.cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_cache_is_used(self):
+        parser, from_cache = get_cached_parser(GRAMMAR, self.cache_filename)
+        self.assertFalse(from_cache)
+        self.assertEqual(["parser.cache"], os.listdir(self.directory))
+        # The permissions of a file created by `open`.
+        reference_filename = os.path.join(self.directory, "reference")
+        open(reference_filename, "w").close()
+        self.assertEqual(os.stat(reference_filename).st_mode, os.stat(self.cache_filename).st_mode)
+
+        cached_parser, from_cache = get_cached_parser(GRAMMAR, self.cache_filename)
+        self.assertTrue(from_cache)
+        tokens = get_lark_tokens("1 (2 3) 4")
+        self.assertEqual(parser.parse(tokens), cached_parser.parse(tokens))
+
+    def test_cache_is_rebuilt_on_grammar_change(self):
+        get_cached_parser(GRAMMAR, self.cache_filename)
+        grammar = GRAMMAR.replace("items: items item | item", "items: item items | item")
+        self.assertNotEqual(get_grammar_hash(GRAMMAR), get_grammar_hash(grammar))
+
+        parser, from_cache = get_cached_parser(grammar, self.cache_filename)
+        self.assertFalse(from_cache)
+        self.assertTrue(get_cached_parser(grammar, self.cache_filename)[1])
+        self.assertEqual(
+            Lark(grammar, parser="lalr", lexer=PassThroughLexer).parse(get_lark_tokens("1 (2) 3")),
+            parser.parse(get_lark_tokens("1 (2) 3"))
+        )
+
+    def test_broken_cache_is_rebuilt(self):
+        with open(self.cache_filename, "wb") as cache_file:
+            cache_file.write(b"not a pickle")
+
+        self.assertFalse(get_cached_parser(GRAMMAR, self.cache_filename)[1])
+        self.assertTrue(get_cached_parser(GRAMMAR, self.cache_filename)[1])
+
+    def test_unwritable_cache(self):
+        cache_filename = os.path.join(self.directory, "missing", "parser.cache")
+        parser, from_cache = get_cached_parser(GRAMMAR, cache_filename)
+        self.assertFalse(from_cache)
+        self.assertFalse(os.path.exists(cache_filename))
+        self.assertEqual(2, len(parser.parse(get_lark_tokens("1 2")).children[0].children))
+
+    def test_same_trees_as_lark(self):
+        with open(CPL_GRAMMAR_FILENAME) as grammar_file:
+            grammar = grammar_file.read()
+
+        lark_parser = Lark(grammar, parser="lalr", lexer=PassThroughLexer)
+        get_cached_parser(grammar, self.cache_filename)
+        cached_parser, from_cache = get_cached_parser(grammar, self.cache_filename)
+        self.assertTrue(from_cache)
+
+        demos_directory = os.path.join(os.path.dirname(CPL_GRAMMAR_FILENAME), "cpl_demos")
+        for filename in sorted(os.listdir(demos_directory)):
+            if not filename.endswith(".cpl") or filename == "errors.cpl":
+                continue
+
+            with open(os.path.join(demos_directory, filename)) as demo:
+                tokens = get_lark_tokens(demo.read())
+
+            self.assertEqual(lark_parser.parse(tokens), cached_parser.parse(tokens), filename)
+
+        with self.assertRaises(UnexpectedToken):
+            cached_parser.parse(get_lark_tokens("a: int; { a = ; }"))
+
+
+class LarkFallbackTest(unittest.TestCase):
+    """The compiler without the standalone parser - its parser is built by lark and cached."""
+    # Compiles the program on the stdin with `cpl_parser` unavailable and the cache at argv[1], and writes its errors
+    # and QUAD lines as JSON. With argv[2], the parse table must come from the cache.
+    SCRIPT = """
+import json, sys
+sys.modules["cpl_parser"] = None
+import cla, cpl_lark, cpq, parser_cache
+assert not cpl_lark.STANDALONE
+cla.CPL_PARSER_CACHE_FILENAME = sys.argv[1]
+if len(sys.argv) > 2:
+    parser_cache.build_parse_table = None
+errors, quad = cpq.compiler(sys.stdin.read())
+json.dump([[[error.line, error.message] for error in errors], list(quad.get_lines())], sys.stdout)
+"""
+    PROGRAM = "a: float; b: int; { read(a); while (a < 10) { a = a + 1; } b = static_cast<int>(a * 2); write(b); }"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_filename = os.path.join(self.directory, "cpl_parser.cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def get_output(program):
+        """
+        :return: The output of `SCRIPT` for the program, compiled with the current parser.
+        """
+        errors, quad = compiler(program)
+        return [[[error.line, error.message] for error in errors], list(quad.get_lines())]
+
+    def compile(self, program, *arguments):
+        source_directory = os.path.dirname(CPL_GRAMMAR_FILENAME)
+        return json.loads(subprocess.run(
+            [sys.executable, "-c", self.SCRIPT, self.cache_filename] + list(arguments),
+            input=program, stdout=subprocess.PIPE, universal_newlines=True, cwd=source_directory, check=True
+        ).stdout)
+
+    def test_same_quad(self):
+        expected = self.get_output(self.PROGRAM)
+        self.assertEqual([], expected[0])
+        self.assertEqual(expected, self.compile(self.PROGRAM))
+        self.assertTrue(os.path.exists(self.cache_filename))
+        self.assertEqual(expected, self.compile(self.PROGRAM, "from-cache"))
+
+    def test_demos(self):
+        demos_directory = os.path.join(os.path.dirname(CPL_GRAMMAR_FILENAME), "cpl_demos")
+        for filename in sorted(os.listdir(demos_directory)):
+            if not filename.endswith(".cpl"):
+                continue
+
+            with open(os.path.join(demos_directory, filename)) as demo:
+                program = demo.read()
+
+            self.assertEqual(self.get_output(program), self.compile(program), filename)
+
+
+if __name__ == "__main__":
+    unittest.main()